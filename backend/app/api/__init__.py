@@ -2,6 +2,8 @@
 API routers
 """
 
+from .admin import router as admin_router
 from .auth import router as auth_router
+from .chat import router as chat_router
 
-__all__ = ["auth_router"]
+__all__ = ["admin_router", "auth_router", "chat_router"]
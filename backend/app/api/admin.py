@@ -0,0 +1,118 @@
+"""
+Admin API endpoints
+운영자용 API 엔드포인트 (커넥션 풀, 캐시, 스트림 등 내부 지표)
+"""
+
+from fastapi import APIRouter, Depends
+from typing import Any, Dict
+
+from ..core.database import replica_router
+from ..core.logs import logging_pipeline
+from ..core.pool_metrics import pool_telemetry
+from ..core.rate_limit import rate_limiter
+from ..services.email_filter import email_filter
+from ..services.llm_client import llm_client
+from ..services.user_cache import user_cache
+from ..utils.hashing import password_hasher
+from ..utils.security import get_bcrypt_rounds
+from ..utils.token_cache import token_cache
+from .dependencies import require_admin
+
+# Create router (every route requires X-Admin-Key)
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get(
+    "/pool",
+    summary="커넥션 풀 상태 조회",
+    description="데이터베이스 커넥션 풀의 사용량, 체크아웃 대기 시간, 타임아웃을 조회합니다.",
+    responses={
+        200: {"description": "엔진별 커넥션 풀 지표"},
+        403: {"description": "관리자 키가 올바르지 않음"},
+        404: {"description": "관리자 API 비활성화 (ADMIN_API_KEY 미설정)"},
+    },
+)
+async def pool_stats() -> Dict[str, Any]:
+    """
+    커넥션 풀 상태 조회 API 엔드포인트
+
+    DATABASE_POOL_SIZE / DATABASE_MAX_OVERFLOW 값을 조정할 때 근거가 되는
+    지표를 엔진별로 반환합니다.
+
+    **요청 헤더**:
+    - `X-Admin-Key`: ADMIN_API_KEY 값
+
+    **응답** (엔진 이름별):
+    - `in_use` / `idle` / `overflow`: 현재 사용 중, 유휴, 오버플로 커넥션 수
+    - `checkouts` / `connects` / `closes` / `invalidations`: 누적 횟수
+    - `timeouts`: pool_timeout 초과로 실패한 체크아웃 수
+    - `pre_ping_failures`: pre-ping으로 감지된 끊어진 커넥션 수
+    - `checkout_ms`: 체크아웃 대기 시간 분포 (count, mean, max, p50, p95, p99)
+
+    **에러**:
+    - 403: 관리자 키 불일치
+    - 404: ADMIN_API_KEY 미설정
+
+    **예제 요청**:
+    ```bash
+    curl -H "X-Admin-Key: $ADMIN_API_KEY" http://localhost:8000/api/v1/admin/pool
+    ```
+    """
+    return {name: telemetry.snapshot() for name, telemetry in pool_telemetry.items()}
+
+
+@router.get(
+    "/stats",
+    summary="서버 내부 상태 조회",
+    description="이 워커의 해싱 풀, 캐시, 속도 제한, 로깅, 복제본, 채팅 스트림, 커넥션 풀 지표를 조회합니다.",
+    responses={
+        200: {"description": "구성 요소별 지표"},
+        403: {"description": "관리자 키가 올바르지 않음"},
+        404: {"description": "관리자 API 비활성화 (ADMIN_API_KEY 미설정)"},
+    },
+)
+async def server_stats() -> Dict[str, Any]:
+    """
+    서버 내부 상태 조회 API 엔드포인트
+
+    공개 `/health`는 생존 여부만 반환하고, 내부 구성과 부하 상태는 이 엔드포인트에서만
+    제공합니다. 값은 응답한 워커 기준입니다.
+
+    **요청 헤더**:
+    - `X-Admin-Key`: ADMIN_API_KEY 값
+
+    **응답**:
+    - `password_hasher`: bcrypt 풀 대기열 깊이와 대기/실행 시간
+    - `bcrypt_rounds`: 현재 bcrypt work factor
+    - `token_cache` / `user_cache`: 캐시 크기와 적중률
+    - `rate_limiter`: 속도 제한 저장소 상태
+    - `email_filter`: 이메일 Bloom 필터 크기와 DB 조회 수
+    - `logging`: 로그 큐 깊이와 버린 레코드 수
+    - `read_replicas`: 복제본 상태와 복제 지연
+    - `chat_streams`: 채팅 스트림 수 (진행 중, 완료, 취소, 실패, 거절)
+    - `db_pool`: 엔진별 사용 중 커넥션과 타임아웃 수 (상세: `/pool`)
+
+    **에러**:
+    - 403: 관리자 키 불일치
+    - 404: ADMIN_API_KEY 미설정
+
+    **예제 요청**:
+    ```bash
+    curl -H "X-Admin-Key: $ADMIN_API_KEY" http://localhost:8000/api/v1/admin/stats
+    ```
+    """
+    return {
+        "password_hasher": password_hasher.stats.snapshot(),
+        "bcrypt_rounds": get_bcrypt_rounds(),
+        "token_cache": token_cache.stats(),
+        "user_cache": user_cache.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "email_filter": email_filter.stats(),
+        "logging": logging_pipeline.stats(),
+        "read_replicas": replica_router.stats(),
+        "chat_streams": llm_client.stats(),
+        "db_pool": {
+            name: {"in_use": telemetry.in_use.value, "timeouts": telemetry.timeouts.value}
+            for name, telemetry in pool_telemetry.items()
+        },
+    }
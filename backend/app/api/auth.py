@@ -3,32 +3,118 @@ Authentication API endpoints
 인증 관련 API 엔드포인트 (회원가입, 로그인, 부모-자녀 연동)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from pydantic import EmailStr
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, List, Union
 
-from ..core.database import get_db
+from ..core.database import dialect_insert, get_db, get_read_db, replica_router
 from ..core.config import settings
+from ..core.responses import model_response
 from ..models.user import User, ParentChildLink
+from ..models.statements import LINK_BY_PAIR, USER_BY_EMAIL, USER_ID_BY_EMAIL
+from ..services.user_cache import UserSnapshot
+from ..services.password_upgrade import upgrade_password_hash
+from ..services.bulk_signup import BulkSignup, BulkSignupLimitError, iter_csv_rows
+from ..services.child_links import MAX_LINKED_CHILDREN, link_children
+from ..services.email_filter import email_filter
+from ..services.refresh_tokens import (
+    RefreshTokenError,
+    issue_refresh_token,
+    refresh_token_lifetime,
+    revoke_device,
+    revoke_refresh_token,
+    rotate_refresh_token,
+)
 from ..schemas.user import (
     UserCreate,
     UserLogin,
     UserResponse,
     TokenResponse,
+    RefreshTokenRequest,
     ErrorResponse,
     ParentChildLinkCreate,
     ParentChildLinkResponse,
     ChildListResponse,
     SuccessResponse,
+    BulkSignupResponse,
+    BulkLinkRequest,
+    BulkLinkResponse,
+    EmailAvailabilityResponse,
 )
-from ..utils.security import hash_password, verify_password, create_access_token
+from ..utils.security import create_access_token, password_needs_rehash
+from ..utils.hashing import hash_password_async, verify_password_async
+from ..utils.etag import etag_matches, make_etag
 from .dependencies import get_current_user, get_current_parent
 
 # Create router
 router = APIRouter()
 
+# Signup error for an email that is already registered
+EMAIL_TAKEN_DETAIL = "Email already registered. Please use a different email or login."
+
+
+def _user_response(user: Union[User, UserSnapshot]) -> UserResponse:
+    """
+    Build a UserResponse from a trusted ORM row or snapshot without validation
+
+    Args:
+        user: User row or cached snapshot
+
+    Returns:
+        UserResponse: Response model (constructed, not re-validated)
+    """
+    return UserResponse.model_construct(
+        id=user.id,
+        email=user.email,
+        role=user.role,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
+def _token_response(user: Union[User, UserSnapshot], refresh_token: str) -> TokenResponse:
+    """
+    Build the token response returned by signup, login and refresh
+
+    Args:
+        user: Authenticated user
+        refresh_token: Refresh token issued for the user's device
+
+    Returns:
+        TokenResponse: Access token, refresh token and user info
+    """
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "role": user.role,
+        },
+        expires_delta=access_token_expires,
+    )
+
+    return TokenResponse.model_construct(
+        access_token=access_token,
+        token_type="bearer",
+        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,  # Convert to seconds
+        user=_user_response(user),
+        refresh_token=refresh_token,
+        refresh_expires_in=int(refresh_token_lifetime().total_seconds()),
+    )
+
 
 @router.post(
     "/signup",
@@ -49,24 +135,28 @@ router = APIRouter()
 )
 async def signup(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
-) -> TokenResponse:
+    db: AsyncSession = Depends(get_db),
+) -> Union[TokenResponse, Response]:
     """
     회원가입 API 엔드포인트
 
     **요청 본문**:
-    - `email`: 이메일 주소 (유효한 이메일 형식)
+    - `email`: 이메일 주소 (유효한 이메일 형식, 소문자로 저장)
     - `password`: 비밀번호 (최소 8자, 영문+숫자 조합)
     - `role`: 사용자 역할 ('parent' 또는 'child')
+    - `device_id`: 기기 식별자 (선택, 기기별 리프레시 토큰 세션)
 
     **응답**:
     - `access_token`: JWT 액세스 토큰
     - `token_type`: "bearer"
     - `expires_in`: 토큰 만료 시간 (초)
     - `user`: 사용자 정보 (id, email, role, created_at, updated_at)
+    - `refresh_token`: 리프레시 토큰 (`/refresh`로 갱신, 사용 시마다 교체)
+    - `refresh_expires_in`: 리프레시 토큰 만료 시간 (초)
 
     **에러**:
     - `400 Bad Request`: 이메일 중복 또는 유효하지 않은 입력
+      (이메일 필터가 알고 있는 가입 이메일은 비밀번호 해싱 전에 거절)
     - `422 Unprocessable Entity`: 요청 본문 유효성 검증 실패
 
     **예제 요청**:
@@ -95,70 +185,237 @@ async def signup(
     ```
     """
 
-    # Step 1: Check if email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered. Please use a different email or login.",
-        )
-
-    # Step 2: Hash password
-    hashed_password = hash_password(user_data.password)
-
-    # Step 3: Create new user
-    new_user = User(
-        email=user_data.email,
-        password_hash=hashed_password,
-        role=user_data.role,
-    )
-
-    # Step 4: Save to database
+    # Step 1: Reject a registered email before paying for bcrypt. Only possible
+    # duplicates (per the Bloom filter) are looked up; emails the filter has not
+    # seen yet are caught by ON CONFLICT in Step 3
+    if email_filter.might_exist(user_data.email):
+        if await db.scalar(USER_ID_BY_EMAIL, {"email": user_data.email}) is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=EMAIL_TAKEN_DETAIL,
+            )
+        await db.rollback()  # Release the connection while hashing
+
+    # Step 2: Hash password (off the event loop, no connection held)
+    hashed_password = await hash_password_async(user_data.password)
+
+    # Step 3: Insert the user in one round trip; a taken email inserts nothing
+    # (ON CONFLICT DO NOTHING covers concurrent signups for the same email)
     try:
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-    except IntegrityError as e:
-        db.rollback()
-        # This handles race condition if email was registered between check and insert
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered. Please use a different email.",
+        result = await db.execute(
+            dialect_insert(db, User)
+            .values(
+                email=user_data.email,
+                password_hash=hashed_password,
+                role=user_data.role,
+            )
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User.id, User.email, User.role, User.created_at, User.updated_at)
         )
+        row = result.first()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create user: {str(e)}",
         )
 
-    # Step 5: Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={
-            "sub": str(new_user.id),
-            "email": new_user.email,
-            "role": new_user.role,
+    # Step 4: Reject duplicates without any ORM refresh
+    if row is None:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=EMAIL_TAKEN_DETAIL,
+        )
+    new_user = UserSnapshot(**row._mapping)
+
+    # Step 5: Create refresh token session (commits the user in the same transaction)
+    refresh_token = await issue_refresh_token(db, new_user.id, user_data.device_id)
+    email_filter.add(new_user.email)
+    replica_router.mark_write(new_user.id)
+
+    # Step 6: Return access token, refresh token and user info
+    return model_response(
+        _token_response(new_user, refresh_token), status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.get(
+    "/email-available",
+    response_model=EmailAvailabilityResponse,
+    summary="이메일 사용 가능 여부 확인",
+    description="회원가입 전에 이메일이 이미 등록되었는지 빠르게 확인합니다.",
+    responses={
+        200: {
+            "description": "확인 결과",
+            "model": EmailAvailabilityResponse,
         },
-        expires_delta=access_token_expires,
+        422: {
+            "description": "유효하지 않은 이메일 형식",
+        },
+    },
+)
+async def email_available(
+    email: EmailStr = Query(..., description="확인할 이메일 주소"),
+    db: AsyncSession = Depends(get_db),
+) -> Union[EmailAvailabilityResponse, Response]:
+    """
+    이메일 사용 가능 여부 확인 API 엔드포인트
+
+    가입된 이메일의 Bloom 필터를 먼저 확인하므로, 등록되지 않은 이메일은
+    데이터베이스 조회나 bcrypt 없이 즉시 응답합니다. 필터가 "있을 수도 있음"이라고
+    답한 경우에만 데이터베이스를 조회합니다.
+
+    **쿼리 매개변수**:
+    - `email`: 확인할 이메일 주소 (대소문자 구분 없음)
+
+    **응답**:
+    - `email`: 정규화된(소문자) 이메일 주소
+    - `available`: 가입 가능 여부
+
+    **예제 요청**:
+    ```bash
+    curl "http://localhost:8000/api/v1/auth/email-available?email=parent@example.com"
+    ```
+
+    **예제 응답**:
+    ```json
+    {
+        "email": "parent@example.com",
+        "available": false
+    }
+    ```
+    """
+    email = email.lower()  # Stored (and filtered) lower-cased, like signup
+    available = await email_filter.is_available(db, email)
+    return model_response(
+        EmailAvailabilityResponse.model_construct(email=email, available=available)
     )
 
-    # Step 6: Convert user to response model
-    user_response = UserResponse(
-        id=new_user.id,
-        email=new_user.email,
-        role=new_user.role,
-        created_at=new_user.created_at,
-        updated_at=new_user.updated_at,
+
+@router.post(
+    "/bulk-signup",
+    response_model=BulkSignupResponse,
+    status_code=status.HTTP_200_OK,
+    summary="대량 회원가입 (JSON)",
+    description="여러 자녀 계정을 한 번에 등록하고, 연동 한도 안에서 요청한 부모 계정에 연동합니다.",
+    responses={
+        403: {
+            "description": "권한 없음 (부모만 가능)",
+            "model": ErrorResponse,
+        },
+        413: {
+            "description": "최대 행 수 초과",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def bulk_signup(
+    rows: List[Dict[str, Any]] = Body(..., description="UserCreate 형식의 행 배열"),
+    parent: UserSnapshot = Depends(get_current_parent),
+    db: AsyncSession = Depends(get_db),
+) -> Union[BulkSignupResponse, Response]:
+    """
+    대량 회원가입 API 엔드포인트 (JSON 배열)
+
+    각 행은 `UserCreate`로 검증되며 자녀(`child`) 계정만 등록할 수 있습니다
+    (`role` 생략 시 `child`). 비밀번호는 트랜잭션 밖에서 워커 풀로 병렬 해싱한 뒤,
+    사용자 생성(배치 단위 다중 행 INSERT)과 부모 연동을 하나의 트랜잭션으로
+    커밋합니다. 계정 생성 수는 연동 한도와 무관하며, 부모에게 남은 연동 자리
+    (최대 3명)만큼 앞쪽 행부터 연동됩니다(`linked`). 잘못된 행이나 중복 이메일은
+    요청 전체를 실패시키지 않고 행별 결과로 보고됩니다.
+
+    **요청 헤더**:
+    - `Authorization`: Bearer {access_token} (부모 계정)
+
+    **예제 요청**:
+    ```json
+    [
+        {"email": "student1@school.kr", "password": "welcome123"},
+        {"email": "student2@school.kr", "password": "welcome123", "role": "child"}
+    ]
+    ```
+
+    **예제 응답**:
+    ```json
+    {
+        "results": [
+            {"index": 0, "email": "student1@school.kr", "status": "created", "user_id": 10,
+             "linked": true, "error": null},
+            {"index": 1, "email": "student2@school.kr", "status": "duplicate", "user_id": null,
+             "linked": false, "error": "Email already registered"}
+        ],
+        "total": 2,
+        "created": 1,
+        "linked": 1,
+        "failed": 1
+    }
+    ```
+    """
+    if len(rows) > settings.BULK_SIGNUP_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk signup is limited to {settings.BULK_SIGNUP_MAX_ROWS} rows per request",
+        )
+
+    bulk = BulkSignup(
+        db, parent.id, settings.BULK_SIGNUP_BATCH_SIZE, settings.BULK_SIGNUP_MAX_ROWS
     )
+    for row in rows:
+        await bulk.add(row)
+    return model_response(await bulk.finish())
 
-    # Step 7: Return token and user info
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,  # Convert to seconds
-        user=user_response,
+
+@router.post(
+    "/bulk-signup/csv",
+    response_model=BulkSignupResponse,
+    status_code=status.HTTP_200_OK,
+    summary="대량 회원가입 (CSV 스트리밍)",
+    description="`email,password[,role]` 헤더를 가진 CSV 본문을 스트리밍으로 받아 자녀 계정을 등록합니다.",
+    responses={
+        403: {
+            "description": "권한 없음 (부모만 가능)",
+            "model": ErrorResponse,
+        },
+        413: {
+            "description": "최대 행 수 초과",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def bulk_signup_csv(
+    request: Request,
+    parent: UserSnapshot = Depends(get_current_parent),
+    db: AsyncSession = Depends(get_db),
+) -> Union[BulkSignupResponse, Response]:
+    """
+    대량 회원가입 API 엔드포인트 (CSV 스트리밍)
+
+    요청 본문(`Content-Type: text/csv`)을 스트리밍으로 읽으면서 배치 단위로 처리하므로
+    업로드 전체를 메모리에 올리지 않습니다. 따옴표로 감싼 필드에는 줄바꿈이 들어갈 수
+    있습니다. 처리 방식과 응답은 JSON 버전과 같으며 (자녀 계정만, 한도 안에서 부모에 연동),
+    모든 배치는 하나의 트랜잭션으로 커밋됩니다.
+
+    **예제 요청**:
+    ```bash
+    curl -X POST http://localhost:8000/api/v1/auth/bulk-signup/csv \
+      -H "Authorization: Bearer {token}" -H "Content-Type: text/csv" \
+      --data-binary @students.csv
+    ```
+    """
+    bulk = BulkSignup(
+        db, parent.id, settings.BULK_SIGNUP_BATCH_SIZE, settings.BULK_SIGNUP_MAX_ROWS
     )
+    try:
+        async for row in iter_csv_rows(request.stream()):
+            await bulk.add(row)
+    except BulkSignupLimitError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+    return model_response(await bulk.finish())
 
 
 @router.post(
@@ -180,20 +437,27 @@ async def signup(
 )
 async def login(
     credentials: UserLogin,
-    db: Session = Depends(get_db),
-) -> TokenResponse:
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+) -> Union[TokenResponse, Response]:
     """
     로그인 API 엔드포인트
 
+    저장된 bcrypt 해시의 작업 계수가 현재 설정보다 낮으면
+    응답 후 백그라운드에서 현재 작업 계수로 재해싱합니다.
+
     **요청 본문**:
-    - `email`: 이메일 주소
+    - `email`: 이메일 주소 (대소문자 구분 없음)
     - `password`: 비밀번호
+    - `device_id`: 기기 식별자 (선택, 기기별 리프레시 토큰 세션)
 
     **응답**:
     - `access_token`: JWT 액세스 토큰
     - `token_type`: "bearer"
     - `expires_in`: 토큰 만료 시간 (초)
     - `user`: 사용자 정보 (id, email, role, created_at, updated_at)
+    - `refresh_token`: 리프레시 토큰 (`/refresh`로 갱신, 사용 시마다 교체)
+    - `refresh_expires_in`: 리프레시 토큰 만료 시간 (초)
 
     **에러**:
     - `401 Unauthorized`: 이메일 또는 비밀번호 오류
@@ -224,11 +488,17 @@ async def login(
     ```
     """
 
-    # Step 1: Find user by email
-    user = db.query(User).filter(User.email == credentials.email).first()
+    # Step 1: Find user by email (UserLogin lower-cases it, as signup stores it)
+    result = await db.execute(USER_BY_EMAIL, {"email": credentials.email})
+    user = result.scalar_one_or_none()
+
+    # Release the connection back to the pool while bcrypt runs
+    await db.close()
 
-    # Step 2: Verify user exists and password is correct
-    if not user or not verify_password(credentials.password, user.password_hash):
+    # Step 2: Verify user exists and password is correct (off the event loop)
+    if not user or not await verify_password_async(
+        credentials.password, user.password_hash
+    ):
         # Use generic error message to prevent user enumeration
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -236,32 +506,132 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Step 3: Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={
-            "sub": str(user.id),
-            "email": user.email,
-            "role": user.role,
+    # Step 3: Upgrade outdated bcrypt hashes after the response is sent
+    if password_needs_rehash(user.password_hash):
+        background_tasks.add_task(
+            upgrade_password_hash, user.id, credentials.password, user.password_hash
+        )
+
+    # Step 4: Create refresh token session for this device
+    refresh_token = await issue_refresh_token(db, user.id, credentials.device_id)
+
+    # Step 5: Return access token, refresh token and user info
+    return model_response(_token_response(user, refresh_token))
+
+
+@router.post(
+    "/refresh",
+    response_model=TokenResponse,
+    status_code=status.HTTP_200_OK,
+    summary="토큰 갱신",
+    description="리프레시 토큰으로 비밀번호 확인 없이 새 액세스 토큰을 발급받습니다.",
+    responses={
+        200: {
+            "description": "토큰 갱신 성공",
+            "model": TokenResponse,
         },
-        expires_delta=access_token_expires,
-    )
+        401: {
+            "description": "유효하지 않거나 만료/폐기된 리프레시 토큰",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def refresh(
+    request_data: RefreshTokenRequest,
+    db: AsyncSession = Depends(get_db),
+) -> Union[TokenResponse, Response]:
+    """
+    토큰 갱신 API 엔드포인트
 
-    # Step 4: Convert user to response model
-    user_response = UserResponse(
-        id=user.id,
-        email=user.email,
-        role=user.role,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
+    bcrypt 검증 없이 리프레시 토큰 조회(인덱스 1회)와 HMAC만으로 새 토큰을 발급합니다.
+    리프레시 토큰은 매번 교체(rotation)되며 만료 시각도 연장됩니다(sliding session).
+    이미 교체된 토큰을 재사용하면 해당 기기 세션 전체가 폐기됩니다.
+
+    **요청 본문**:
+    - `refresh_token`: 로그인/회원가입/갱신 시 발급받은 리프레시 토큰
+
+    **응답**:
+    - 로그인 응답과 동일 (`access_token`, `refresh_token` 등)
+
+    **에러**:
+    - `401 Unauthorized`: 유효하지 않음, 만료, 폐기, 재사용 감지
+    """
+    try:
+        user, refresh_token = await rotate_refresh_token(db, request_data.refresh_token)
+    except RefreshTokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return model_response(_token_response(user, refresh_token))
+
+
+@router.post(
+    "/logout",
+    response_model=SuccessResponse,
+    summary="로그아웃",
+    description="리프레시 토큰이 속한 기기 세션을 폐기합니다.",
+)
+async def logout(
+    request_data: RefreshTokenRequest,
+    db: AsyncSession = Depends(get_db),
+) -> SuccessResponse:
+    """
+    로그아웃 API 엔드포인트
+
+    **요청 본문**:
+    - `refresh_token`: 폐기할 리프레시 토큰
+
+    **응답**:
+    - `message`: 성공 메시지 (이미 폐기된 토큰이어도 성공으로 응답)
+    """
+    revoked = await revoke_refresh_token(db, request_data.refresh_token)
+    return SuccessResponse(
+        message="Logged out successfully",
+        data={"revoked": revoked},
     )
 
-    # Step 5: Return token and user info
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,  # Convert to seconds
-        user=user_response,
+
+@router.delete(
+    "/sessions/{device_id}",
+    response_model=SuccessResponse,
+    summary="기기 세션 폐기",
+    description="현재 사용자의 특정 기기 리프레시 토큰을 폐기합니다.",
+    responses={
+        404: {
+            "description": "활성 세션을 찾을 수 없음",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def revoke_session(
+    device_id: str,
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> SuccessResponse:
+    """
+    기기 세션 폐기 API 엔드포인트
+
+    **요청 헤더**:
+    - `Authorization`: Bearer {access_token}
+
+    **경로 매개변수**:
+    - `device_id`: 폐기할 기기 식별자
+
+    **에러**:
+    - `404 Not Found`: 해당 기기의 활성 세션 없음
+    """
+    if not await revoke_device(db, current_user.id, device_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No active session found for device {device_id}",
+        )
+
+    return SuccessResponse(
+        message="Device session revoked",
+        data={"device_id": device_id},
     )
 
 
@@ -282,8 +652,8 @@ async def login(
     },
 )
 async def get_me(
-    current_user: User = Depends(get_current_user),
-) -> UserResponse:
+    current_user: UserSnapshot = Depends(get_current_user),
+) -> Union[UserResponse, Response]:
     """
     내 정보 조회 API 엔드포인트
 
@@ -320,13 +690,7 @@ async def get_me(
     }
     ```
     """
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        role=current_user.role,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-    )
+    return model_response(_user_response(current_user))
 
 
 @router.post(
@@ -356,9 +720,9 @@ async def get_me(
 )
 async def link_child(
     link_data: ParentChildLinkCreate,
-    parent: User = Depends(get_current_parent),
-    db: Session = Depends(get_db),
-) -> ParentChildLinkResponse:
+    parent: UserSnapshot = Depends(get_current_parent),
+    db: AsyncSession = Depends(get_db),
+) -> Union[ParentChildLinkResponse, Response]:
     """
     부모-자녀 계정 연동 API 엔드포인트
 
@@ -400,86 +764,122 @@ async def link_child(
     ```
     """
 
-    # Step 1: Validate not linking to self
-    if parent.id == link_data.child_id:
+    # Step 1: Create the link with one conditional insert
+    # (limit, role and duplicate checks are enforced atomically in the database)
+    try:
+        result = (await link_children(db, parent.id, [link_data.child_id])).results[0]
+    except Exception as e:
+        await db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot link to yourself",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create link: {str(e)}",
         )
 
-    # Step 2: Check if child exists
-    child = db.query(User).filter(User.id == link_data.child_id).first()
-    if not child:
+    # Step 2: Map a rejected item to the matching error
+    if result.status != "linked":
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child user with ID {link_data.child_id} not found",
+            status_code=(
+                status.HTTP_404_NOT_FOUND
+                if result.status == "not_found"
+                else status.HTTP_400_BAD_REQUEST
+            ),
+            detail=result.error,
         )
+    replica_router.mark_write(parent.id)
+
+    # Step 3: Return link response
+    return model_response(
+        ParentChildLinkResponse.model_construct(
+            id=result.link_id,
+            parent_id=parent.id,
+            child_id=result.child_id,
+            linked_at=result.linked_at,
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
 
-    # Step 3: Validate child role
-    if child.role != "child":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"User {link_data.child_id} is not a child account. Only child accounts can be linked.",
-        )
 
-    # Step 4: Check existing links count (max 3)
-    existing_links_count = (
-        db.query(ParentChildLink)
-        .filter(ParentChildLink.parent_id == parent.id)
-        .count()
-    )
-    if existing_links_count >= 3:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Maximum of 3 children can be linked. Please unlink a child before adding a new one.",
-        )
+@router.post(
+    "/link-children",
+    response_model=BulkLinkResponse,
+    summary="자녀 계정 일괄 연동",
+    description=f"여러 자녀 계정을 한 번에 연동합니다. (최대 {MAX_LINKED_CHILDREN}명)",
+    responses={
+        200: {
+            "description": "항목별 연동 결과",
+            "model": BulkLinkResponse,
+        },
+        403: {
+            "description": "권한 없음 (부모만 가능)",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def link_children_bulk(
+    link_data: BulkLinkRequest,
+    parent: UserSnapshot = Depends(get_current_parent),
+    db: AsyncSession = Depends(get_db),
+) -> Union[BulkLinkResponse, Response]:
+    """
+    부모-자녀 계정 일괄 연동 API 엔드포인트
 
-    # Step 5: Check for duplicate link
-    existing_link = (
-        db.query(ParentChildLink)
-        .filter(
-            ParentChildLink.parent_id == parent.id,
-            ParentChildLink.child_id == link_data.child_id,
-        )
-        .first()
-    )
-    if existing_link:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Child {link_data.child_id} is already linked to your account",
-        )
+    부모 사용자만 호출 가능하며, 여러 자녀 계정을 하나의 트랜잭션으로 연동합니다.
+    자녀 조회는 단일 `IN` 쿼리로, 연동 생성은 단일 INSERT 문으로 처리합니다.
+    최대 연동 수를 넘는 항목은 요청 순서상 뒤쪽부터 거절됩니다.
 
-    # Step 6: Create link
-    new_link = ParentChildLink(
-        parent_id=parent.id,
-        child_id=link_data.child_id,
-    )
+    **요청 헤더**:
+    - `Authorization`: Bearer {access_token} (부모 계정)
+
+    **요청 본문**:
+    - `child_ids`: 연동할 자녀 사용자 ID 배열 (우선순위 순서)
+
+    **응답**:
+    - `results`: 항목별 결과 (`linked`, `duplicate`, `invalid`, `not_found`, `limit_exceeded`)
+    - `total`: 요청 항목 수
+    - `linked`: 연동된 자녀 수
+    - `failed`: 연동되지 않은 항목 수
+
+    **에러**:
+    - `403 Forbidden`: 부모 권한 없음
+    - `422 Unprocessable Entity`: 요청 형식 오류
+
+    **예제 요청**:
+    ```json
+    {
+        "child_ids": [2, 3, 99]
+    }
+    ```
+
+    **예제 응답**:
+    ```json
+    {
+        "results": [
+            {"index": 0, "child_id": 2, "status": "linked", "link_id": 1,
+             "linked_at": "2025-12-22T10:30:00", "error": null},
+            {"index": 1, "child_id": 3, "status": "duplicate", "link_id": null,
+             "linked_at": null, "error": "Child 3 is already linked to your account"},
+            {"index": 2, "child_id": 99, "status": "not_found", "link_id": null,
+             "linked_at": null, "error": "Child user with ID 99 not found"}
+        ],
+        "total": 3,
+        "linked": 1,
+        "failed": 2
+    }
+    ```
+    """
 
-    # Step 7: Save to database
     try:
-        db.add(new_link)
-        db.commit()
-        db.refresh(new_link)
-    except IntegrityError as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to create link. The child may already be linked.",
-        )
+        result = await link_children(db, parent.id, link_data.child_ids)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create link: {str(e)}",
+            detail=f"Failed to create links: {str(e)}",
         )
+    if result.linked:
+        replica_router.mark_write(parent.id)
 
-    # Step 8: Return link response
-    return ParentChildLinkResponse(
-        id=new_link.id,
-        parent_id=new_link.parent_id,
-        child_id=new_link.child_id,
-        linked_at=new_link.linked_at,
-    )
+    return model_response(result)
 
 
 @router.get(
@@ -492,6 +892,9 @@ async def link_child(
             "description": "자녀 목록 조회 성공",
             "model": ChildListResponse,
         },
+        304: {
+            "description": "변경 없음 (If-None-Match 일치)",
+        },
         403: {
             "description": "권한 없음 (부모만 가능)",
             "model": ErrorResponse,
@@ -499,9 +902,11 @@ async def link_child(
     },
 )
 async def get_children(
-    parent: User = Depends(get_current_parent),
-    db: Session = Depends(get_db),
-) -> ChildListResponse:
+    request: Request,
+    response: Response,
+    parent: UserSnapshot = Depends(get_current_parent),
+    db: AsyncSession = Depends(get_read_db),
+) -> Union[ChildListResponse, Response]:
     """
     연동된 자녀 목록 조회 API 엔드포인트
 
@@ -509,9 +914,11 @@ async def get_children(
 
     **요청 헤더**:
     - `Authorization`: Bearer {access_token} (부모 계정)
+    - `If-None-Match`: 이전 응답의 ETag (선택, 변경이 없으면 `304 Not Modified`)
 
     **응답**:
-    - `children`: 자녀 사용자 정보 배열
+    - `ETag` 헤더: 자녀 목록 버전 (연동 시각/수정 시각 기반)
+    - `children`: 자녀 사용자 정보 배열 (연동 순서)
     - `total`: 연동된 자녀 수
     - `max_allowed`: 최대 연동 가능 수 (3)
 
@@ -546,36 +953,50 @@ async def get_children(
     ```
     """
 
-    # Step 1: Query all links for this parent
-    links = (
-        db.query(ParentChildLink)
-        .filter(ParentChildLink.parent_id == parent.id)
-        .all()
-    )
-
-    # Step 2: Get child IDs
-    child_ids = [link.child_id for link in links]
-
-    # Step 3: Query child users
-    children = db.query(User).filter(User.id.in_(child_ids)).all() if child_ids else []
-
-    # Step 4: Convert to response models
-    children_responses = [
-        UserResponse(
-            id=child.id,
-            email=child.email,
-            role=child.role,
-            created_at=child.created_at,
-            updated_at=child.updated_at,
+    # Step 1: Load linked children with one joined query (needed columns only)
+    rows = (
+        await db.execute(
+            select(
+                User.id,
+                User.email,
+                User.role,
+                User.created_at,
+                User.updated_at,
+                ParentChildLink.linked_at,
+            )
+            .join(ParentChildLink, ParentChildLink.child_id == User.id)
+            .where(ParentChildLink.parent_id == parent.id)
+            .order_by(ParentChildLink.linked_at, User.id)
         )
-        for child in children
-    ]
-
-    # Step 5: Return response
-    return ChildListResponse(
-        children=children_responses,
-        total=len(children_responses),
-        max_allowed=3,
+    ).all()
+
+    # Step 2: Derive a strong ETag from the IDs and latest timestamps
+    etag = make_etag(
+        [
+            parent.id,
+            [row.id for row in rows],
+            max((row.linked_at for row in rows), default=None),
+            max((row.updated_at for row in rows if row.updated_at), default=None),
+        ]
+    )
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    # Step 3: Answer 304 without building the list if the client copy is current
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Step 4: Convert rows straight to response models
+    children_responses = [_user_response(row) for row in rows]
+
+    # Step 5: Return response (headers set once on the injected response)
+    response.headers.update(headers)
+    return model_response(
+        ChildListResponse.model_construct(
+            children=children_responses,
+            total=len(children_responses),
+            max_allowed=MAX_LINKED_CHILDREN,
+        ),
+        response=response,
     )
 
 
@@ -601,8 +1022,8 @@ async def get_children(
 )
 async def unlink_child(
     child_id: int,
-    parent: User = Depends(get_current_parent),
-    db: Session = Depends(get_db),
+    parent: UserSnapshot = Depends(get_current_parent),
+    db: AsyncSession = Depends(get_db),
 ) -> SuccessResponse:
     """
     부모-자녀 연동 해제 API 엔드포인트
@@ -641,14 +1062,7 @@ async def unlink_child(
     """
 
     # Step 1: Find the link
-    link = (
-        db.query(ParentChildLink)
-        .filter(
-            ParentChildLink.parent_id == parent.id,
-            ParentChildLink.child_id == child_id,
-        )
-        .first()
-    )
+    link = await db.scalar(LINK_BY_PAIR, {"parent_id": parent.id, "child_id": child_id})
 
     # Step 2: Check if link exists
     if not link:
@@ -659,14 +1073,15 @@ async def unlink_child(
 
     # Step 3: Delete the link
     try:
-        db.delete(link)
-        db.commit()
+        await db.delete(link)
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to unlink child: {str(e)}",
         )
+    replica_router.mark_write(parent.id)
 
     # Step 4: Return success response
     return SuccessResponse(
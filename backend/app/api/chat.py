@@ -0,0 +1,179 @@
+"""
+Chat API endpoints
+AI 채팅 API 엔드포인트 (Server-Sent Events 스트리밍)
+"""
+
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from ..core.config import settings
+from ..schemas.chat import ChatRequest
+from ..schemas.user import ErrorResponse
+from ..services.llm_client import (
+    ChatStream,
+    LLMBusyError,
+    LLMError,
+    LLMNotConfiguredError,
+    llm_client,
+)
+from ..services.user_cache import UserSnapshot
+from .dependencies import get_current_user
+
+# Create router
+router = APIRouter()
+
+# Keep proxies (nginx) from buffering the stream and caches from storing it
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(data: Dict[str, Any], event: Optional[str] = None) -> bytes:
+    """
+    Encode one Server-Sent Event
+
+    Args:
+        data: JSON payload
+        event: Event name (None = the default "message" event)
+
+    Returns:
+        bytes: Event including the terminating blank line
+    """
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n".encode()
+
+
+async def relay(stream: ChatStream) -> AsyncIterator[bytes]:
+    """
+    Forward model text as SSE events, ending with a `done` or `error` event
+
+    The next upstream chunk is read only after the previous event was handed
+    to the server, so a slow client slows the upstream read (backpressure).
+    When the client disconnects, Starlette cancels this generator and the
+    upstream connection is closed, which stops generation.
+
+    Args:
+        stream: Open model stream (closed here and by the response's
+            background task, whichever runs first)
+
+    Yields:
+        bytes: Encoded SSE events
+    """
+    try:
+        async for text in stream:
+            yield sse_event({"content": text})
+        yield sse_event({"finish_reason": stream.finish_reason or "stop"}, event="done")
+    except LLMError as e:
+        yield sse_event({"detail": str(e)}, event="error")
+    finally:
+        # Runs inside Starlette's cancelled scope on disconnect; shield the close
+        with anyio.CancelScope(shield=True):
+            await stream.aclose()
+
+
+@router.post(
+    "",
+    response_class=StreamingResponse,
+    summary="AI 채팅 (스트리밍)",
+    description="대화 내용을 보내면 모델의 답변을 생성되는 대로 Server-Sent Events로 전송합니다.",
+    responses={
+        200: {
+            "description": "SSE 스트림 (텍스트 조각 이벤트 후 `done` 또는 `error` 이벤트로 종료)",
+            "content": {"text/event-stream": {}},
+        },
+        401: {
+            "description": "인증 실패",
+            "model": ErrorResponse,
+        },
+        502: {
+            "description": "모델 서버 연결 실패 또는 오류 응답",
+            "model": ErrorResponse,
+        },
+        503: {
+            "description": "채팅 모델 미설정 또는 동시 스트림 한도 초과",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def chat(
+    chat_request: ChatRequest,
+    current_user: UserSnapshot = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    AI 채팅 API 엔드포인트 (스트리밍)
+
+    모델이 토큰을 생성하는 즉시 클라이언트로 전송하므로, 전체 답변이 끝날 때까지
+    기다리지 않고 첫 글자를 바로 표시할 수 있습니다. 클라이언트가 연결을 끊으면
+    모델 서버 요청도 즉시 취소됩니다.
+
+    **요청 헤더**:
+    - `Authorization`: Bearer {access_token}
+
+    **요청 본문**:
+    - `messages`: 지금까지의 대화 (오래된 순, 마지막은 사용자 메시지)
+      - `role`: 'user' 또는 'assistant'
+      - `content`: 메시지 내용 (최대 4000자)
+
+    **응답** (`text/event-stream`):
+    - `data: {"content": "..."}`: 답변 텍스트 조각 (순서대로 이어 붙임)
+    - `event: done` / `data: {"finish_reason": "stop"}`: 답변 완료
+      (`length`: CHAT_MAX_TOKENS 도달)
+    - `event: error` / `data: {"detail": "..."}`: 스트리밍 중 모델 오류
+
+    **에러** (스트림 시작 전):
+    - `401 Unauthorized`: 유효하지 않은 토큰
+    - `422 Unprocessable Entity`: 요청 본문 유효성 검증 실패
+    - `502 Bad Gateway`: 모델 서버 연결 실패 또는 오류 응답
+    - `503 Service Unavailable`: 모델 미설정, 또는 이 워커의 동시 스트림 수가
+      CHAT_MAX_STREAMS에 도달 (`Retry-After` 후 재시도)
+
+    **예제 요청**:
+    ```bash
+    curl -N -X POST http://localhost:8000/api/v1/chat \\
+      -H "Authorization: Bearer $TOKEN" -H "Content-Type: application/json" \\
+      -d '{"messages": [{"role": "user", "content": "광합성이 뭐야?"}]}'
+    ```
+
+    **예제 응답**:
+    ```
+    data: {"content": "광합성은 "}
+
+    data: {"content": "식물이 빛을 이용해 "}
+
+    event: done
+    data: {"finish_reason": "stop"}
+    ```
+    """
+
+    # Step 1: Prepend the server's system prompt (clients cannot send one)
+    messages = [{"role": "system", "content": settings.CHAT_SYSTEM_PROMPT}]
+    messages.extend(message.model_dump() for message in chat_request.messages)
+
+    # Step 2: Open the model stream; failures here are still plain HTTP errors
+    try:
+        stream = await llm_client.open_stream(messages)
+    except LLMBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many chat streams in progress. Please try again shortly.",
+            headers={"Retry-After": "1"},
+        )
+    except LLMNotConfiguredError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chat is not available",
+        )
+    except LLMError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+
+    # Step 3: Relay text as it arrives; the background task closes the
+    # upstream even if the client left before the first event was sent
+    return StreamingResponse(
+        relay(stream),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+        background=BackgroundTask(stream.aclose),
+    )
@@ -3,40 +3,56 @@ API dependencies for authentication and authorization
 인증 및 권한 확인을 위한 FastAPI 의존성
 """
 
-from fastapi import Depends, HTTPException, status
+import secrets
+
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from ..core.database import get_db
-from ..models.user import User
-from ..utils.security import decode_access_token
+from ..core.config import settings
+from ..core.database import get_read_db, replica_router
+from ..core.replicas import retry_on_primary, use_primary_for
+from ..models.statements import USER_BY_ID
+from ..services.user_cache import UserSnapshot, user_cache
+from ..utils.token_cache import decode_access_token_cached
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
 
+async def _load_user(user_id: int, db: AsyncSession) -> Optional[UserSnapshot]:
+    if settings.USER_CACHE_ENABLED:
+        return await user_cache.get_or_load(user_id, db)
+    db_user = (await db.execute(USER_BY_ID, {"user_id": user_id})).scalar_one_or_none()
+    return UserSnapshot.from_user(db_user) if db_user is not None else None
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+    db: AsyncSession = Depends(get_read_db),
+) -> UserSnapshot:
     """
     Get current authenticated user from JWT token
 
     This dependency function extracts and validates the JWT token from the
-    Authorization header, then retrieves the corresponding user from the database.
+    Authorization header, then retrieves the corresponding user from the user
+    cache, falling back to the database on miss (or always, when
+    USER_CACHE_ENABLED is False). The lookup runs on a read replica when
+    one is configured, unless the user wrote within REPLICA_STICKY_SECONDS;
+    a user the replica does not have yet is looked up again on the primary.
 
     Usage:
         @app.get("/protected")
-        async def protected_route(current_user: User = Depends(get_current_user)):
+        async def protected_route(current_user: UserSnapshot = Depends(get_current_user)):
             return {"user_id": current_user.id}
 
     Args:
         credentials: HTTP Bearer credentials from Authorization header
-        db: Database session
+        db: Async read session (shared with the endpoint if it also uses get_read_db)
 
     Returns:
-        User: Authenticated user object
+        UserSnapshot: Authenticated user (read-only snapshot)
 
     Raises:
         HTTPException 401: If token is invalid or user not found
@@ -44,8 +60,8 @@ async def get_current_user(
     # Extract token from credentials
     token = credentials.credentials
 
-    # Decode and validate token
-    payload = decode_access_token(token)
+    # Decode and validate token (signature is verified once per cached token)
+    payload = decode_access_token_cached(token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,8 +88,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Retrieve user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Read your own writes: a user who just wrote reads from the primary
+    use_primary_for(db, replica_router, user_id)
+
+    # Retrieve user from cache or database
+    user = await _load_user(user_id, db)
+    if user is None and retry_on_primary(db):
+        # Not replicated yet (e.g. signed up through another worker)
+        user = await _load_user(user_id, db)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -85,8 +107,8 @@ async def get_current_user(
 
 
 async def get_current_parent(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: UserSnapshot = Depends(get_current_user),
+) -> UserSnapshot:
     """
     Get current authenticated user, ensuring they are a parent
 
@@ -94,14 +116,14 @@ async def get_current_parent(
 
     Usage:
         @app.post("/parent-only")
-        async def parent_only_route(parent: User = Depends(get_current_parent)):
+        async def parent_only_route(parent: UserSnapshot = Depends(get_current_parent)):
             return {"parent_id": parent.id}
 
     Args:
         current_user: Current authenticated user
 
     Returns:
-        User: Authenticated parent user
+        UserSnapshot: Authenticated parent user
 
     Raises:
         HTTPException 403: If user is not a parent
@@ -115,21 +137,21 @@ async def get_current_parent(
 
 
 async def get_current_child(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: UserSnapshot = Depends(get_current_user),
+) -> UserSnapshot:
     """
     Get current authenticated user, ensuring they are a child
 
     Usage:
         @app.get("/child-only")
-        async def child_only_route(child: User = Depends(get_current_child)):
+        async def child_only_route(child: UserSnapshot = Depends(get_current_child)):
             return {"child_id": child.id}
 
     Args:
         current_user: Current authenticated user
 
     Returns:
-        User: Authenticated child user
+        UserSnapshot: Authenticated child user
 
     Raises:
         HTTPException 403: If user is not a child
@@ -140,3 +162,35 @@ async def get_current_child(
             detail="This action requires child role",
         )
     return current_user
+
+
+async def require_admin(
+    x_admin_key: Optional[str] = Header(default=None),
+) -> None:
+    """
+    Allow the request only when X-Admin-Key matches ADMIN_API_KEY
+
+    Admin endpoints are hidden (404) while ADMIN_API_KEY is unset, so they
+    are opt-in per deployment.
+
+    Usage:
+        @router.get("/pool", dependencies=[Depends(require_admin)])
+        async def pool_stats():
+            ...
+
+    Args:
+        x_admin_key: Value of the X-Admin-Key header
+
+    Raises:
+        HTTPException 404: If admin endpoints are disabled
+        HTTPException 403: If the key is missing or wrong
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_admin_key is None or not secrets.compare_digest(
+        x_admin_key.encode(), settings.ADMIN_API_KEY.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin key",
+        )
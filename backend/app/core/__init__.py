@@ -2,7 +2,28 @@
 Core module for database and configuration
 """
 
-from .database import Base, engine, SessionLocal, get_db
+from .database import (
+    Base,
+    engine,
+    SessionLocal,
+    async_engine,
+    AsyncSessionLocal,
+    get_db,
+    get_read_db,
+    get_sync_db,
+    replica_router,
+)
 from .config import settings
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db", "settings"]
+__all__ = [
+    "Base",
+    "engine",
+    "SessionLocal",
+    "async_engine",
+    "AsyncSessionLocal",
+    "get_db",
+    "get_read_db",
+    "get_sync_db",
+    "replica_router",
+    "settings",
+]
@@ -0,0 +1,168 @@
+"""
+Cache primitives
+프로세스 내 LRU 캐시와 공유 캐시 백엔드 인터페이스
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache with per-entry TTL
+
+    Usage:
+        cache = LRUCache(max_size=1000, ttl_seconds=30)
+        cache.set("key", value)
+        value = cache.get("key")
+
+    Args:
+        max_size: Maximum number of entries
+        ttl_seconds: Default time-to-live for entries
+        clock: Time source (monotonic by default; overridable for tests)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry"""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entry if full
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Time-to-live (default: the cache's ttl_seconds)
+            expires_at: Absolute expiry on the cache's clock (overrides ttl_seconds)
+        """
+        if expires_at is None:
+            ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+            expires_at = self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove an entry if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters
+
+        Returns:
+            dict: size, hits, misses and hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class CacheBackend(ABC):
+    """
+    Shared (cross-worker) cache backend interface
+
+    Values are strings so that network stores such as Redis or Memcached can
+    implement this interface directly.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the stored value or None"""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """Store a value with a time-to-live"""
+
+    @abstractmethod
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Remove the given keys"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all keys"""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Local stand-in for a shared cache backend
+
+    Behaves like a network store (string values, TTLs) but lives in the
+    current process. Useful for development, tests and single-worker
+    deployments.
+
+    Args:
+        max_size: Maximum number of entries
+    """
+
+    def __init__(self, max_size: int = 100000):
+        self._cache = LRUCache(max_size=max_size)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._cache.delete(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
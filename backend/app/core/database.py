@@ -4,47 +4,231 @@ SQLAlchemy 2.0 기반 데이터베이스 설정
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import NullPool, StaticPool
+from pathlib import Path
+from typing import Any, AsyncGenerator, Generator, Optional
 from .config import settings
+from .instrumentation import instrument_query_timing
+from .pool_metrics import instrument_engine
+from .replicas import READ_ONLY, Replica, ReplicaRouter, RoutingSession, split_urls
 
-# Create database engine with appropriate settings for the database type
-engine_kwargs = {
-    "echo": settings.DEBUG,  # Log SQL statements in debug mode
+# Alembic configuration (backend/alembic.ini, migrations in backend/migrations)
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# Schemas create_all produced before migrations existed, newest first:
+# (table that version introduced, revision matching it)
+BASELINE_REVISIONS = (
+    ("refresh_tokens", "0002"),
+    ("users", "0001"),
+)
+
+# Async drivers used for each database backend
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
 }
 
-# SQLite doesn't support pool_size and max_overflow
-if settings.DATABASE_URL.startswith("sqlite"):
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
-else:
-    engine_kwargs["pool_pre_ping"] = True  # Enable connection health checks
-    engine_kwargs["pool_size"] = settings.DATABASE_POOL_SIZE
-    engine_kwargs["max_overflow"] = settings.DATABASE_MAX_OVERFLOW
 
-# Create database engine
-engine = create_engine(settings.DATABASE_URL, **engine_kwargs)
+def get_async_database_url(url: str) -> str:
+    """
+    Convert a database URL to its async driver equivalent
+
+    Examples:
+        >>> get_async_database_url("postgresql://u:p@localhost/db")
+        'postgresql+asyncpg://u:p@localhost/db'
+        >>> get_async_database_url("sqlite:///./app.db")
+        'sqlite+aiosqlite:///./app.db'
+
+    Args:
+        url: Database URL from settings (sync or async form)
+
+    Returns:
+        str: URL using asyncpg (PostgreSQL) or aiosqlite (SQLite)
+    """
+    scheme, sep, rest = url.partition("://")
+    backend = scheme.split("+", 1)[0]
+    if backend in ASYNC_DRIVERS:
+        return f"{ASYNC_DRIVERS[backend]}{sep}{rest}"
+    return url
+
+
+def get_sync_database_url(url: str) -> str:
+    """
+    Strip an explicit driver from a database URL so the default sync driver is used
+
+    Args:
+        url: Database URL from settings
+
+    Returns:
+        str: URL usable with create_engine
+    """
+    scheme, sep, rest = url.partition("://")
+    backend = scheme.split("+", 1)[0]
+    if ASYNC_DRIVERS.get(backend) == scheme:
+        return f"{backend}{sep}{rest}"
+    return url
+
+
+def build_engine_kwargs(url: str, is_async: bool = False) -> dict:
+    """
+    Build engine options appropriate for the database type
+
+    Args:
+        url: Database URL
+        is_async: Whether the options are for an AsyncEngine
+
+    Returns:
+        dict: Keyword arguments for create_engine/create_async_engine
+    """
+    # No "echo": it writes every statement synchronously. SQL_ECHO enables the
+    # sqlalchemy.engine logger, which goes through the logging queue instead
+    engine_kwargs = {}
+
+    # SQLite doesn't support pool_size and max_overflow
+    if url.startswith("sqlite"):
+        in_memory = ":memory:" in url or url.rstrip("/").endswith("sqlite:")
+        if not is_async:
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+        elif in_memory:
+            engine_kwargs["poolclass"] = StaticPool
+        else:
+            # aiosqlite connections are bound to the event loop that opened
+            # them and are cheap to create, so don't keep them pooled
+            engine_kwargs["poolclass"] = NullPool
+    else:
+        engine_kwargs["pool_pre_ping"] = True  # Enable connection health checks
+        engine_kwargs["pool_size"] = settings.DATABASE_POOL_SIZE
+        engine_kwargs["max_overflow"] = settings.DATABASE_MAX_OVERFLOW
+        if url.startswith("postgresql+asyncpg"):
+            # Statements asyncpg keeps prepared (parsed and planned) per connection
+            engine_kwargs["connect_args"] = {
+                "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE
+            }
+
+    return engine_kwargs
 
-# Create session factory
+
+# Create sync database engine (init scripts, migrations, test fixtures)
+SYNC_DATABASE_URL = get_sync_database_url(settings.DATABASE_URL)
+engine = create_engine(SYNC_DATABASE_URL, **build_engine_kwargs(SYNC_DATABASE_URL))
+
+# Create sync session factory
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
 )
 
+# Create async database engine (API request handling)
+ASYNC_DATABASE_URL = get_async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    **build_engine_kwargs(ASYNC_DATABASE_URL, is_async=True),
+)
+
+# Checkout latency, pool occupancy and connection churn (GET /api/v1/admin/pool)
+instrument_engine(async_engine, "primary")
+instrument_query_timing(async_engine)
+
+# Read replicas (optional): read-only dependencies use them via get_read_db
+replica_engines = []
+for index, replica_url in enumerate(split_urls(settings.DATABASE_REPLICA_URLS)):
+    async_replica_url = get_async_database_url(replica_url)
+    replica_engine = create_async_engine(
+        async_replica_url,
+        **build_engine_kwargs(async_replica_url, is_async=True),
+    )
+    instrument_engine(replica_engine, f"replica{index}")
+    instrument_query_timing(replica_engine)
+    replica_engines.append(Replica(f"replica{index}", replica_engine))
+
+replica_router = ReplicaRouter(
+    replica_engines,
+    max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+    sticky_seconds=settings.REPLICA_STICKY_SECONDS,
+)
+
+# Create async session factory
+# expire_on_commit=False keeps loaded attributes usable after commit without
+# triggering implicit (and, in async code, illegal) lazy loads
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create base class for models
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+def dialect_insert(db: AsyncSession, table: Any):
+    """
+    Build an INSERT that supports ON CONFLICT for the session's database
+
+    Usage:
+        stmt = dialect_insert(db, User).values(rows).on_conflict_do_nothing(
+            index_elements=["email"]
+        )
+
+    Args:
+        db: Async database session (used to detect the dialect)
+        table: Mapped class or Table to insert into
+
+    Returns:
+        Insert: PostgreSQL or SQLite dialect-specific insert construct
     """
-    Dependency function to get database session
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get async database session
     FastAPI dependency for database sessions
 
     Usage:
         @app.get("/users")
-        def get_users(db: Session = Depends(get_db)):
-            return db.query(User).all()
+        async def get_users(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(User))
+            return result.scalars().all()
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function for sessions that only read
+
+    Queries run on a read replica when DATABASE_REPLICA_URLS is set (see
+    app.core.replicas); writes in the session still go to the primary.
+    Use get_db for anything that writes and then reads its own result.
+
+    Usage:
+        @app.get("/children")
+        async def get_children(db: AsyncSession = Depends(get_read_db)):
+            ...
+
+    Yields:
+        AsyncSession: Async session routed to a replica when one is usable
+    """
+    async with AsyncSessionLocal(info={READ_ONLY: replica_router}) as db:
+        yield db
+
+
+def get_sync_db() -> Generator[Session, None, None]:
+    """
+    Get a blocking database session for scripts and maintenance tasks
 
     Yields:
         Session: SQLAlchemy database session
@@ -61,12 +245,47 @@ def init_db() -> None:
     Initialize database tables
     Create all tables defined in models
 
-    Note: This is for development only.
-    In production, use Alembic migrations.
+    Note: This is for tests and throwaway databases only.
+    Real databases are created and upgraded with run_migrations().
     """
     Base.metadata.create_all(bind=engine)
 
 
+def run_migrations(revision: str = "head", url: Optional[str] = None) -> None:
+    """
+    Upgrade the database schema with Alembic
+
+    A database created with create_all before migrations existed (tables
+    present, no alembic_version) is first stamped at the revision matching
+    the tables it has (see BASELINE_REVISIONS), so only the later revisions
+    run.
+
+    Args:
+        revision: Target revision
+        url: Sync database URL (default: DATABASE_URL)
+    """
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import inspect
+
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    url = url or SYNC_DATABASE_URL
+    config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))  # configparser escaping
+
+    migration_engine = create_engine(url, poolclass=NullPool)
+    try:
+        tables = set(inspect(migration_engine).get_table_names())
+    finally:
+        migration_engine.dispose()
+    if "alembic_version" not in tables:
+        for table, baseline in BASELINE_REVISIONS:
+            if table in tables:
+                command.stamp(config, baseline)
+                break
+    command.upgrade(config, revision)
+
+
 def drop_db() -> None:
     """
     Drop all database tables
@@ -0,0 +1,109 @@
+"""
+Request and query instrumentation
+라우트별 요청 지연 시간 및 DB 쿼리 시간 계측
+"""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .config import settings
+from .metrics import record_timing, registry
+from .query_stats import record_query
+
+# Route label for requests that matched no route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "<unmatched>"
+
+http_requests = registry.counter(
+    "eduguard_http_requests_total",
+    "HTTP requests by route template, method and status code",
+    ("method", "route", "status"),
+)
+http_request_duration = registry.histogram(
+    "eduguard_http_request_duration_milliseconds",
+    "HTTP request latency by route template and method",
+    ("method", "route"),
+)
+http_requests_in_progress = registry.gauge(
+    "eduguard_http_requests_in_progress",
+    "Requests currently being handled",
+).labels()
+
+
+def _route_template(scope: dict) -> str:
+    # FastAPI stores the matched APIRoute in the scope during routing
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request count and latency per route
+
+    Routes are labelled by their template ("/api/v1/auth/children/{child_id}"),
+    not the raw path, so IDs do not create new series. Latency is measured up
+    to the end of the response body. Observations happen on the event loop
+    thread, so the counters are uncontended. Disabled when METRICS_ENABLED is
+    False.
+
+    Args:
+        app: ASGI application
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_progress.dec()
+            route = _route_template(scope)
+            method = scope["method"]
+            http_request_duration.labels(method, route).observe(
+                (time.perf_counter() - started) * 1000
+            )
+            http_requests.labels(method, route, str(status_code)).inc()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_metrics_started", None)
+    if started is not None:
+        duration_ms = (time.perf_counter() - started) * 1000
+        record_timing("db_query", duration_ms)
+        record_query(statement, duration_ms)
+
+
+def instrument_query_timing(engine) -> None:
+    """
+    Time every SQL statement on engine into the "db_query" operation and
+    attribute it to the current request's query stats
+
+    Args:
+        engine: Engine or AsyncEngine
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,111 @@
+"""
+Lazy imports for heavy optional dependencies
+무거운 AI 의존성(langchain, openai, pinecone 등)의 지연 로딩
+
+Routers must stay cheap to import: every worker and the test suite import
+app.main before serving anything. Modules that pull in large SDKs are
+referenced through lazy_import() instead of a top-level import, so their
+cost is paid on first use (or by the background warm-up after startup),
+not while the worker is becoming ready.
+
+Usage:
+    from app.core.lazy import lazy_import
+
+    langchain_openai = lazy_import("langchain_openai")
+
+    def build_llm():
+        return langchain_openai.AzureChatOpenAI(...)  # imported here
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Dict, List
+
+# Third-party packages that must never be imported while app.main loads
+HEAVY_MODULES = ("openai", "langchain", "langchain_openai", "langgraph", "pinecone")
+
+_registry: Dict[str, ModuleType] = {}
+_lock = threading.Lock()
+
+
+class MissingModule(ModuleType):
+    """Placeholder for an optional dependency that is not installed"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._missing_name = name
+
+    def __getattr__(self, attr: str):
+        raise ModuleNotFoundError(
+            f"Optional dependency '{self._missing_name}' is not installed "
+            f"(needed for '{attr}'). Install it with: pip install -r requirements.txt",
+            name=self._missing_name,
+        )
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return a module whose body runs on first attribute access
+
+    Parent packages are resolved immediately (that is how Python finds the
+    module spec) but the module itself is not executed until used.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        ModuleType: The module if already imported, a lazy module, or a
+            MissingModule placeholder if it is not installed
+    """
+    with _lock:
+        if name in sys.modules:
+            return sys.modules[name]
+        if name in _registry:
+            return _registry[name]
+
+        try:
+            spec = importlib.util.find_spec(name)
+        except ModuleNotFoundError:
+            spec = None
+        if spec is None or spec.loader is None:
+            module: ModuleType = MissingModule(name)
+        else:
+            loader = importlib.util.LazyLoader(spec.loader)
+            spec.loader = loader
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            loader.exec_module(module)
+        _registry[name] = module
+        return module
+
+
+def is_loaded(name: str) -> bool:
+    """Whether a module's body has actually been executed"""
+    module = sys.modules.get(name)
+    if module is None:
+        return False
+    # LazyLoader swaps the module class back to ModuleType once it has loaded
+    lazy_class = getattr(importlib.util, "_LazyModule", None)
+    return lazy_class is None or type(module) is not lazy_class
+
+
+def warm_up() -> List[str]:
+    """
+    Load every module registered through lazy_import()
+
+    Meant to run in a background thread after startup, so the first request
+    that needs a heavy dependency does not pay for the import.
+
+    Returns:
+        List[str]: Names of modules that are now loaded
+    """
+    loaded = []
+    for name, module in list(_registry.items()):
+        if isinstance(module, MissingModule):
+            continue
+        dir(module)  # Any attribute access triggers the deferred import
+        loaded.append(name)
+    return loaded
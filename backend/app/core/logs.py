@@ -0,0 +1,324 @@
+"""
+Non-blocking structured logging
+큐 기반 비동기 JSON 로깅 (파일 로테이션, 샘플링, 요청 ID 연동)
+
+Request threads only put records on a bounded queue; a listener thread
+formats them as JSON lines and writes them to LOG_FILE_PATH (rotated by size
+or time). When the queue is full, records are dropped and counted instead
+of blocking the request.
+
+Size and time rotation happen inside each process, so server workers must
+not share a file (the default path has one per worker, "{pid}"). To write
+one shared file, set LOG_ROTATION=external and rotate it with logrotate;
+each worker reopens the file once it has been moved.
+"""
+
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from .config import settings
+
+# Correlation ID of the request being handled ("-" outside requests)
+request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="-")
+
+# ASGI scope of the request being handled (routing stores the matched route in it)
+request_scope_var: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "log_request_scope", default=None
+)
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RESERVED = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "request_id", "route"}
+
+access_logger = logging.getLogger("app.access")
+
+
+def parse_sample_rates(value: str) -> Dict[int, float]:
+    """
+    Parse "INFO=0.1,DEBUG=0.01" into {logging.INFO: 0.1, logging.DEBUG: 0.01}
+
+    Args:
+        value: Comma-separated LEVEL=rate pairs (rates between 0 and 1)
+
+    Returns:
+        Dict[int, float]: Keep-rate per level number
+    """
+    rates = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        level, _, rate = item.partition("=")
+        levelno = logging.getLevelName(level.strip().upper())
+        if not isinstance(levelno, int):
+            raise ValueError(f"Unknown log level in LOG_SAMPLE_RATES: {level!r}")
+        rates[levelno] = min(1.0, max(0.0, float(rate)))
+    return rates
+
+
+def _split(value: str) -> FrozenSet[str]:
+    return frozenset(part.strip() for part in value.split(",") if part.strip())
+
+
+class ContextFilter(logging.Filter):
+    """Copy request-scoped context onto the record (runs on the calling thread)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        scope = request_scope_var.get()
+        record.route = getattr(scope.get("route"), "path", None) if scope else None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of records from hot routes, per level
+
+    The decision hashes the request ID, so a sampled request keeps all of
+    its lines at that level (and an unsampled one drops all of them).
+    Levels without a rate, and routes not listed, are never sampled.
+
+    Args:
+        rates: Keep-rate per level number
+        routes: Route templates to sample
+    """
+
+    def __init__(self, rates: Dict[int, float], routes: Iterable[str]):
+        super().__init__()
+        self.rates = rates
+        self.routes = frozenset(routes)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelno)
+        if rate is None or rate >= 1.0:
+            return True
+        route = getattr(record, "route", None)
+        if route not in self.routes:
+            return True
+        request_id = getattr(record, "request_id", "-")
+        return zlib.crc32(request_id.encode()) % 10000 < rate * 10000
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, request_id and extras"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never blocks and leaves formatting to the listener
+
+    prepare() only merges the message arguments and renders tracebacks (so
+    the record is safe to hand to another thread); JSON encoding happens on
+    the listener thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def log_file_path() -> str:
+    """LOG_FILE_PATH with "{pid}" replaced (one file per server worker)"""
+    return settings.LOG_FILE_PATH.replace("{pid}", str(os.getpid()))
+
+
+def build_file_handler(path: str) -> logging.Handler:
+    """File handler for LOG_ROTATION ("size", "time" or "external")"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if settings.LOG_ROTATION == "external":
+        return logging.handlers.WatchedFileHandler(path, encoding="utf-8")
+    if settings.LOG_ROTATION == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            path,
+            when=settings.LOG_ROTATE_WHEN,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            utc=True,
+        )
+    return logging.handlers.RotatingFileHandler(
+        path,
+        maxBytes=settings.LOG_MAX_BYTES,
+        backupCount=settings.LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+
+
+class LoggingPipeline:
+    """
+    Root logger -> bounded queue -> listener thread -> JSON file/stderr
+
+    Start it once per process (after forking, e.g. in the app lifespan) and
+    stop it on shutdown to flush the queue. It should be the only root
+    handler: a synchronous handler added elsewhere (basicConfig, a stdout
+    StreamHandler) would still write on the request thread.
+    """
+
+    def __init__(self) -> None:
+        self.queue_handler: Optional[NonBlockingQueueHandler] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
+
+    @property
+    def running(self) -> bool:
+        return self.listener is not None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        formatter = JsonFormatter()
+        handlers = []
+        if settings.LOG_FILE_PATH:
+            handlers.append(build_file_handler(log_file_path()))
+        if settings.LOG_TO_STDERR:
+            handlers.append(logging.StreamHandler(sys.stderr))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        self.queue_handler = NonBlockingQueueHandler(queue.Queue(settings.LOG_QUEUE_SIZE))
+        self.queue_handler.addFilter(ContextFilter())
+        rates = parse_sample_rates(settings.LOG_SAMPLE_RATES)
+        if rates:
+            self.queue_handler.addFilter(
+                SamplingFilter(rates, _split(settings.LOG_SAMPLED_ROUTES))
+            )
+
+        root = logging.getLogger()
+        root.addHandler(self.queue_handler)
+        root.setLevel(settings.LOG_LEVEL.upper())
+        # SQL logging goes through the same queue instead of echo's stdout handler
+        logging.getLogger("sqlalchemy.engine").setLevel(
+            logging.INFO if settings.SQL_ECHO else logging.WARNING
+        )
+
+        self.listener = logging.handlers.QueueListener(
+            self.queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Flush queued records, close the files and detach from the root logger"""
+        if not self.running:
+            return
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        self.listener = None
+
+    def stats(self) -> dict:
+        """Queue depth and dropped records for monitoring"""
+        if self.queue_handler is None:
+            return {"running": False, "queued": 0, "dropped": 0}
+        return {
+            "running": self.running,
+            "queued": self.queue_handler.queue.qsize(),
+            "dropped": self.queue_handler.dropped,
+        }
+
+
+# Global pipeline started by the app lifespan
+logging_pipeline = LoggingPipeline()
+
+
+class RequestLogMiddleware:
+    """
+    ASGI middleware assigning a request ID and writing one access line
+
+    Uses the client's X-Request-ID when present (so IDs can be followed
+    across services), otherwise generates one, and echoes it in the
+    response. Every record logged while the request runs carries it. The
+    access line ("app.access", INFO) includes method, route, path, status
+    and duration_ms and is written only when LOG_ACCESS is True.
+
+    Args:
+        app: ASGI application
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        id_token = request_id_var.set(request_id)
+        scope_token = request_scope_var.set(scope)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if settings.LOG_ACCESS:
+                access_logger.info(
+                    "%s %s %s",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status_code,
+                        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                    },
+                )
+            request_scope_var.reset(scope_token)
+            request_id_var.reset(id_token)
@@ -0,0 +1,382 @@
+"""
+Metric primitives
+카운터, 게이지, 히스토그램 등 애플리케이션 메트릭 기본 타입
+"""
+
+import bisect
+import functools
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Default latency buckets in milliseconds
+DEFAULT_MS_BUCKETS = (
+    0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+
+class Counter:
+    """
+    Monotonically increasing value
+
+    Args:
+        name: Metric name
+        description: Help text
+    """
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter"""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0.0
+
+
+class Gauge:
+    """
+    Value that can go up and down, or be read from a callback
+
+    Args:
+        name: Metric name
+        description: Help text
+        function: Optional callable returning the current value
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        function: Optional[Callable[[], float]] = None,
+    ):
+        self.name = name
+        self.description = description
+        self.function = function
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        if self.function is not None:
+            return float(self.function())
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0.0
+
+
+class Histogram:
+    """
+    Distribution of observed values in fixed buckets
+
+    Buckets are upper bounds (inclusive); values above the last bound are
+    counted in the implicit +Inf bucket.
+
+    Usage:
+        latency = Histogram("checkout_ms", "Pool checkout latency")
+        latency.observe(3.2)
+        latency.snapshot()["p99"]
+
+    Args:
+        name: Metric name
+        description: Help text
+        buckets: Sorted bucket upper bounds
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Sequence[float] = DEFAULT_MS_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+            if value > self._max:
+                self._max = value
+
+    def cumulative_counts(self) -> Dict[str, int]:
+        """Observations <= each bucket bound, keyed by bound ("+Inf" last)"""
+        with self._lock:
+            counts = list(self._counts)
+        result = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            result[format(bound, "g")] = running
+        result["+Inf"] = running + counts[-1]
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it"""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            maximum = self._max
+        if total == 0:
+            return 0.0
+        rank = q * total
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            if running >= rank:
+                return min(bound, maximum)
+        return maximum
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def snapshot(self) -> dict:
+        """Count, sum, mean, max and estimated p50/p95/p99"""
+        with self._lock:
+            count, total, maximum = self._count, self._sum, self._max
+        return {
+            "count": count,
+            "sum": round(total, 3),
+            "mean": round(total / count, 3) if count else 0.0,
+            "max": round(maximum, 3),
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+            self._max = 0.0
+
+
+# Metric kinds and their primitive types
+METRIC_TYPES = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+
+class MetricFamily:
+    """
+    Metrics sharing a name and help text, one child per label combination
+
+    Children are created on first use; later lookups are a plain dict read,
+    so the hot path takes no lock.
+
+    Usage:
+        requests = MetricFamily("counter", "http_requests_total", "Requests", ("route",))
+        requests.labels("/api/v1/auth/me").inc()
+
+    Args:
+        kind: "counter", "gauge" or "histogram"
+        name: Metric name
+        description: Help text
+        labelnames: Label names, in the order values are passed to labels()
+        **options: Extra arguments for each child (e.g. buckets)
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        description: str = "",
+        labelnames: Sequence[str] = (),
+        **options,
+    ):
+        if kind not in METRIC_TYPES:
+            raise ValueError(f"kind must be one of {tuple(METRIC_TYPES)}, got {kind!r}")
+        self.kind = kind
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._options = options
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """Return the child metric for these label values, creating it if needed"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = METRIC_TYPES[self.kind](self.name, self.description, **self._options)
+                    self._children[values] = child
+        return child
+
+    def add(self, values: Sequence[str], metric) -> None:
+        """Attach an existing metric object as the child for these label values"""
+        with self._lock:
+            self._children[tuple(values)] = metric
+
+    def children(self) -> List[Tuple[Tuple[str, ...], object]]:
+        """(label values, metric) pairs"""
+        with self._lock:
+            return list(self._children.items())
+
+    def reset(self) -> None:
+        """Reset every child's value (children stay bound for existing references)"""
+        for _, child in self.children():
+            child.reset()
+
+
+class MetricsRegistry:
+    """
+    Named metric families plus collectors that report metrics owned elsewhere
+
+    Usage:
+        latency = registry.histogram("request_ms", "Latency", ("route",))
+        registry.register_collector(lambda: [pool_family])
+        registry.collect()
+
+    Families are created once and returned on later calls with the same name.
+    """
+
+    def __init__(self) -> None:
+        self._families: Dict[str, MetricFamily] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+        self._lock = threading.Lock()
+
+    def _family(self, kind: str, name: str, description: str, labelnames, **options):
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = MetricFamily(kind, name, description, labelnames, **options)
+                self._families[name] = family
+            elif family.kind != kind:
+                raise ValueError(f"{name} is already registered as a {family.kind}")
+            return family
+
+    def counter(self, name: str, description: str = "", labelnames: Sequence[str] = ()):
+        return self._family("counter", name, description, labelnames)
+
+    def gauge(self, name: str, description: str = "", labelnames: Sequence[str] = ()):
+        return self._family("gauge", name, description, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_MS_BUCKETS,
+    ):
+        return self._family("histogram", name, description, labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """Add a callable returning families built at collection time"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> List[MetricFamily]:
+        """All registered families followed by collector output"""
+        with self._lock:
+            families = list(self._families.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            families.extend(collector())
+        return families
+
+    def reset(self) -> None:
+        """Reset every registered family (collector output is not touched)"""
+        with self._lock:
+            families = list(self._families.values())
+        for family in families:
+            family.reset()
+
+
+# Global registry exposed at /metrics
+registry = MetricsRegistry()
+
+# Named operation timings (bcrypt, token decoding, DB statements, ...)
+operation_duration = registry.histogram(
+    "eduguard_operation_duration_milliseconds",
+    "Time spent in named operations",
+    ("operation",),
+)
+
+
+def record_timing(operation: str, milliseconds: float) -> None:
+    """Record a duration measured elsewhere under a named operation"""
+    operation_duration.labels(operation).observe(milliseconds)
+
+
+class timed:
+    """
+    Time a block or function into the named-operation histogram
+
+    Usage:
+        with timed("load_children"):
+            ...
+
+        @timed("decode_access_token")
+        def decode_access_token(token): ...
+
+    Args:
+        operation: Operation label
+    """
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self._started: List[float] = []
+
+    def __enter__(self):
+        self._started.append(time.perf_counter())
+        return self
+
+    def __exit__(self, *exc_info):
+        started = self._started.pop()
+        record_timing(self.operation, (time.perf_counter() - started) * 1000)
+        return False
+
+    def __call__(self, func):
+        operation = self.operation
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_timing(operation, (time.perf_counter() - started) * 1000)
+
+        return wrapper
@@ -0,0 +1,210 @@
+"""
+Connection pool telemetry
+SQLAlchemy 커넥션 풀 계측 (체크아웃 대기 시간, 사용/유휴/오버플로, 타임아웃, pre-ping 실패)
+"""
+
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool
+
+from .metrics import Counter, Gauge, Histogram, MetricFamily, registry
+
+
+class PoolTelemetry:
+    """
+    Instruments one engine's connection pool
+
+    - Checkout latency: Pool.connect() is wrapped, so the histogram covers
+      the time a request waits for a connection (queueing, overflow
+      creation and pre-ping included). The wrapper is re-installed when the
+      engine is disposed, because dispose() replaces the pool.
+    - In-use / idle / overflow gauges: read from QueuePool when available,
+      otherwise derived from checkout/checkin events.
+    - Churn: connections opened, closed and invalidated.
+    - Timeouts: pool_timeout expiries (sqlalchemy.exc.TimeoutError).
+    - Pre-ping failures: stale connections detected by pool_pre_ping.
+
+    Usage:
+        telemetry = PoolTelemetry(async_engine, name="primary")
+        telemetry.snapshot()
+
+    Args:
+        engine: Engine or AsyncEngine to instrument
+        name: Label used in reports (e.g. "primary")
+    """
+
+    def __init__(self, engine, name: str = "primary"):
+        self.engine: Engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        self.name = name
+        self.checkout_ms = Histogram(
+            f"{name}_pool_checkout_ms", "Time spent waiting for a pooled connection"
+        )
+        self.checkouts = Counter(f"{name}_pool_checkouts", "Connections checked out")
+        self.checkins = Counter(f"{name}_pool_checkins", "Connections returned")
+        self.connects = Counter(f"{name}_pool_connects", "New DBAPI connections opened")
+        self.closes = Counter(f"{name}_pool_closes", "DBAPI connections closed")
+        self.invalidations = Counter(f"{name}_pool_invalidations", "Connections invalidated")
+        self.timeouts = Counter(f"{name}_pool_timeouts", "Checkouts that hit pool_timeout")
+        self.pre_ping_failures = Counter(
+            f"{name}_pool_pre_ping_failures", "Stale connections detected by pre-ping"
+        )
+        self.in_use = Gauge(f"{name}_pool_in_use", "Checked-out connections", self._in_use)
+        self.idle = Gauge(f"{name}_pool_idle", "Idle pooled connections", self._idle)
+        self.overflow = Gauge(f"{name}_pool_overflow", "Connections above pool_size", self._overflow)
+        self._install()
+
+    # Gauges -----------------------------------------------------------------
+
+    @property
+    def pool(self) -> Pool:
+        return self.engine.pool
+
+    def _in_use(self) -> float:
+        checkedout = getattr(self.pool, "checkedout", None)
+        if checkedout is not None:
+            return checkedout()
+        return self.checkouts.value - self.checkins.value
+
+    def _idle(self) -> float:
+        checkedin = getattr(self.pool, "checkedin", None)
+        return checkedin() if checkedin is not None else 0
+
+    def _overflow(self) -> float:
+        overflow = getattr(self.pool, "overflow", None)
+        return max(0, overflow()) if overflow is not None else 0
+
+    # Instrumentation --------------------------------------------------------
+
+    def _install(self) -> None:
+        event.listen(self.engine, "checkout", self._on_checkout)
+        event.listen(self.engine, "checkin", self._on_checkin)
+        event.listen(self.engine, "connect", self._on_connect)
+        event.listen(self.engine, "close", self._on_close)
+        event.listen(self.engine, "invalidate", self._on_invalidate)
+        event.listen(self.engine, "handle_error", self._on_error)
+        event.listen(self.engine, "engine_disposed", self._on_disposed)
+        self._wrap_pool(self.pool)
+
+    def _wrap_pool(self, pool: Pool) -> None:
+        if getattr(pool.connect, "_telemetry", None) is self:
+            return
+        connect = pool.connect
+
+        def timed_connect():
+            started = time.perf_counter()
+            try:
+                return connect()
+            except exc.TimeoutError:
+                self.timeouts.inc()
+                raise
+            finally:
+                self.checkout_ms.observe((time.perf_counter() - started) * 1000)
+
+        timed_connect._telemetry = self
+        pool.connect = timed_connect
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.checkouts.inc()
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        self.checkins.inc()
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connects.inc()
+
+    def _on_close(self, dbapi_connection, connection_record) -> None:
+        self.closes.inc()
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self.invalidations.inc()
+
+    def _on_error(self, context) -> None:
+        if getattr(context, "is_pre_ping", False):
+            self.pre_ping_failures.inc()
+
+    def _on_disposed(self, engine) -> None:
+        self._wrap_pool(engine.pool)
+
+    # Reporting --------------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """Current pool configuration, gauges, counters and checkout latency"""
+        pool = self.pool
+        size = getattr(pool, "size", None)
+        return {
+            "pool_class": type(pool).__name__,
+            "pool_size": size() if size is not None else None,
+            "max_overflow": getattr(pool, "_max_overflow", None),
+            "timeout_seconds": getattr(pool, "_timeout", None),
+            "in_use": self.in_use.value,
+            "idle": self.idle.value,
+            "overflow": self.overflow.value,
+            "checkouts": self.checkouts.value,
+            "connects": self.connects.value,
+            "closes": self.closes.value,
+            "invalidations": self.invalidations.value,
+            "timeouts": self.timeouts.value,
+            "pre_ping_failures": self.pre_ping_failures.value,
+            "checkout_ms": self.checkout_ms.snapshot(),
+        }
+
+
+# Instrumented engines by name
+pool_telemetry: Dict[str, PoolTelemetry] = {}
+
+
+def instrument_engine(engine, name: str) -> PoolTelemetry:
+    """
+    Attach telemetry to an engine once and register it under name
+
+    Args:
+        engine: Engine or AsyncEngine
+        name: Registry key (e.g. "primary")
+
+    Returns:
+        PoolTelemetry: The (possibly existing) telemetry for this name
+    """
+    existing: Optional[PoolTelemetry] = pool_telemetry.get(name)
+    if existing is not None:
+        return existing
+    telemetry = PoolTelemetry(engine, name)
+    pool_telemetry[name] = telemetry
+    return telemetry
+
+
+# (attribute, kind, help) exported per engine at /metrics
+_EXPORTED = (
+    ("checkout_ms", "histogram", "Time spent waiting for a pooled connection"),
+    ("in_use", "gauge", "Checked-out connections"),
+    ("idle", "gauge", "Idle pooled connections"),
+    ("overflow", "gauge", "Connections above pool_size"),
+    ("checkouts", "counter", "Connections checked out"),
+    ("connects", "counter", "New DBAPI connections opened"),
+    ("closes", "counter", "DBAPI connections closed"),
+    ("invalidations", "counter", "Connections invalidated"),
+    ("timeouts", "counter", "Checkouts that hit pool_timeout"),
+    ("pre_ping_failures", "counter", "Stale connections detected by pre-ping"),
+)
+
+
+def _collect_pool_families() -> List[MetricFamily]:
+    families = []
+    for attribute, kind, description in _EXPORTED:
+        if kind == "histogram":
+            name = "eduguard_db_pool_checkout_duration_milliseconds"
+        elif kind == "counter":
+            name = f"eduguard_db_pool_{attribute}_total"
+        else:
+            name = f"eduguard_db_pool_{attribute}"
+        family = MetricFamily(kind, name, description, ("engine",))
+        for engine_name, telemetry in list(pool_telemetry.items()):
+            family.add((engine_name,), getattr(telemetry, attribute))
+        families.append(family)
+    return families
+
+
+registry.register_collector(_collect_pool_families)
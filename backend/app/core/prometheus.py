@@ -0,0 +1,264 @@
+"""
+Prometheus text exposition and multi-worker aggregation
+Prometheus 텍스트 포맷 출력 및 멀티 워커 메트릭 집계
+"""
+
+import glob
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config import settings
+from .metrics import Histogram, MetricFamily, registry
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Counters and histograms of exited workers (see MultiprocessCollector.mark_process_dead)
+EXITED_WORKERS_FILE = "exited-workers.json"
+
+
+def snapshot_families(families: Iterable[MetricFamily]) -> List[dict]:
+    """
+    Convert families to JSON-serializable dicts
+
+    Counter and gauge samples carry "value"; histogram samples carry
+    cumulative "buckets", "sum" and "count".
+
+    Args:
+        families: Families from MetricsRegistry.collect()
+
+    Returns:
+        List[dict]: One dict per family
+    """
+    result = []
+    for family in families:
+        samples = []
+        for values, metric in family.children():
+            if isinstance(metric, Histogram):
+                sample = {
+                    "buckets": metric.cumulative_counts(),
+                    "sum": metric.sum,
+                    "count": metric.count,
+                }
+            else:
+                sample = {"value": metric.value}
+            sample["labels"] = list(values)
+            samples.append(sample)
+        result.append(
+            {
+                "name": family.name,
+                "kind": family.kind,
+                "help": family.description,
+                "labelnames": list(family.labelnames),
+                "samples": samples,
+            }
+        )
+    return result
+
+
+def merge_snapshots(snapshots: Iterable[List[dict]]) -> List[dict]:
+    """
+    Sum several workers' snapshots into one
+
+    Counters, histogram buckets and gauges are summed per label set, so
+    gauges such as in-flight requests report the total across workers.
+
+    Args:
+        snapshots: Output of snapshot_families() from each worker
+
+    Returns:
+        List[dict]: Merged families, in first-seen order
+    """
+    merged: Dict[str, dict] = {}
+    for snapshot in snapshots:
+        for family in snapshot:
+            target = merged.setdefault(
+                family["name"], {**family, "samples": [], "_index": {}}
+            )
+            for sample in family["samples"]:
+                key = tuple(sample["labels"])
+                existing = target["_index"].get(key)
+                if existing is None:
+                    copy = {**sample}
+                    if "buckets" in copy:
+                        copy["buckets"] = dict(copy["buckets"])
+                    target["_index"][key] = copy
+                    target["samples"].append(copy)
+                elif "buckets" in sample:
+                    for bound, count in sample["buckets"].items():
+                        existing["buckets"][bound] = existing["buckets"].get(bound, 0) + count
+                    existing["sum"] += sample["sum"]
+                    existing["count"] += sample["count"]
+                else:
+                    existing["value"] += sample["value"]
+    for family in merged.values():
+        del family["_index"]
+    return list(merged.values())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: List[str], values: List[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def render(snapshot: List[dict]) -> str:
+    """
+    Render families in the Prometheus text exposition format (0.0.4)
+
+    Args:
+        snapshot: Output of snapshot_families() or merge_snapshots()
+
+    Returns:
+        str: Exposition text
+    """
+    lines = []
+    for family in snapshot:
+        name = family["name"]
+        lines.append(f"# HELP {name} {_escape(family['help'])}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+        names = family["labelnames"]
+        for sample in family["samples"]:
+            values = sample["labels"]
+            if "buckets" in sample:
+                for bound, count in sample["buckets"].items():
+                    lines.append(f"{name}_bucket{_labels(names, values, ('le', bound))} {count}")
+                lines.append(f"{name}_sum{_labels(names, values)} {_number(sample['sum'])}")
+                lines.append(f"{name}_count{_labels(names, values)} {sample['count']}")
+            else:
+                lines.append(f"{name}{_labels(names, values)} {_number(sample['value'])}")
+    return "\n".join(lines) + "\n"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MultiprocessCollector:
+    """
+    Shares metrics between server workers through snapshot files
+
+    Every worker writes its registry to `<directory>/metrics-<pid>.json`
+    (periodically and before each scrape). A scrape on any worker merges all
+    files, so /metrics reports the whole server rather than whichever worker
+    answered. When a worker exits, the master folds its counters and
+    histograms into one file of exited workers (its gauges are dropped) and
+    deletes the worker's file, so totals never go backwards and recycled
+    workers do not leave files behind. Clear the directory when the server
+    (not a single worker) restarts.
+
+    Args:
+        directory: Shared directory (e.g. METRICS_MULTIPROC_DIR)
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @property
+    def path(self) -> str:
+        return self.worker_path(os.getpid())
+
+    def worker_path(self, pid: int) -> str:
+        return os.path.join(self.directory, f"metrics-{pid}.json")
+
+    @property
+    def exited_path(self) -> str:
+        return os.path.join(self.directory, EXITED_WORKERS_FILE)
+
+    def _write(self, path: str, snapshot: List[dict]) -> None:
+        # Atomic: readers never see a partly written file
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".metrics-", suffix=".tmp")
+        with os.fdopen(fd, "w") as handle:
+            handle.write(json.dumps(snapshot))
+        os.replace(tmp_path, path)
+
+    def flush(self) -> None:
+        """Write this worker's snapshot atomically"""
+        self._write(self.path, snapshot_families(registry.collect()))
+
+    def mark_process_dead(self, pid: int) -> None:
+        """
+        Fold an exited worker's counters and histograms into the exited-workers
+        file and delete its snapshot (call from the master, e.g. child_exit)
+
+        Args:
+            pid: PID of the exited worker
+        """
+        path = self.worker_path(pid)
+        try:
+            with open(path) as handle:
+                snapshot = json.load(handle)
+        except FileNotFoundError:
+            return
+        except (ValueError, OSError):
+            logger.warning("Discarding unreadable metrics file %s", path)
+            os.remove(path)
+            return
+        kept = [family for family in snapshot if family["kind"] != "gauge"]
+        exited = []
+        if os.path.exists(self.exited_path):
+            with open(self.exited_path) as handle:
+                exited = json.load(handle)
+        self._write(self.exited_path, merge_snapshots([exited, kept]))
+        os.remove(path)
+
+    def collect(self) -> List[dict]:
+        """Merge every worker's snapshot (flushing this worker's first)"""
+        self.flush()
+        snapshots = []
+        if os.path.exists(self.exited_path):
+            try:
+                with open(self.exited_path) as handle:
+                    snapshots.append(json.load(handle))
+            except (ValueError, OSError):
+                logger.warning("Skipping unreadable metrics file %s", self.exited_path)
+        for path in glob.glob(os.path.join(self.directory, "metrics-*.json")):
+            try:
+                pid = int(os.path.basename(path)[len("metrics-") : -len(".json")])
+                with open(path) as handle:
+                    snapshot = json.load(handle)
+            except (ValueError, OSError):
+                logger.warning("Skipping unreadable metrics file %s", path)
+                continue
+            if not _pid_alive(pid):
+                snapshot = [family for family in snapshot if family["kind"] != "gauge"]
+            snapshots.append(snapshot)
+        return merge_snapshots(snapshots)
+
+
+def multiprocess_collector() -> Optional[MultiprocessCollector]:
+    """Collector for METRICS_MULTIPROC_DIR, or None in single-process mode"""
+    if not settings.METRICS_MULTIPROC_DIR:
+        return None
+    return MultiprocessCollector(settings.METRICS_MULTIPROC_DIR)
+
+
+def generate_latest() -> str:
+    """
+    Exposition text for this worker, or for all workers when
+    METRICS_MULTIPROC_DIR is set
+    """
+    collector = multiprocess_collector()
+    if collector is not None:
+        return render(collector.collect())
+    return render(snapshot_families(registry.collect()))
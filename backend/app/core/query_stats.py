@@ -0,0 +1,172 @@
+"""
+Per-request query counting and N+1 detection
+요청별 SQL 실행 횟수/시간 집계 및 N+1 쿼리 감지
+"""
+
+import contextvars
+import logging
+import threading
+from collections import Counter as StatementCounter
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Set, Tuple
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Response headers added in debug mode
+COUNT_HEADER = b"x-db-query-count"
+TIME_HEADER = b"x-db-query-time-ms"
+
+
+class QueryStats:
+    """
+    Statements executed within one request (or one capture block)
+
+    Attributes:
+        count: Statements executed
+        duration_ms: Total time spent executing them
+        statements: Execution count per SQL text
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration_ms = 0.0
+        self.statements: StatementCounter = StatementCounter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.duration_ms += duration_ms
+            self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statements executed at least threshold times (likely N+1 loops)
+
+        Args:
+            threshold: Minimum executions of the same SQL text
+
+        Returns:
+            List[Tuple[str, int]]: (statement, count), most frequent first
+        """
+        with self._lock:
+            return [
+                (statement, count)
+                for statement, count in self.statements.most_common()
+                if count >= threshold
+            ]
+
+
+# Stats for the request being handled (None outside instrumented requests)
+_current: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar(
+    "query_stats", default=None
+)
+
+# Active capture_queries() blocks, which see statements from every thread
+_captures: Set[QueryStats] = set()
+_captures_lock = threading.Lock()
+
+
+def record_query(statement: str, duration_ms: float) -> None:
+    """Attribute one executed statement to the current request and captures"""
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, duration_ms)
+    if _captures:
+        with _captures_lock:
+            captures = list(_captures)
+        for capture in captures:
+            capture.record(statement, duration_ms)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats of the request being handled, if query stats are enabled"""
+    return _current.get()
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """
+    Count statements executed anywhere in the process while the block runs
+
+    Unlike the per-request stats this is not tied to a context, so it sees
+    queries issued by TestClient's server thread. Meant for tests and
+    benchmarks.
+
+    Usage:
+        with capture_queries() as stats:
+            client.get("/api/v1/auth/children")
+        assert stats.count <= 2
+    """
+    stats = QueryStats()
+    with _captures_lock:
+        _captures.add(stats)
+    try:
+        yield stats
+    finally:
+        with _captures_lock:
+            _captures.discard(stats)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware counting SQL statements and DB time per request
+
+    - DEBUG: adds X-DB-Query-Count and X-DB-Query-Time-Ms response headers
+      (counted up to the start of the response).
+    - Logs a warning when a request exceeds QUERY_STATS_WARN_COUNT statements
+      or QUERY_STATS_WARN_MS of DB time, or repeats one statement
+      QUERY_STATS_REPEAT_THRESHOLD times (a likely N+1 loop).
+
+    Disabled unless QUERY_STATS_ENABLED is True. Statements are attributed
+    through a context variable set here and read by the engine listeners in
+    app.core.instrumentation.
+
+    Args:
+        app: ASGI application
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.QUERY_STATS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                headers = list(message.get("headers", []))
+                headers.append((COUNT_HEADER, str(stats.count).encode()))
+                headers.append((TIME_HEADER, f"{stats.duration_ms:.3f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            self._report(scope, stats)
+
+    @staticmethod
+    def _report(scope: dict, stats: QueryStats) -> None:
+        request = f"{scope['method']} {scope['path']}"
+        if (
+            stats.count > settings.QUERY_STATS_WARN_COUNT
+            or stats.duration_ms > settings.QUERY_STATS_WARN_MS
+        ):
+            logger.warning(
+                "%s ran %d statements in %.1f ms", request, stats.count, stats.duration_ms
+            )
+        for statement, count in stats.repeated(settings.QUERY_STATS_REPEAT_THRESHOLD):
+            logger.warning(
+                "%s repeated a statement %d times (possible N+1): %s",
+                request,
+                count,
+                " ".join(statement.split())[:200],
+            )
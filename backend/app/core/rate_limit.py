@@ -0,0 +1,345 @@
+"""
+Rate limiting
+GCRA(Generic Cell Rate Algorithm) 기반 요청 속도 제한 미들웨어 및 저장소
+"""
+
+import json
+import math
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .config import settings
+from ..utils.token_cache import decode_access_token_cached
+
+# Endpoints that cost a bcrypt operation; limited by client IP and email
+CREDENTIAL_PATHS = frozenset({"/api/v1/auth/login", "/api/v1/auth/signup"})
+
+# Unauthenticated lookups that reveal account existence; limited by client IP
+LOOKUP_PATHS = frozenset({"/api/v1/auth/email-available"})
+
+# Credential request bodies larger than this are not inspected for an email
+MAX_INSPECTED_BODY_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class Rate:
+    """
+    Allow `limit` requests per `period_seconds`, bursting up to `limit`
+
+    Attributes:
+        limit: Requests allowed per period
+        period_seconds: Window length in seconds
+    """
+
+    limit: int
+    period_seconds: float
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds between requests at the sustained rate"""
+        return self.period_seconds / self.limit
+
+
+class RateLimitStore(ABC):
+    """
+    Storage for GCRA state (theoretical arrival times)
+
+    Implementations must apply hit() atomically per key. A shared
+    implementation (e.g. a Redis Lua script keyed by `{key}:{index}`) lets
+    all workers enforce one limit; ShardedMemoryStore is the in-process
+    default and stand-in.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, rates: Sequence[Rate], now: float) -> float:
+        """
+        Record one request for key if every rate allows it
+
+        Args:
+            key: Limited identity (e.g. "ip:1.2.3.4")
+            rates: Rates that must all allow the request
+            now: Current time in seconds
+
+        Returns:
+            float: 0.0 if allowed, otherwise seconds until a retry can succeed
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Forget all state"""
+
+
+class ShardedMemoryStore(RateLimitStore):
+    """
+    In-process GCRA store split into independently locked shards
+
+    Keys are spread over shards by CRC32 so request threads rarely contend
+    on the same lock. Each shard keeps at most max_keys_per_shard entries;
+    expired entries are pruned first, then the oldest.
+
+    Args:
+        shards: Number of shards
+        max_keys_per_shard: Entry bound per shard
+    """
+
+    def __init__(self, shards: int = 16, max_keys_per_shard: int = 10000):
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._shards: List[Dict[Tuple[str, int], float]] = [{} for _ in range(shards)]
+        self.max_keys_per_shard = max_keys_per_shard
+
+    def _shard(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % len(self._shards)
+
+    def hit_sync(self, key: str, rates: Sequence[Rate], now: float) -> float:
+        """Synchronous hit() for callers outside an event loop"""
+        index = self._shard(key)
+        shard = self._shards[index]
+        with self._locks[index]:
+            new_tats = []
+            retry_after = 0.0
+            for position, rate in enumerate(rates):
+                tat = max(shard.get((key, position), now), now) + rate.emission_interval
+                allow_at = tat - rate.period_seconds
+                if allow_at > now:
+                    retry_after = max(retry_after, allow_at - now)
+                new_tats.append(tat)
+            if retry_after:
+                return retry_after
+
+            for position, tat in enumerate(new_tats):
+                shard.pop((key, position), None)
+                shard[(key, position)] = tat
+            if len(shard) > self.max_keys_per_shard:
+                self._prune(shard, now)
+            return 0.0
+
+    def _prune(self, shard: Dict[Tuple[str, int], float], now: float) -> None:
+        for entry in [entry for entry, tat in shard.items() if tat <= now]:
+            del shard[entry]
+        while len(shard) > self.max_keys_per_shard:
+            del shard[next(iter(shard))]
+
+    async def hit(self, key: str, rates: Sequence[Rate], now: float) -> float:
+        return self.hit_sync(key, rates, now)
+
+    async def clear(self) -> None:
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+class RateLimiter:
+    """
+    Checks identities against configured rates
+
+    Usage:
+        limiter = RateLimiter(ShardedMemoryStore())
+        retry_after = await limiter.hit(["ip:1.2.3.4", "email:a@b.c"])
+
+    Args:
+        store: GCRA state store (shared store in multi-worker deployments)
+        clock: Time source
+    """
+
+    def __init__(self, store: RateLimitStore, clock: Callable[[], float] = time.time):
+        self.store = store
+        self.clock = clock
+        self.allowed = 0
+        self.limited = 0
+
+    def rates(self) -> List[Rate]:
+        """Rates from settings (read per call so they can be changed at runtime)"""
+        return [
+            Rate(settings.RATE_LIMIT_PER_MINUTE, 60),
+            Rate(settings.RATE_LIMIT_PER_HOUR, 3600),
+        ]
+
+    async def hit(self, keys: Sequence[str]) -> float:
+        """
+        Record a request for every key
+
+        Keys are checked in order and the first one over its limit stops the
+        check, so a blocked IP does not also consume the email's budget.
+
+        Returns:
+            float: 0.0 if allowed, otherwise seconds until retry
+        """
+        rates = self.rates()
+        now = self.clock()
+        for key in keys:
+            retry_after = await self.store.hit(key, rates, now)
+            if retry_after:
+                self.limited += 1
+                return retry_after
+        self.allowed += 1
+        return 0.0
+
+    async def clear(self) -> None:
+        """Forget all state and counters"""
+        await self.store.clear()
+        self.allowed = 0
+        self.limited = 0
+
+    def stats(self) -> dict:
+        """Allowed/limited counters for monitoring"""
+        return {"allowed": self.allowed, "limited": self.limited}
+
+
+# Global limiter (swap the store for a shared one when running several workers)
+rate_limiter = RateLimiter(ShardedMemoryStore())
+
+
+def _client_ip(scope: dict) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _bearer_token(scope: dict) -> Optional[str]:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token.strip()
+    return None
+
+
+def _user_id(token: str) -> Optional[str]:
+    payload = decode_access_token_cached(token)
+    if payload is None or payload.get("sub") is None:
+        return None
+    return str(payload["sub"])
+
+
+def _email(body: bytes) -> Optional[str]:
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    email = data.get("email") if isinstance(data, dict) else None
+    return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware returning 429 before any database or bcrypt work
+
+    - Credential endpoints (login, signup): limited by client IP and by the
+      email in the JSON body. The body (up to MAX_INSPECTED_BODY_BYTES) is
+      buffered and replayed to the app; larger bodies are limited by IP only.
+    - Account lookups (email availability): limited by client IP, with a
+      budget separate from the credential endpoints.
+    - Requests with a valid bearer token: limited by user ID.
+    - Everything else passes through.
+
+    Limits come from RATE_LIMIT_PER_MINUTE and RATE_LIMIT_PER_HOUR and are
+    enforced with GCRA, so short bursts up to the per-minute limit are
+    allowed. Disabled when RATE_LIMIT_ENABLED is False.
+
+    Args:
+        app: ASGI application
+        limiter: Rate limiter (defaults to the global one)
+    """
+
+    def __init__(self, app, limiter: Optional[RateLimiter] = None):
+        self.app = app
+        self.limiter = limiter or rate_limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        keys: List[str] = []
+        if scope["method"] == "POST" and scope["path"] in CREDENTIAL_PATHS:
+            keys.append(f"ip:{_client_ip(scope)}")
+            body, receive = await self._buffer_body(scope, receive)
+            email = _email(body) if body is not None else None
+            if email:
+                keys.append(f"email:{email}")
+        elif scope["path"] in LOOKUP_PATHS:
+            keys.append(f"lookup-ip:{_client_ip(scope)}")
+        else:
+            token = _bearer_token(scope)
+            user_id = _user_id(token) if token else None
+            if user_id:
+                keys.append(f"user:{user_id}")
+
+        if keys:
+            retry_after = await self.limiter.hit(keys)
+            if retry_after:
+                await self._reject(send, retry_after)
+                return
+
+        await self.app(scope, receive, send)
+
+    async def _buffer_body(self, scope, receive):
+        """
+        Read the request body and return a receive() that replays it
+
+        At most MAX_INSPECTED_BODY_BYTES are buffered: a larger body (by
+        Content-Length, or once the chunks read pass the cap) is not
+        inspected, and the chunks already read are replayed ahead of the
+        unread rest of the stream.
+
+        Returns:
+            tuple: (body, or None if not inspected; receive for the app)
+        """
+        for name, value in scope.get("headers", ()):
+            if name == b"content-length" and value.isdigit():
+                if int(value) > MAX_INSPECTED_BODY_BYTES:
+                    return None, receive
+
+        messages = []
+        size = 0
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                # Client went away; let the app see the disconnect
+                return None, self._replay(messages, receive)
+            size += len(message.get("body", b""))
+            if size > MAX_INSPECTED_BODY_BYTES:
+                return None, self._replay(messages, receive)
+            if not message.get("more_body", False):
+                break
+
+        body = b"".join(message.get("body", b"") for message in messages)
+        return body, self._replay(
+            [{"type": "http.request", "body": body, "more_body": False}], receive
+        )
+
+    @staticmethod
+    def _replay(messages: List[dict], receive):
+        """receive() returning the given messages first, then the real stream"""
+        pending = deque(messages)
+
+        async def replay():
+            if pending:
+                return pending.popleft()
+            return await receive()
+
+        return replay
+
+    @staticmethod
+    async def _reject(send, retry_after: float) -> None:
+        body = json.dumps({"detail": "Too many requests. Please try again later."}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
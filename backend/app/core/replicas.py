@@ -0,0 +1,231 @@
+"""
+Read-replica routing
+읽기 전용 요청을 복제본(replica) DB로 분산
+
+Sessions opened with get_read_db run their SELECTs on a replica chosen
+round-robin among the healthy ones whose replication lag is within
+REPLICA_MAX_LAG_SECONDS; with no usable replica they fall back to the
+primary. Anything that writes (flushes, INSERT/UPDATE/DELETE statements)
+always goes to the primary.
+
+Replicas trail the primary, so a user who just wrote (signup, link/unlink)
+is pinned to the primary for REPLICA_STICKY_SECONDS to read their own
+writes. The pin is kept per server worker, so a request served by another
+worker can still miss the new row on a replica; lookups that find nothing
+there are repeated on the primary (see retry_on_primary).
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction; 0 when the replica has replayed
+# everything it received (an idle primary would otherwise look like lag)
+POSTGRES_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+# Session.info keys
+READ_ONLY = "read_only"  # Set by get_read_db
+USE_PRIMARY = "use_primary"  # Pin this session to the primary
+_PINNED_ENGINE = "_replica_engine"  # Replica chosen for this session
+
+
+def split_urls(value: str) -> List[str]:
+    """Comma-separated DATABASE_REPLICA_URLS into a list"""
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+class Replica:
+    """
+    One replica engine and its last health check
+
+    Args:
+        name: Label used in stats and pool metrics
+        engine: Async engine connected to the replica
+    """
+
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.lag_seconds = 0.0
+        self.last_error: Optional[str] = None
+
+    async def measure_lag(self, conn) -> float:
+        """Replication lag in seconds (SQLite has no replication: always 0)"""
+        if conn.dialect.name == "postgresql":
+            return float((await conn.execute(POSTGRES_LAG_QUERY)).scalar() or 0.0)
+        await conn.execute(text("SELECT 1"))
+        return 0.0
+
+    async def check(self, timeout: float) -> None:
+        """Probe the replica and record health and lag"""
+        try:
+            async with asyncio.timeout(timeout):
+                async with self.engine.connect() as conn:
+                    self.lag_seconds = await self.measure_lag(conn)
+            if not self.healthy:
+                logger.info("Replica %s is healthy again", self.name)
+            self.healthy = True
+            self.last_error = None
+        except Exception as e:  # noqa: BLE001 - any failure takes it out of rotation
+            if self.healthy:
+                logger.warning("Replica %s failed its health check: %r", self.name, e)
+            self.healthy = False
+            self.last_error = repr(e)
+
+
+class ReplicaRouter:
+    """
+    Chooses a replica for read-only sessions
+
+    Args:
+        replicas: Replica engines (empty = everything goes to the primary)
+        max_lag_seconds: Replicas lagging more than this are skipped
+        sticky_seconds: How long a writer reads from the primary
+        max_sticky: Bound on remembered writers
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[Replica] = (),
+        max_lag_seconds: float = 2.0,
+        sticky_seconds: float = 5.0,
+        max_sticky: int = 100000,
+    ):
+        self.replicas = list(replicas)
+        self.max_lag_seconds = max_lag_seconds
+        self.sticky_seconds = sticky_seconds
+        self.max_sticky = max_sticky
+        self._next = itertools.count()
+        self._recent_writes: Dict[object, float] = {}
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+
+    def pick(self) -> Optional[Replica]:
+        """Next usable replica (round-robin), or None to use the primary"""
+        usable = [
+            replica
+            for replica in self.replicas
+            if replica.healthy and replica.lag_seconds <= self.max_lag_seconds
+        ]
+        if not usable:
+            if self.replicas:
+                self.primary_fallbacks += 1
+            return None
+        self.replica_reads += 1
+        return usable[next(self._next) % len(usable)]
+
+    def mark_write(self, key: object) -> None:
+        """Pin reads for `key` (a user ID) to the primary for sticky_seconds"""
+        if not self.replicas:
+            return
+        now = time.monotonic()
+        if len(self._recent_writes) >= self.max_sticky:
+            self._recent_writes = {
+                k: until for k, until in self._recent_writes.items() if until > now
+            }
+        self._recent_writes[key] = now + self.sticky_seconds
+
+    def recently_wrote(self, key: object) -> bool:
+        """Whether `key` wrote within the sticky window"""
+        until = self._recent_writes.get(key)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            self._recent_writes.pop(key, None)
+            return False
+        return True
+
+    async def check(self, timeout: float = 2.0) -> None:
+        """Health-check every replica concurrently"""
+        await asyncio.gather(*(replica.check(timeout) for replica in self.replicas))
+
+    async def run_health_checks(self, interval: float) -> None:
+        """Re-check the replicas every `interval` seconds until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            await self.check(timeout=min(interval, 2.0))
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> dict:
+        return {
+            "replicas": {
+                replica.name: {
+                    "healthy": replica.healthy,
+                    "lag_seconds": round(replica.lag_seconds, 3),
+                    "last_error": replica.last_error,
+                }
+                for replica in self.replicas
+            },
+            "replica_reads": self.replica_reads,
+            "primary_fallbacks": self.primary_fallbacks,
+            "sticky_writers": len(self._recent_writes),
+        }
+
+
+class RoutingSession(Session):
+    """
+    Session that sends read-only work to a replica
+
+    Only sessions whose info carries READ_ONLY and a router (see get_read_db)
+    are routed; all others behave like a plain Session on the primary. The
+    replica is chosen once per session, so every statement in it sees the
+    same snapshot.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        router: Optional[ReplicaRouter] = self.info.get(READ_ONLY)
+        if (
+            router is None
+            or self.info.get(USE_PRIMARY)
+            or self._flushing
+            or isinstance(clause, UpdateBase)
+        ):
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        if _PINNED_ENGINE not in self.info:
+            replica = router.pick()
+            self.info[_PINNED_ENGINE] = replica.engine.sync_engine if replica else None
+        return self.info[_PINNED_ENGINE] or super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+def use_primary_for(db, router: ReplicaRouter, key: object) -> None:
+    """
+    Pin a read session to the primary if `key` wrote recently
+
+    Call before the session's first query (e.g. right after the user ID is
+    known in get_current_user).
+    """
+    if router.recently_wrote(key):
+        db.info[USE_PRIMARY] = True
+
+
+def retry_on_primary(db) -> bool:
+    """
+    Move a read session to the primary after a miss on a replica
+
+    A replica may not have replayed a write made through another worker
+    yet, so a row it does not have is looked up again on the primary.
+
+    Returns:
+        bool: True if the session was reading a replica (repeat the query)
+    """
+    if db.info.get(USE_PRIMARY) or not db.info.get(_PINNED_ENGINE):
+        return False
+    db.info[USE_PRIMARY] = True
+    return True
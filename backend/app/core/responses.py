@@ -0,0 +1,66 @@
+"""
+Fast JSON responses
+orjson 기반 응답 직렬화 (response_model 재검증 생략)
+"""
+
+from typing import Any, Optional, Union
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from .config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson
+
+    Datetimes are written as RFC 3339 with "Z" for UTC, matching Pydantic's
+    own JSON output, so clients see the same payload in either mode.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+def fast_json_enabled() -> bool:
+    """Whether routes should bypass response_model validation"""
+    return settings.FAST_JSON_RESPONSES and orjson is not None
+
+
+def model_response(
+    model: BaseModel,
+    status_code: int = 200,
+    response: Optional[Response] = None,
+) -> Union[BaseModel, Response]:
+    """
+    Return a trusted response model without re-validating it
+
+    FastAPI validates and serializes anything returned from a route through
+    its response_model. For models the route has just built from database
+    rows that work is redundant, so in fast mode the model is dumped once and
+    rendered with orjson. response_model still drives the OpenAPI schema.
+
+    When FAST_JSON_RESPONSES is off (or orjson is not installed) the model is
+    returned unchanged and goes through FastAPI's normal path; status_code
+    must then be set on the route as usual. Headers are set once on the
+    route's injected Response, which FastAPI applies on the normal path and
+    this function copies on the fast path.
+
+    Args:
+        model: Response model (typically built with model_construct)
+        status_code: HTTP status code for the fast path
+        response: The route's injected Response carrying extra headers
+
+    Returns:
+        BaseModel | Response: The model itself, or a ready ORJSONResponse
+    """
+    if not fast_json_enabled():
+        return model
+    headers = response.headers if response is not None else None
+    return ORJSONResponse(model.model_dump(), status_code=status_code, headers=headers)
@@ -3,7 +3,9 @@ EduGuard AI - Main Application Entry Point
 청소년 안전 LLM 서비스 백엔드 메인 파일
 """
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
@@ -11,14 +13,101 @@ import os
 # Load environment variables
 load_dotenv()
 
+from app.core.config import settings
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.instrumentation import MetricsMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.logs import RequestLogMiddleware, logging_pipeline
+from app.core.prometheus import CONTENT_TYPE, generate_latest, multiprocess_collector
+from app.core.lazy import warm_up
+from app.utils.hashing import password_hasher
+from app.utils.security import calibrate_bcrypt_rounds, set_bcrypt_rounds
+from app.services.email_filter import maintain_email_filter
+from app.services.llm_client import llm_client
+from app.core.database import AsyncSessionLocal, async_engine, replica_router
+
+
+async def flush_metrics_periodically(interval: float) -> None:
+    """Write this worker's metrics snapshot for the other workers' /metrics"""
+    collector = multiprocess_collector()
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(collector.flush)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start worker pools on startup and release them on shutdown"""
+    logging_pipeline.start()
+    if settings.BCRYPT_AUTO_CALIBRATE:
+        rounds = await asyncio.to_thread(
+            calibrate_bcrypt_rounds,
+            settings.BCRYPT_TARGET_MS,
+            settings.BCRYPT_MIN_ROUNDS,
+            settings.BCRYPT_MAX_ROUNDS,
+        )
+        set_bcrypt_rounds(rounds)
+    password_hasher.start()
+    if settings.EMAIL_FILTER_ENABLED:
+        # Load the filter without delaying readiness; checks use the DB until then
+        app.state.email_filter_task = asyncio.create_task(
+            maintain_email_filter(
+                AsyncSessionLocal,
+                settings.EMAIL_FILTER_REFRESH_SECONDS,
+                settings.EMAIL_FILTER_REBUILD_SECONDS,
+            )
+        )
+    if settings.LAZY_IMPORT_WARMUP:
+        # Import heavy SDKs off the event loop once the worker is already serving
+        app.state.warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up))
+    if replica_router.replicas:
+        await replica_router.check()
+        app.state.replica_check_task = asyncio.create_task(
+            replica_router.run_health_checks(settings.REPLICA_HEALTH_CHECK_SECONDS)
+        )
+    if settings.METRICS_ENABLED and multiprocess_collector() is not None:
+        app.state.metrics_flush_task = asyncio.create_task(
+            flush_metrics_periodically(settings.METRICS_FLUSH_SECONDS)
+        )
+    yield
+    if getattr(app.state, "metrics_flush_task", None) is not None:
+        app.state.metrics_flush_task.cancel()
+        multiprocess_collector().flush()
+    if getattr(app.state, "replica_check_task", None) is not None:
+        app.state.replica_check_task.cancel()
+    if getattr(app.state, "email_filter_task", None) is not None:
+        app.state.email_filter_task.cancel()
+    password_hasher.shutdown()
+    await llm_client.aclose()
+    await async_engine.dispose()
+    await replica_router.dispose()
+    logging_pipeline.stop()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=os.getenv("APP_NAME", "EduGuard AI"),
     version=os.getenv("APP_VERSION", "0.1.0"),
     description="청소년을 위한 안전한 AI 학습 플랫폼",
+    lifespan=lifespan,
 )
 
-# CORS middleware configuration
+# Middleware added last runs first (outermost)
+
+# Rate limiting (rejects with 429 before any DB or bcrypt work)
+app.add_middleware(RateLimitMiddleware)
+
+# Per-request statement counts (QUERY_STATS_ENABLED)
+app.add_middleware(QueryStatsMiddleware)
+
+# Request IDs and access log lines
+app.add_middleware(RequestLogMiddleware)
+
+# Request metrics (outside the rate limiter, so rate-limited requests are counted too)
+app.add_middleware(MetricsMiddleware)
+
+# CORS middleware configuration (outermost, so 429s and other middleware
+# responses carry CORS headers and browsers can read them)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # TODO: Production에서는 특정 도메인만 허용
@@ -40,7 +129,7 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Detailed health check"""
+    """Detailed health check (internal stats: /api/v1/admin/stats)"""
     return {
         "status": "ok",
         "environment": os.getenv("ENVIRONMENT", "development"),
@@ -48,23 +137,30 @@ async def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint (all workers when METRICS_MULTIPROC_DIR is set)"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    body = await asyncio.to_thread(generate_latest)
+    return Response(content=body, media_type=CONTENT_TYPE)
+
+
 # Import and include API routers
-from app.api import auth_router
+from app.api import admin_router, auth_router, chat_router
 
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
+app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
+app.include_router(chat_router, prefix="/api/v1/chat", tags=["chat"])
 # TODO: Add other routers
-# from app.api import chat, safety
-# app.include_router(chat.router, prefix="/api/v1/chat", tags=["chat"])
+# Router modules are imported by every worker at startup: keep their
+# module-level imports light and load AI SDKs through app.core.lazy.lazy_import
+# from app.api import safety
 # app.include_router(safety.router, prefix="/api/v1/safety", tags=["safety"])
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    port = int(os.getenv("API_PORT", 8000))
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True if os.getenv("DEBUG", "False") == "True" else False,
-    )
+    # Production: gunicorn + uvicorn workers; DEBUG: single reloading process
+    from app.server import main
+
+    main()
@@ -0,0 +1,227 @@
+"""
+Local OpenAI-compatible model server
+오프라인 개발/테스트용 OpenAI 호환 스트리밍 모델 서버 (모의 응답)
+
+Answers POST .../chat/completions, both the OpenAI path (/v1/chat/completions)
+and the Azure one (/openai/deployments/{name}/chat/completions), by echoing
+the last user message word by word. The time to the first token and between
+tokens is configurable, so chat streaming latency can be measured without
+network access or API keys.
+
+Usage:
+    python -m app.mock_llm --port 8100 --first-token-ms 300 --token-ms 20
+    LLM_BASE_URL=http://127.0.0.1:8100/v1 python -m app.server
+
+Streams stop as soon as the caller disconnects; `stats` counts streams
+completed and cancelled and the tokens actually sent.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+# OpenAI and Azure OpenAI chat completions paths
+COMPLETIONS_PATH = re.compile(r"/(v1|openai/deployments/[^/]+)/chat/completions")
+
+
+def reply_tokens(prompt: str, count: int = 0) -> List[str]:
+    """
+    Words of the mock reply, each with its trailing space
+
+    Args:
+        prompt: Last user message
+        count: Exact number of tokens (repeating the reply), 0 = reply once
+
+    Returns:
+        list: Tokens in order
+    """
+    words = f"Echo: {prompt}".split() or ["Echo:"]
+    if count:
+        words = list(itertools.islice(itertools.cycle(words), count))
+    return [f"{word} " for word in words]
+
+
+class MockLLM:
+    """
+    ASGI app streaming chat completions in the OpenAI wire format
+
+    Args:
+        first_token_ms: Delay before the first token (prompt processing)
+        token_ms: Delay between later tokens
+        tokens: Tokens per reply (0 = echo the prompt once)
+    """
+
+    def __init__(self, first_token_ms: float = 200.0, token_ms: float = 20.0, tokens: int = 0):
+        self.first_token_ms = first_token_ms
+        self.token_ms = token_ms
+        self.tokens = tokens
+        self.stats = {"requests": 0, "completed": 0, "cancelled": 0, "tokens_sent": 0}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while (message := await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST" or not COMPLETIONS_PATH.fullmatch(scope["path"]):
+            await self._json(send, 404, {"error": {"message": "Not found"}})
+            return
+
+        raw = b""
+        while True:
+            message = await receive()
+            raw += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        try:
+            request = json.loads(raw)
+            prompt = [m["content"] for m in request["messages"] if m["role"] == "user"][-1]
+        except (ValueError, KeyError, IndexError, TypeError):
+            await self._json(send, 400, {"error": {"message": "Invalid chat request"}})
+            return
+
+        self.stats["requests"] += 1
+        tokens = reply_tokens(prompt, self.tokens)
+        finish_reason = "stop"
+        max_tokens = request.get("max_tokens")
+        if max_tokens and len(tokens) > max_tokens:
+            tokens, finish_reason = tokens[:max_tokens], "length"
+        model = request.get("model", "mock")
+
+        if not request.get("stream"):
+            await asyncio.sleep((self.first_token_ms + self.token_ms * len(tokens)) / 1000)
+            self.stats["completed"] += 1
+            self.stats["tokens_sent"] += len(tokens)
+            message = {"role": "assistant", "content": "".join(tokens)}
+            choice = {"index": 0, "message": message, "finish_reason": finish_reason}
+            await self._json(
+                send, 200, {"object": "chat.completion", "model": model, "choices": [choice]}
+            )
+            return
+        await self._stream(receive, send, model, tokens, finish_reason)
+
+    async def _stream(self, receive, send, model: str, tokens: List[str], finish_reason: str):
+        disconnected = asyncio.Event()
+
+        async def watch_disconnect() -> None:
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+
+        watcher = asyncio.create_task(watch_disconnect())
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                ],
+            }
+        )
+        try:
+            await self._event(send, model, {"role": "assistant"}, None)
+            for index, token in enumerate(tokens):
+                delay = self.first_token_ms if index == 0 else self.token_ms
+                try:
+                    await asyncio.wait_for(disconnected.wait(), delay / 1000)
+                except asyncio.TimeoutError:
+                    pass
+                if disconnected.is_set():
+                    self.stats["cancelled"] += 1
+                    return
+                await self._event(send, model, {"content": token}, None)
+                self.stats["tokens_sent"] += 1
+            await self._event(send, model, {}, finish_reason)
+            await send({"type": "http.response.body", "body": b"data: [DONE]\n\n"})
+            self.stats["completed"] += 1
+        finally:
+            watcher.cancel()
+
+    @staticmethod
+    async def _event(send, model: str, delta: Dict[str, Any], finish_reason) -> None:
+        chunk = {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        body = f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode()
+        await send({"type": "http.response.body", "body": body, "more_body": True})
+
+    @staticmethod
+    async def _json(send, status: int, content: Dict[str, Any]) -> None:
+        body = json.dumps(content, ensure_ascii=False).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+@contextmanager
+def serve_in_thread(app, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """
+    Run an ASGI app with uvicorn in a background thread (tests, benchmarks)
+
+    The app's lifespan is not run. Port 0 picks a free port.
+
+    Args:
+        app: ASGI application
+        host: Interface to bind
+        port: Port to bind
+
+    Yields:
+        str: Base URL of the running server
+    """
+    import uvicorn
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=host, port=port, lifespan="off", log_config=None)
+    )
+    thread = threading.Thread(target=server.run, name="uvicorn", daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError(f"Server failed to start on {host}:{port}")
+        time.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://{host}:{bound_port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--first-token-ms", type=float, default=200.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--tokens", type=int, default=0, help="Tokens per reply (0 = echo)")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    uvicorn.run(
+        MockLLM(args.first_token_ms, args.token_ms, args.tokens),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
@@ -3,5 +3,6 @@ Database models
 """
 
 from .user import User, ParentChildLink
+from .refresh_token import RefreshToken
 
-__all__ = ["User", "ParentChildLink"]
+__all__ = ["User", "ParentChildLink", "RefreshToken"]
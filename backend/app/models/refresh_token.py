@@ -0,0 +1,47 @@
+"""
+RefreshToken SQLAlchemy model
+기기별 리프레시 토큰 저장 모델
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class RefreshToken(Base):
+    """
+    Server-side refresh token record, one row per user device
+
+    Only HMAC digests of tokens are stored. Each refresh rotates the token in
+    place; the previous digest is kept so that replay of an already-rotated
+    token can be detected and the device session revoked.
+
+    Attributes:
+        id: Primary key
+        user_id: Foreign key to the token owner
+        device_id: Client-supplied device identifier
+        token_hash: HMAC-SHA256 digest of the current refresh token
+        previous_token_hash: Digest of the token that was rotated out last
+        expires_at: Expiration timestamp (slides forward on every refresh)
+        revoked_at: Revocation timestamp (NULL while active)
+        created_at: Session creation timestamp
+        last_used_at: Last successful refresh timestamp
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    device_id = Column(String(64), nullable=False)
+    token_hash = Column(String(64), unique=True, nullable=False, index=True)
+    previous_token_hash = Column(String(64), nullable=True, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_used_at = Column(DateTime(timezone=True), nullable=True)
+
+    # One session per device
+    __table_args__ = (UniqueConstraint("user_id", "device_id", name="uq_user_device"),)
+
+    def __repr__(self) -> str:
+        return f"<RefreshToken(user_id={self.user_id}, device_id='{self.device_id}')>"
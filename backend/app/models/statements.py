@@ -0,0 +1,51 @@
+"""
+Prebuilt statements for hot lookups
+자주 실행되는 조회 쿼리를 모듈 로드 시 한 번만 생성 (바인드 파라미터 사용)
+
+Building a select() per request costs Python time twice: constructing the
+statement objects, then deriving the cache key SQLAlchemy uses to find the
+compiled SQL. These statements are built once with named bind parameters;
+their cache keys are memoized on the objects, so executing them goes
+straight to the compiled-SQL cache. Values are passed at execution time:
+
+    user = (await db.execute(USER_BY_ID, {"user_id": user_id})).scalar_one_or_none()
+
+On PostgreSQL, asyncpg additionally keeps each connection's statements
+prepared server-side (DATABASE_STATEMENT_CACHE_SIZE), so the identical SQL
+text produced here is parsed and planned once per connection.
+
+Only statements whose shape never changes belong here; queries with
+variable-length IN lists or per-request ordering are built per call.
+"""
+
+from sqlalchemy import bindparam, or_, select
+
+from .refresh_token import RefreshToken
+from .user import ParentChildLink, User
+
+# Authenticated user lookup (get_current_user, user cache misses)
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
+# Login: emails are stored lower-cased, so pass the normalized email
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+# Email availability and signup (emails are stored lower-cased)
+USER_ID_BY_EMAIL = select(User.id).where(User.email == bindparam("email"))
+
+# Link between a parent and one child (unlink)
+LINK_BY_PAIR = select(ParentChildLink).where(
+    ParentChildLink.parent_id == bindparam("parent_id"),
+    ParentChildLink.child_id == bindparam("child_id"),
+)
+
+# Refresh session and its user by current or previous token hash (/refresh)
+REFRESH_TOKEN_WITH_USER = (
+    select(RefreshToken, User)
+    .join(User, User.id == RefreshToken.user_id)
+    .where(
+        or_(
+            RefreshToken.token_hash == bindparam("digest"),
+            RefreshToken.previous_token_hash == bindparam("digest"),
+        )
+    )
+)
@@ -3,7 +3,7 @@ User and ParentChildLink SQLAlchemy models
 사용자 및 부모-자녀 연동 데이터베이스 모델
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -37,6 +37,10 @@ class User(Base):
         nullable=False,
     )
 
+    # Emails are stored lower-cased; this also rejects case variants written
+    # by anything that bypasses the schemas
+    __table_args__ = (Index("ix_users_email_lower", func.lower(email), unique=True),)
+
     # Relationships
     # Children linked to this parent
     children = relationship(
@@ -84,8 +88,12 @@ class ParentChildLink(Base):
     child_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     linked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    # Add unique constraint to prevent duplicate links
-    __table_args__ = (UniqueConstraint("parent_id", "child_id", name="uq_parent_child"),)
+    # Unique pair (also the index for lookups by parent) and the child-side
+    # index covering lookups by child (User.parents, cascades from users)
+    __table_args__ = (
+        UniqueConstraint("parent_id", "child_id", name="uq_parent_child"),
+        Index("ix_parent_child_links_child_id", "child_id", "parent_id"),
+    )
 
     # Relationships
     parent = relationship("User", foreign_keys=[parent_id])
@@ -9,9 +9,17 @@ from .user import (
     UserResponse,
     UserUpdate,
     TokenResponse,
+    RefreshTokenRequest,
     ParentChildLinkCreate,
     ParentChildLinkResponse,
+    BulkSignupItemResult,
+    BulkSignupResponse,
+    BulkLinkRequest,
+    BulkLinkItemResult,
+    BulkLinkResponse,
+    EmailAvailabilityResponse,
 )
+from .chat import ChatMessage, ChatRequest
 
 __all__ = [
     "UserBase",
@@ -20,6 +28,15 @@ __all__ = [
     "UserResponse",
     "UserUpdate",
     "TokenResponse",
+    "RefreshTokenRequest",
     "ParentChildLinkCreate",
     "ParentChildLinkResponse",
+    "BulkSignupItemResult",
+    "BulkSignupResponse",
+    "BulkLinkRequest",
+    "BulkLinkItemResult",
+    "BulkLinkResponse",
+    "EmailAvailabilityResponse",
+    "ChatMessage",
+    "ChatRequest",
 ]
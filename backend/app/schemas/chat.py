@@ -0,0 +1,35 @@
+"""
+Pydantic schemas for chat requests
+채팅 요청 검증 스키마
+"""
+
+from pydantic import BaseModel, Field, field_validator
+from typing import Literal
+
+
+class ChatMessage(BaseModel):
+    """One message of the conversation so far"""
+
+    role: Literal["user", "assistant"] = Field(..., description="Message author")
+    content: str = Field(..., min_length=1, max_length=4000, description="Message text")
+
+
+class ChatRequest(BaseModel):
+    """
+    Schema for a streamed chat turn
+
+    The system prompt is added by the server; clients send only user and
+    assistant messages, ending with the user's new message.
+    """
+
+    messages: list[ChatMessage] = Field(
+        ..., min_length=1, max_length=50, description="Conversation, oldest first"
+    )
+
+    @field_validator("messages")
+    @classmethod
+    def validate_last_message(cls, v: list[ChatMessage]) -> list[ChatMessage]:
+        """Ensure the conversation ends with a user message"""
+        if v[-1].role != "user":
+            raise ValueError("The last message must be from the user")
+        return v
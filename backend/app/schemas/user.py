@@ -12,9 +12,15 @@ import re
 class UserBase(BaseModel):
     """Base user schema with common fields"""
 
-    email: EmailStr = Field(..., description="User email address")
+    email: EmailStr = Field(..., description="User email address (stored lower-cased)")
     role: Literal["parent", "child"] = Field(..., description="User role: parent or child")
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Lower-case the email (addresses are unique regardless of case)"""
+        return v.lower()
+
 
 class UserCreate(UserBase):
     """
@@ -30,6 +36,9 @@ class UserCreate(UserBase):
         min_length=8,
         description="Password (minimum 8 characters, must contain letters and numbers)",
     )
+    device_id: Optional[str] = Field(
+        None, max_length=64, description="Device identifier for the refresh token session"
+    )
 
     @field_validator("password")
     @classmethod
@@ -48,8 +57,17 @@ class UserCreate(UserBase):
 class UserLogin(BaseModel):
     """Schema for user login"""
 
-    email: EmailStr = Field(..., description="User email address")
+    email: EmailStr = Field(..., description="User email address (any case)")
     password: str = Field(..., description="User password")
+    device_id: Optional[str] = Field(
+        None, max_length=64, description="Device identifier for the refresh token session"
+    )
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Lower-case the email to match the stored address"""
+        return v.lower()
 
 
 class UserUpdate(BaseModel):
@@ -65,6 +83,12 @@ class UserUpdate(BaseModel):
         description="New password (minimum 8 characters)",
     )
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: Optional[str]) -> Optional[str]:
+        """Lower-case the new email if provided"""
+        return v.lower() if v is not None else v
+
     @field_validator("password")
     @classmethod
     def validate_password_strength(cls, v: Optional[str]) -> Optional[str]:
@@ -99,6 +123,18 @@ class TokenResponse(BaseModel):
     token_type: str = Field(default="bearer", description="Token type")
     expires_in: int = Field(..., description="Token expiration time in seconds")
     user: UserResponse = Field(..., description="User information")
+    refresh_token: Optional[str] = Field(
+        None, description="Opaque refresh token (rotated on every use)"
+    )
+    refresh_expires_in: Optional[int] = Field(
+        None, description="Refresh token expiration time in seconds"
+    )
+
+
+class RefreshTokenRequest(BaseModel):
+    """Schema for refreshing or revoking a session"""
+
+    refresh_token: str = Field(..., min_length=1, description="Refresh token")
 
 
 class ParentChildLinkCreate(BaseModel):
@@ -134,6 +170,71 @@ class ChildListResponse(BaseModel):
     max_allowed: int = Field(default=3, description="Maximum allowed children links")
 
 
+class BulkSignupItemResult(BaseModel):
+    """Per-row outcome of a bulk signup"""
+
+    index: int = Field(..., description="Zero-based row index in the request")
+    email: Optional[str] = Field(None, description="Email of the row, if present")
+    status: Literal["created", "duplicate", "invalid"] = Field(
+        ..., description="Row outcome"
+    )
+    user_id: Optional[int] = Field(None, description="Created user ID")
+    linked: bool = Field(False, description="Whether the created child was linked to the parent")
+    error: Optional[str] = Field(None, description="Reason the row was not created")
+
+
+class BulkSignupResponse(BaseModel):
+    """Schema for bulk signup results"""
+
+    results: list[BulkSignupItemResult] = Field(
+        default_factory=list, description="Per-row results in request order"
+    )
+    total: int = Field(..., description="Number of rows received")
+    created: int = Field(..., description="Number of users created")
+    linked: int = Field(0, description="Number of created users linked to the parent")
+    failed: int = Field(..., description="Number of rows not created")
+
+
+class BulkLinkRequest(BaseModel):
+    """Schema for linking several children at once"""
+
+    child_ids: list[int] = Field(
+        ..., min_length=1, max_length=50, description="Child user IDs to link, in priority order"
+    )
+
+    @field_validator("child_ids")
+    @classmethod
+    def validate_positive(cls, v: list[int]) -> list[int]:
+        """Ensure every child ID is a positive integer"""
+        if any(child_id <= 0 for child_id in v):
+            raise ValueError("Child IDs must be positive integers")
+        return v
+
+
+class BulkLinkItemResult(BaseModel):
+    """Per-item outcome of a bulk link"""
+
+    index: int = Field(..., description="Zero-based position in the request")
+    child_id: int = Field(..., description="Requested child user ID")
+    status: Literal["linked", "duplicate", "invalid", "not_found", "limit_exceeded"] = Field(
+        ..., description="Item outcome"
+    )
+    link_id: Optional[int] = Field(None, description="Created link ID")
+    linked_at: Optional[datetime] = Field(None, description="Link creation timestamp")
+    error: Optional[str] = Field(None, description="Reason the child was not linked")
+
+
+class BulkLinkResponse(BaseModel):
+    """Schema for bulk link results"""
+
+    results: list[BulkLinkItemResult] = Field(
+        default_factory=list, description="Per-item results in request order"
+    )
+    total: int = Field(..., description="Number of child IDs received")
+    linked: int = Field(..., description="Number of links created")
+    failed: int = Field(..., description="Number of child IDs not linked")
+
+
 class ErrorResponse(BaseModel):
     """Schema for error responses"""
 
@@ -141,6 +242,13 @@ class ErrorResponse(BaseModel):
     error_code: Optional[str] = Field(None, description="Error code for client handling")
 
 
+class EmailAvailabilityResponse(BaseModel):
+    """Schema for email availability checks"""
+
+    email: EmailStr = Field(..., description="Checked email address")
+    available: bool = Field(..., description="True if the email can be registered")
+
+
 class SuccessResponse(BaseModel):
     """Schema for generic success responses"""
 
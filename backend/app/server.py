@@ -0,0 +1,129 @@
+"""
+Production server launcher
+Gunicorn + Uvicorn 워커 기반 프로덕션 서버 실행 진입점
+
+Usage:
+    python -m app.server            # gunicorn with uvicorn workers (DEBUG: uvicorn --reload)
+    python -m app.server --print-config
+
+Workers are sized from the CPUs this process may actually use (affinity
+and cgroup quota), the app is preloaded in the master, and workers are
+recycled after WEB_MAX_REQUESTS requests. See gunicorn.conf.py for the
+server hooks and docs/PRODUCTION_SERVER.md for reloads and measurements.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+from .core.config import settings
+
+# gunicorn.conf.py lives next to the app package
+GUNICORN_CONFIG = str(Path(__file__).resolve().parent.parent / "gunicorn.conf.py")
+
+# Cgroup v2 CPU limit ("<quota> <period>" or "max <period>")
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+
+def _cgroup_cpu_limit(path: str = CGROUP_CPU_MAX) -> Optional[int]:
+    try:
+        with open(path) as handle:
+            quota, period = handle.read().split()[:2]
+    except (OSError, ValueError):
+        return None
+    if quota == "max":
+        return None
+    return max(1, math.ceil(int(quota) / int(period)))
+
+
+def available_cpus() -> int:
+    """
+    CPUs this process can use
+
+    Takes the smaller of the scheduler affinity mask and the container's
+    cgroup CPU quota, so a 2-CPU container on a 64-core host reports 2.
+
+    Returns:
+        int: Usable CPU count (at least 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, limit)
+    return max(1, cpus)
+
+
+def worker_count() -> int:
+    """
+    Number of server workers (WEB_WORKERS, or one per usable CPU)
+
+    Each worker runs its own event loop, so one per core keeps every core
+    busy without the workers competing for CPU.
+    """
+    return settings.WEB_WORKERS or available_cpus()
+
+
+def hashing_workers_per_server_worker(workers: int) -> int:
+    """
+    bcrypt pool size for each server worker
+
+    Every server worker owns a hashing pool. With PASSWORD_HASH_WORKERS=0
+    ("one per core") the pools would add up to workers x cores processes,
+    so the cores are split between the server workers instead.
+    """
+    if settings.PASSWORD_HASH_WORKERS:
+        return settings.PASSWORD_HASH_WORKERS
+    return max(1, available_cpus() // workers)
+
+
+def server_config() -> dict:
+    """Resolved launcher settings (also printed by --print-config)"""
+    workers = worker_count()
+    return {
+        "bind": f"0.0.0.0:{settings.API_PORT}",
+        "workers": workers,
+        "password_hash_workers": hashing_workers_per_server_worker(workers),
+        "max_requests": settings.WEB_MAX_REQUESTS,
+        "max_requests_jitter": settings.WEB_MAX_REQUESTS_JITTER,
+        "timeout": settings.WEB_TIMEOUT,
+        "graceful_timeout": settings.WEB_GRACEFUL_TIMEOUT,
+        "keepalive": settings.WEB_KEEPALIVE,
+        "available_cpus": available_cpus(),
+    }
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the EduGuard AI API server")
+    parser.add_argument(
+        "--print-config", action="store_true", help="Print the resolved settings and exit"
+    )
+    args = parser.parse_args(argv)
+
+    if args.print_config:
+        print(json.dumps(server_config(), indent=2))
+        return
+
+    if settings.DEBUG:
+        # Single auto-reloading process for local development
+        import uvicorn
+
+        uvicorn.run("app.main:app", host="0.0.0.0", port=settings.API_PORT, reload=True)
+        return
+
+    # Replace this process with the gunicorn master so it receives signals
+    # (HUP/USR2/TERM) directly from the process supervisor
+    os.execvp(
+        sys.executable,
+        [sys.executable, "-m", "gunicorn", "--config", GUNICORN_CONFIG, "app.main:app"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""
+Business logic services
+"""
+
+from .user_cache import UserSnapshot, UserCache, user_cache
+
+__all__ = ["UserSnapshot", "UserCache", "user_cache"]
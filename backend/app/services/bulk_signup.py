@@ -0,0 +1,272 @@
+"""
+Bulk signup service
+부모 계정의 자녀 대량 회원가입 처리 (검증 → 병렬 해싱 → 다중 행 INSERT → 연동)
+"""
+
+import codecs
+import csv
+import io
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.database import dialect_insert
+from ..models.user import ParentChildLink, User
+from ..schemas.user import BulkSignupItemResult, BulkSignupResponse, UserCreate
+from ..utils.hashing import password_hasher
+from .child_links import free_link_slots, lock_parent
+from .email_filter import email_filter
+from .user_cache import user_cache
+
+# Bulk signup only creates child accounts, linked to the requesting parent
+BULK_ROLE = "child"
+
+
+class BulkSignupLimitError(Exception):
+    """Raised when a bulk request exceeds BULK_SIGNUP_MAX_ROWS"""
+
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    field = ".".join(str(part) for part in first.get("loc", ())) or "row"
+    return f"{field}: {first.get('msg', 'invalid value')}"
+
+
+class BulkSignup:
+    """
+    Creates child accounts in batches and links as many as allowed to the parent
+
+    Each batch is validated with UserCreate, checked for duplicates with one
+    IN query and hashed in parallel on the password pool. No transaction is
+    open while hashing: finish() then inserts every batch with a multi-row
+    INSERT ... ON CONFLICT DO NOTHING RETURNING, links the first new
+    children to the parent while it has free link slots (MAX_LINKED_CHILDREN)
+    and commits once, so nothing is visible before the commit. Account
+    creation is not limited by the link slots; the rest stay unlinked.
+
+    Usage:
+        bulk = BulkSignup(db, parent.id, batch_size=500, max_rows=10000)
+        for row in rows:
+            await bulk.add(row)
+        response = await bulk.finish()
+
+    Args:
+        db: Async database session
+        parent_id: Requesting parent's user ID (new children are linked to it while slots remain)
+        batch_size: Rows per INSERT statement
+        max_rows: Maximum rows accepted in one request
+    """
+
+    def __init__(self, db: AsyncSession, parent_id: int, batch_size: int, max_rows: int):
+        self.db = db
+        self.parent_id = parent_id
+        self.batch_size = batch_size
+        self.max_rows = max_rows
+        self.results: List[Optional[BulkSignupItemResult]] = []
+        self._pending: List[Tuple[int, Dict[str, Any]]] = []
+        self._hashed: List[Tuple[int, str, str]] = []
+        self._seen_emails: Set[str] = set()
+
+    async def add(self, raw: Dict[str, Any]) -> None:
+        """
+        Queue one row, hashing a batch when it is full
+
+        Raises:
+            BulkSignupLimitError: If more than max_rows rows are added
+        """
+        if len(self.results) >= self.max_rows:
+            raise BulkSignupLimitError(
+                f"Bulk signup is limited to {self.max_rows} rows per request"
+            )
+        index = len(self.results)
+        self.results.append(None)
+        self._pending.append((index, raw))
+        if len(self._pending) >= self.batch_size:
+            await self._prepare()
+
+    async def finish(self) -> BulkSignupResponse:
+        """Insert and link the hashed rows in one transaction and build the response"""
+        await self._prepare()
+        await self._insert()
+
+        results = [result for result in self.results if result is not None]
+        created = sum(1 for result in results if result.status == "created")
+        return BulkSignupResponse(
+            results=results,
+            total=len(results),
+            created=created,
+            linked=sum(1 for result in results if result.linked),
+            failed=len(results) - created,
+        )
+
+    def _reject(self, index: int, email: Optional[str], status: str, error: str) -> None:
+        self.results[index] = BulkSignupItemResult(
+            index=index, email=email, status=status, error=error
+        )
+
+    async def _prepare(self) -> None:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Step 1: Validate rows and drop duplicates within the request
+        valid: List[Tuple[int, UserCreate]] = []
+        for index, raw in batch:
+            email = raw.get("email") if isinstance(raw, dict) else None
+            try:
+                user_data = UserCreate.model_validate(
+                    {"role": BULK_ROLE, **raw} if isinstance(raw, dict) else raw
+                )
+            except ValidationError as e:
+                self._reject(index, email, "invalid", _validation_message(e))
+                continue
+            if user_data.role != BULK_ROLE:
+                self._reject(
+                    index, user_data.email, "invalid", "Bulk signup only creates child accounts"
+                )
+                continue
+            if user_data.email in self._seen_emails:
+                self._reject(index, user_data.email, "duplicate", "Duplicate email in request")
+                continue
+            self._seen_emails.add(user_data.email)
+            valid.append((index, user_data))
+        if not valid:
+            return
+
+        # Step 2: Find already registered emails with one IN query
+        result = await self.db.execute(
+            select(User.email).where(User.email.in_([u.email for _, u in valid]))
+        )
+        existing = set(result.scalars().all())
+        # End the read transaction so no connection is held while hashing
+        await self.db.rollback()
+        new_rows: List[Tuple[int, UserCreate]] = []
+        for index, user_data in valid:
+            if user_data.email in existing:
+                self._reject(index, user_data.email, "duplicate", "Email already registered")
+            else:
+                new_rows.append((index, user_data))
+        if not new_rows:
+            return
+
+        # Step 3: Hash passwords in parallel across the pool's workers
+        hashes = await password_hasher.hash_many([u.password for _, u in new_rows])
+        self._hashed.extend(
+            (index, u.email, hashed) for (index, u), hashed in zip(new_rows, hashes)
+        )
+
+    async def _insert(self) -> None:
+        rows = self._hashed
+        if not rows:
+            return
+
+        # Step 4: Insert the users in batches of multi-row statements
+        inserted: Dict[str, int] = {}
+        for start in range(0, len(rows), self.batch_size):
+            stmt = (
+                dialect_insert(self.db, User)
+                .values(
+                    [
+                        {"email": email, "password_hash": hashed, "role": BULK_ROLE}
+                        for _, email, hashed in rows[start:start + self.batch_size]
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(User.id, User.email)
+            )
+            inserted.update(
+                (email, user_id) for user_id, email in (await self.db.execute(stmt)).all()
+            )
+
+        # Step 5: Link new children in row order while the parent has free slots
+        linked: Set[int] = set()
+        if inserted:
+            await lock_parent(self.db, self.parent_id)
+            free_slots = await free_link_slots(self.db, self.parent_id)
+            new_ids = [inserted[email] for _, email, _ in rows if email in inserted]
+            linked = set(new_ids[:free_slots])
+        if linked:
+            await self.db.execute(
+                dialect_insert(self.db, ParentChildLink).values(
+                    [{"parent_id": self.parent_id, "child_id": user_id} for user_id in linked]
+                )
+            )
+        await self.db.commit()
+        email_filter.add_many(inserted)
+        # Core inserts bypass the session listeners, so invalidate explicitly
+        if linked:
+            await user_cache.invalidate_async([self.parent_id])
+
+        for index, email, _ in rows:
+            user_id = inserted.get(email)
+            if user_id is None:
+                # Registered concurrently by another request
+                self._reject(index, email, "duplicate", "Email already registered")
+            else:
+                self.results[index] = BulkSignupItemResult(
+                    index=index,
+                    email=email,
+                    status="created",
+                    user_id=user_id,
+                    linked=user_id in linked,
+                )
+
+
+def _row_dict(header: List[str], row: List[str]) -> Dict[str, str]:
+    # Empty cells are omitted so defaults (e.g. role) apply
+    return {key: value.strip() for key, value in zip(header, row) if value.strip()}
+
+
+def _complete_records_end(text: str) -> int:
+    """Return the offset just past the last newline that is outside quotes"""
+    end = start = quotes = 0
+    position = text.find("\n")
+    while position != -1:
+        # Escaped quotes ("") come in pairs, so an odd count = inside a quoted field
+        quotes += text.count('"', start, position)
+        start = position + 1
+        if quotes % 2 == 0:
+            end = start
+        position = text.find("\n", start)
+    return end
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Dict[str, str]]:
+    """
+    Parse a streamed UTF-8 CSV body (with header row) into dicts
+
+    Rows are yielded as soon as their record has been received, so the whole
+    upload is never held in memory. Quoted fields may contain newlines.
+
+    Args:
+        chunks: Raw body chunks (e.g. request.stream())
+
+    Yields:
+        Dict[str, str]: Row keyed by lower-cased header names (empty cells omitted)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    header: Optional[List[str]] = None
+    buffer = ""
+
+    def parse(text: str) -> List[List[str]]:
+        reader = csv.reader(io.StringIO(text, newline=""))
+        return [row for row in reader if any(cell.strip() for cell in row)]
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        end = _complete_records_end(buffer)
+        records, buffer = buffer[:end], buffer[end:]
+        for row in parse(records):
+            if header is None:
+                header = [name.strip().lower() for name in row]
+                continue
+            yield _row_dict(header, row)
+
+    buffer += decoder.decode(b"", final=True)
+    for row in parse(buffer):
+        if header is None:
+            header = [name.strip().lower() for name in row]
+            continue
+        yield _row_dict(header, row)
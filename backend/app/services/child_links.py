@@ -0,0 +1,187 @@
+"""
+Parent-child link service
+부모-자녀 계정 연동 처리 (조건부 단일 INSERT로 최대 연동 수와 중복을 원자적으로 검증)
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import Integer, and_, case, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.database import dialect_insert
+from ..models.user import ParentChildLink, User
+from ..schemas.user import BulkLinkItemResult, BulkLinkResponse
+from .user_cache import user_cache
+
+# Maximum number of children a parent can link
+MAX_LINKED_CHILDREN = 3
+
+LINK_LIMIT_MESSAGE = (
+    f"Maximum of {MAX_LINKED_CHILDREN} children can be linked. "
+    "Please unlink a child before adding a new one."
+)
+
+
+async def lock_parent(db: AsyncSession, parent_id: int) -> None:
+    """
+    Serialize link creation per parent
+
+    On PostgreSQL the parent row is locked with SELECT ... FOR UPDATE, so the
+    following INSERT (a new statement, hence a fresh snapshot) sees every
+    link committed by a competing request. SQLite needs no extra step: the
+    INSERT takes the database write lock before it evaluates its SELECT.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        await db.execute(select(User.id).where(User.id == parent_id).with_for_update())
+
+
+async def free_link_slots(db: AsyncSession, parent_id: int) -> int:
+    """Return how many more children the parent can link"""
+    linked = await db.scalar(
+        select(func.count())
+        .select_from(ParentChildLink)
+        .where(ParentChildLink.parent_id == parent_id)
+    )
+    return max(MAX_LINKED_CHILDREN - linked, 0)
+
+
+def _conditional_insert(db: AsyncSession, parent_id: int, child_ids: List[int]):
+    """
+    Build INSERT ... SELECT that only links valid children while slots remain
+
+    Rows come from the users table (so unknown IDs and non-child accounts are
+    skipped), in request order, limited to the free slots left under
+    MAX_LINKED_CHILDREN; ON CONFLICT DO NOTHING drops existing links.
+    """
+    linked_count = (
+        select(func.count())
+        .select_from(ParentChildLink)
+        .where(ParentChildLink.parent_id == parent_id)
+        .scalar_subquery()
+    )
+    free_slots = case(
+        (linked_count < MAX_LINKED_CHILDREN, MAX_LINKED_CHILDREN - linked_count),
+        else_=0,
+    )
+    already_linked = (
+        select(ParentChildLink.id)
+        .where(
+            ParentChildLink.parent_id == parent_id,
+            ParentChildLink.child_id == User.id,
+        )
+        .exists()
+    )
+    position = case({child_id: index for index, child_id in enumerate(child_ids)}, value=User.id)
+    candidates = (
+        select(literal(parent_id, Integer), User.id)
+        .where(User.id.in_(child_ids), User.role == "child", ~already_linked)
+        .order_by(position)
+        .limit(free_slots)
+    )
+    return (
+        dialect_insert(db, ParentChildLink)
+        .from_select(["parent_id", "child_id"], candidates)
+        .on_conflict_do_nothing(index_elements=["parent_id", "child_id"])
+        .returning(ParentChildLink.id, ParentChildLink.child_id, ParentChildLink.linked_at)
+    )
+
+
+async def link_children(
+    db: AsyncSession, parent_id: int, child_ids: List[int]
+) -> BulkLinkResponse:
+    """
+    Link one or more children to a parent in one transaction and commit
+
+    The 3-child limit, role check and duplicate rule are enforced by a single
+    conditional INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING, so
+    concurrent requests for the same parent cannot exceed the limit. Items
+    that were not inserted are classified afterwards with one IN query.
+    Requested children are accepted in order until the limit is reached.
+
+    Args:
+        db: Async database session
+        parent_id: Parent user ID (from the access token)
+        child_ids: Child user IDs to link, in priority order
+
+    Returns:
+        BulkLinkResponse: Per-item outcome in request order
+    """
+    results: List[Optional[BulkLinkItemResult]] = [None] * len(child_ids)
+
+    def reject(index: int, status: str, error: str) -> None:
+        results[index] = BulkLinkItemResult(
+            index=index, child_id=child_ids[index], status=status, error=error
+        )
+
+    # Step 1: Reject self links and repeats within the request
+    candidates: Dict[int, int] = {}
+    for index, child_id in enumerate(child_ids):
+        if child_id == parent_id:
+            reject(index, "invalid", "Cannot link to yourself")
+        elif child_id in candidates:
+            reject(index, "duplicate", "Duplicate child ID in request")
+        else:
+            candidates[child_id] = index
+
+    # Step 2: Insert every allowed link with one conditional statement
+    inserted: Dict[int, tuple] = {}
+    if candidates:
+        await lock_parent(db, parent_id)
+        stmt = _conditional_insert(db, parent_id, list(candidates))
+        inserted = {row[1]: row for row in (await db.execute(stmt)).all()}
+
+    # Step 3: Explain the items that were not inserted with one IN query
+    missing = [child_id for child_id in candidates if child_id not in inserted]
+    if missing:
+        rows = (
+            await db.execute(
+                select(User.id, User.role, ParentChildLink.id)
+                .outerjoin(
+                    ParentChildLink,
+                    and_(
+                        ParentChildLink.child_id == User.id,
+                        ParentChildLink.parent_id == parent_id,
+                    ),
+                )
+                .where(User.id.in_(missing))
+            )
+        ).all()
+        found = {row[0]: row for row in rows}
+        for child_id in missing:
+            index = candidates[child_id]
+            if child_id not in found:
+                reject(index, "not_found", f"Child user with ID {child_id} not found")
+            elif found[child_id][1] != "child":
+                reject(
+                    index,
+                    "invalid",
+                    f"User {child_id} is not a child account. Only child accounts can be linked.",
+                )
+            elif found[child_id][2] is not None:
+                reject(index, "duplicate", f"Child {child_id} is already linked to your account")
+            else:
+                reject(index, "limit_exceeded", LINK_LIMIT_MESSAGE)
+
+    await db.commit()
+
+    for child_id, (link_id, _, linked_at) in inserted.items():
+        index = candidates[child_id]
+        results[index] = BulkLinkItemResult(
+            index=index,
+            child_id=child_id,
+            status="linked",
+            link_id=link_id,
+            linked_at=linked_at,
+        )
+
+    # Core inserts bypass the session listeners, so invalidate explicitly
+    if inserted:
+        await user_cache.invalidate_async([parent_id, *inserted])
+
+    linked = len(inserted)
+    return BulkLinkResponse(
+        results=results,
+        total=len(results),
+        linked=linked,
+        failed=len(results) - linked,
+    )
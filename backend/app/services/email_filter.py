@@ -0,0 +1,233 @@
+"""
+Registered email filter
+가입된 이메일 확률적 필터 (음성은 DB 조회 없이 즉시 응답)
+"""
+
+import asyncio
+import logging
+import time
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.statements import USER_ID_BY_EMAIL
+from ..models.user import User
+from ..utils.bloom import ScalableBloomFilter
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip while rebuilding from the users table
+REBUILD_BATCH_SIZE = 10000
+
+
+class EmailFilter:
+    """
+    Bloom filter of registered emails in front of the users table
+
+    A negative answer is definitive (the email was never added), so
+    availability checks only reach the database on possible positives.
+    The filter is rebuilt from `users` in the background after startup and
+    updated by signup in this process; until the first rebuild succeeds
+    every check goes to the database.
+
+    Emails registered through another worker (or a script) are picked up
+    by `refresh`, which loads users with an ID above the highest one seen
+    so far, and everything else (changed emails, IDs committed out of
+    order) by the next full rebuild. Between two refreshes a check may
+    report "available" and the signup still fail with 400; signup itself
+    stays authoritative.
+
+    Args:
+        capacity: Expected number of registered emails
+        error_rate: Target false-positive probability
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bloom = ScalableBloomFilter(capacity, error_rate)
+        self.ready = False
+        self.checks = 0
+        self.db_checks = 0
+        self.false_positives = 0
+        self.rebuild_seconds = 0.0
+        self.last_user_id = 0
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Load every registered email into a fresh filter
+
+        Args:
+            db: Async database session
+
+        Returns:
+            int: Number of emails loaded
+        """
+        started = time.perf_counter()
+        bloom = ScalableBloomFilter(self.capacity, self.error_rate)
+        last_user_id = await self._load(db, bloom, 0)
+        self.bloom = bloom
+        self.last_user_id = last_user_id
+        self.ready = True
+        # Catch signups committed while the scan was streaming
+        await self.refresh(db)
+        self.rebuild_seconds = time.perf_counter() - started
+        return len(bloom)
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """
+        Add users registered since the last rebuild or refresh
+
+        Args:
+            db: Async database session
+
+        Returns:
+            int: Number of emails added
+        """
+        if not self.ready:
+            return await self.rebuild(db)
+        before = len(self.bloom)
+        self.last_user_id = await self._load(db, self.bloom, self.last_user_id)
+        return len(self.bloom) - before
+
+    @staticmethod
+    async def _load(db: AsyncSession, bloom: ScalableBloomFilter, after_id: int) -> int:
+        """Add emails of users with an ID above after_id; return the highest ID seen"""
+        result = await db.stream(
+            select(User.id, User.email)
+            .where(User.id > after_id)
+            .order_by(User.id)
+            .execution_options(yield_per=REBUILD_BATCH_SIZE)
+        )
+        last_id = after_id
+        async for user_id, email in result:
+            bloom.add(email)
+            last_id = user_id
+        return last_id
+
+    def clear(self) -> None:
+        """Drop all emails and counters (checks use the database until the next rebuild)"""
+        self.bloom = ScalableBloomFilter(self.capacity, self.error_rate)
+        self.ready = False
+        self.last_user_id = 0
+        self.checks = self.db_checks = self.false_positives = 0
+
+    def add(self, email: str) -> None:
+        """Record a newly registered email"""
+        self.bloom.add(email)
+
+    def add_many(self, emails: Iterable[str]) -> None:
+        """Record several newly registered emails"""
+        for email in emails:
+            self.bloom.add(email)
+
+    def might_exist(self, email: str) -> bool:
+        """False only if the email is definitely not registered"""
+        return not self.ready or email in self.bloom
+
+    async def is_available(self, db: AsyncSession, email: str) -> bool:
+        """
+        Check whether an email can still be registered
+
+        Args:
+            db: Async database session (used on possible positives only)
+            email: Normalized email address
+
+        Returns:
+            bool: True if no user has this email
+        """
+        self.checks += 1
+        if settings.EMAIL_FILTER_ENABLED and not self.might_exist(email):
+            return True
+
+        self.db_checks += 1
+        exists = await db.scalar(USER_ID_BY_EMAIL, {"email": email}) is not None
+        if not exists and self.ready:
+            self.false_positives += 1
+        return not exists
+
+    def stats(self) -> dict:
+        """Filter size and hit statistics for monitoring"""
+        return {
+            "ready": self.ready,
+            "emails": len(self.bloom),
+            "memory_bytes": self.bloom.memory_bytes,
+            "checks": self.checks,
+            "db_checks": self.db_checks,
+            "false_positives": self.false_positives,
+            "rebuild_ms": round(self.rebuild_seconds * 1000, 1),
+            "last_user_id": self.last_user_id,
+        }
+
+
+# Global email filter
+email_filter = EmailFilter(
+    capacity=settings.EMAIL_FILTER_CAPACITY,
+    error_rate=settings.EMAIL_FILTER_ERROR_RATE,
+)
+
+
+async def rebuild_email_filter(session_factory) -> None:
+    """
+    Rebuild the global filter, logging instead of failing
+
+    Args:
+        session_factory: Async session factory (e.g. AsyncSessionLocal)
+    """
+    if not settings.EMAIL_FILTER_ENABLED:
+        return
+    try:
+        async with session_factory() as db:
+            count = await email_filter.rebuild(db)
+        logger.info("Email filter loaded %d emails", count)
+    except Exception:
+        logger.exception("Email filter rebuild failed; availability checks will use the database")
+
+
+async def refresh_email_filter_periodically(
+    session_factory, interval: float, rebuild_interval: float
+) -> None:
+    """
+    Keep the global filter in step with signups on other workers
+
+    Adds new users every `interval` seconds and rebuilds the whole filter
+    every `rebuild_interval` seconds (0 = never), until cancelled.
+
+    Args:
+        session_factory: Async session factory (e.g. AsyncSessionLocal)
+        interval: Seconds between incremental refreshes
+        rebuild_interval: Seconds between full rebuilds
+    """
+    last_rebuild = time.monotonic()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_factory() as db:
+                if rebuild_interval and time.monotonic() - last_rebuild >= rebuild_interval:
+                    await email_filter.rebuild(db)
+                    last_rebuild = time.monotonic()
+                else:
+                    await email_filter.refresh(db)
+        except Exception:
+            logger.exception("Email filter refresh failed; retrying in %.0fs", interval)
+
+
+async def maintain_email_filter(
+    session_factory, interval: float, rebuild_interval: float
+) -> None:
+    """
+    Load the global filter, then keep it refreshed (startup background task)
+
+    Runs in the background so startup does not wait for a full scan of
+    `users`; until the first rebuild succeeds every check uses the database.
+
+    Args:
+        session_factory: Async session factory (e.g. AsyncSessionLocal)
+        interval: Seconds between incremental refreshes (0 = load only)
+        rebuild_interval: Seconds between full rebuilds
+    """
+    await rebuild_email_filter(session_factory)
+    if interval > 0:
+        await refresh_email_filter_periodically(session_factory, interval, rebuild_interval)
@@ -0,0 +1,345 @@
+"""
+Streaming LLM client
+OpenAI 호환 채팅 API 스트리밍 클라이언트 (Azure OpenAI 또는 LLM_BASE_URL)
+
+Talks to the chat completions API directly over httpx with `stream: true`
+and turns the upstream Server-Sent Events into text chunks:
+
+    stream = await llm_client.open_stream(messages)
+    try:
+        async for text in stream:
+            ...
+    finally:
+        await stream.aclose()
+
+Upstream reads run at most CHAT_STREAM_READ_AHEAD chunks ahead of the
+consumer. A client that falls behind gets the backlog as fewer, larger
+chunks; one that stops reading stops the upstream reads, and the model
+server is pushed back by TCP flow control instead of tokens piling up in
+this process. Closing the stream closes the upstream connection, which
+stops generation (and token billing) on the model server.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..core.config import settings
+from ..core.metrics import record_timing
+
+logger = logging.getLogger(__name__)
+
+
+class LLMError(Exception):
+    """The model call failed (connection, upstream status or stream error)"""
+
+
+class LLMNotConfiguredError(LLMError):
+    """Neither LLM_BASE_URL nor the AZURE_OPENAI_* settings are set"""
+
+
+class LLMBusyError(LLMError):
+    """This worker already has CHAT_MAX_STREAMS streams open"""
+
+
+# Queued after the last text chunk of a complete stream
+_END = object()
+
+
+def parse_sse_events(buffer: bytes) -> Tuple[List[bytes], bytes]:
+    """
+    Split complete Server-Sent Events off the front of a buffer
+
+    Args:
+        buffer: Bytes received so far
+
+    Returns:
+        tuple: ("data:" payloads of the complete events, unconsumed remainder)
+    """
+    *events, rest = buffer.replace(b"\r\n", b"\n").split(b"\n\n")
+    payloads = []
+    for event in events:
+        data = [line[5:].strip() for line in event.split(b"\n") if line.startswith(b"data:")]
+        if data:
+            payloads.append(b"\n".join(data))
+    return payloads, rest
+
+
+class ChatStream:
+    """
+    One streamed chat completion
+
+    A reader task parses upstream events into a bounded queue of text
+    chunks; iterating takes everything queued so far as one chunk. When
+    the queue is full (the consumer is read_ahead chunks behind) the reader
+    stops reading, so the model server is pushed back by TCP flow control.
+
+    `finish_reason` is set once the upstream reports it. `aclose()` is
+    idempotent and must always be called: it stops the reader, closes the
+    upstream response and frees the stream slot. A stream closed before it
+    finished or failed counts as cancelled.
+
+    Args:
+        client: LLMClient that opened the stream
+        response: Upstream response opened with stream=True
+        started: perf_counter() value when the request was sent
+        read_ahead: Text chunks buffered before upstream reads pause
+    """
+
+    def __init__(
+        self, client: "LLMClient", response: httpx.Response, started: float, read_ahead: int
+    ):
+        self._client = client
+        self._response = response
+        self._started = started
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, read_ahead))
+        self._reader: Optional[asyncio.Task] = None
+        self._closed = False
+        self.finish_reason: Optional[str] = None
+        self.first_token_ms: Optional[float] = None
+        self.done = False
+        self.failed = False
+
+    async def _read(self) -> None:
+        # Always ends the queue with _END or an LLMError, so the consumer never
+        # waits forever; only a cancelled reader (aclose) queues nothing
+        buffer = b""
+        end: Optional[object] = None
+        try:
+            async for chunk in self._response.aiter_bytes():
+                payloads, buffer = parse_sse_events(buffer + chunk)
+                for payload in payloads:
+                    if payload == b"[DONE]":
+                        self.done = True
+                        break
+                    text = self._deltas(json.loads(payload))
+                    if text:
+                        await self._queue.put("".join(text))
+                if self.done:
+                    break
+            if not self.done and self.finish_reason is None:
+                raise LLMError("Model stream ended before the response was complete")
+            end = _END
+        except LLMError as e:
+            end = e
+        except httpx.HTTPError as e:
+            end = LLMError(f"Model stream failed: {type(e).__name__}")
+        except (ValueError, TypeError, KeyError, AttributeError):
+            # Not JSON, or JSON that is not a chat completion chunk
+            end = LLMError("Model sent an invalid stream event")
+        except Exception as e:
+            logger.exception("Model stream reader failed")
+            end = LLMError(f"Model stream failed: {type(e).__name__}")
+        finally:
+            if end is not None:
+                await self._queue.put(end)
+
+    def _deltas(self, event: Dict[str, Any]) -> List[str]:
+        # Azure sends a first event with no choices (prompt filter results)
+        text = []
+        for choice in event.get("choices") or ():
+            content = (choice.get("delta") or {}).get("content")
+            if content:
+                text.append(content)
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+        return text
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read())
+        while True:
+            items = [await self._queue.get()]
+            while not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            text = "".join(item for item in items if isinstance(item, str))
+            if text:
+                if self.first_token_ms is None:
+                    self.first_token_ms = (time.perf_counter() - self._started) * 1000
+                    record_timing("llm_first_token", self.first_token_ms)
+                yield text
+            if isinstance(items[-1], LLMError):
+                self.failed = True
+                raise items[-1]
+            if items[-1] is _END:
+                return
+
+    async def aclose(self) -> None:
+        """Stop reading, close the upstream response and release the stream slot"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._reader is not None:
+                self._reader.cancel()
+                await asyncio.wait([self._reader])
+            await self._response.aclose()
+        finally:
+            self._client._finished(self)
+
+
+class LLMClient:
+    """
+    Pooled HTTP client for streaming chat completions
+
+    Endpoint selection (read on every call, so settings can change at runtime):
+    - LLM_BASE_URL: any OpenAI-compatible API, `{base}/chat/completions`
+      with `model` = AZURE_OPENAI_DEPLOYMENT_NAME and LLM_API_KEY as bearer
+    - otherwise AZURE_OPENAI_ENDPOINT + AZURE_OPENAI_API_KEY
+
+    At most max_streams streams are open at once per worker; further calls
+    fail fast with LLMBusyError rather than queueing behind slow streams.
+
+    Args:
+        max_streams: Concurrent streams allowed
+        read_ahead: Text chunks each stream buffers ahead of its consumer
+    """
+
+    def __init__(self, max_streams: int, read_ahead: int = 64):
+        self.max_streams = max_streams
+        self.read_ahead = read_ahead
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.active = 0
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.errors = 0
+        self.rejected = 0
+
+    @staticmethod
+    def _target() -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """URL, headers and extra body fields for the configured endpoint"""
+        if settings.LLM_BASE_URL:
+            headers = {}
+            if settings.LLM_API_KEY:
+                headers["Authorization"] = f"Bearer {settings.LLM_API_KEY}"
+            url = f"{settings.LLM_BASE_URL.rstrip('/')}/chat/completions"
+            return url, headers, {"model": settings.AZURE_OPENAI_DEPLOYMENT_NAME}
+        if settings.AZURE_OPENAI_ENDPOINT and settings.AZURE_OPENAI_API_KEY:
+            url = (
+                f"{settings.AZURE_OPENAI_ENDPOINT.rstrip('/')}/openai/deployments/"
+                f"{settings.AZURE_OPENAI_DEPLOYMENT_NAME}/chat/completions"
+                f"?api-version={settings.AZURE_OPENAI_API_VERSION}"
+            )
+            return url, {"api-key": settings.AZURE_OPENAI_API_KEY}, {}
+        raise LLMNotConfiguredError("Chat model is not configured")
+
+    def _http_client(self) -> httpx.AsyncClient:
+        # Pooled connections belong to the event loop that opened them
+        # (the test client runs a loop per request), so pool per loop
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    settings.LLM_READ_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.max_streams, max_keepalive_connections=self.max_streams
+                ),
+            )
+            self._loop = loop
+        return self._client
+
+    async def open_stream(
+        self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None
+    ) -> ChatStream:
+        """
+        Send a streaming chat request and wait for the response headers
+
+        Errors up to this point (no configuration, too many streams, connect
+        failure, non-2xx status) are raised here, before any of the response
+        has been sent to the client.
+
+        Args:
+            messages: Chat messages ({"role", "content"}), system prompt included
+            max_tokens: Completion token limit (defaults to CHAT_MAX_TOKENS)
+
+        Returns:
+            ChatStream: Open stream; the caller must aclose() it
+
+        Raises:
+            LLMNotConfiguredError: No model endpoint configured
+            LLMBusyError: max_streams already open
+            LLMError: Upstream unreachable or returned an error status
+        """
+        url, headers, extra = self._target()
+        if self.active >= self.max_streams:
+            self.rejected += 1
+            raise LLMBusyError("Too many chat streams in progress")
+
+        body = {
+            **extra,
+            "messages": messages,
+            "max_tokens": max_tokens or settings.CHAT_MAX_TOKENS,
+            "stream": True,
+        }
+        client = self._http_client()
+        self.active += 1
+        started = time.perf_counter()
+        try:
+            response = await client.send(
+                client.build_request("POST", url, json=body, headers=headers), stream=True
+            )
+        except httpx.HTTPError as e:
+            self.active -= 1
+            self.errors += 1
+            raise LLMError(f"Model endpoint unreachable: {type(e).__name__}") from e
+        except BaseException:
+            self.active -= 1  # Cancelled while waiting for the response headers
+            raise
+
+        if response.status_code >= 400:
+            detail = (await response.aread())[:200].decode("utf-8", "replace")
+            await response.aclose()
+            self.active -= 1
+            self.errors += 1
+            logger.warning("Model endpoint returned %d: %s", response.status_code, detail)
+            raise LLMError(f"Model endpoint returned {response.status_code}")
+
+        self.started += 1
+        return ChatStream(self, response, started, self.read_ahead)
+
+    def _finished(self, stream: ChatStream) -> None:
+        self.active -= 1
+        if stream.failed:
+            self.errors += 1
+        elif stream.done or stream.finish_reason is not None:
+            self.completed += 1
+        else:
+            self.cancelled += 1
+
+    async def aclose(self) -> None:
+        """Close pooled connections (application shutdown)"""
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return stream counters
+
+        Returns:
+            dict: Streams active, started, completed, cancelled by the client,
+                failed, and rejected for being over max_streams
+        """
+        return {
+            "max_streams": self.max_streams,
+            "active": self.active,
+            "started": self.started,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "errors": self.errors,
+            "rejected": self.rejected,
+        }
+
+
+# Global client configured from settings
+llm_client = LLMClient(
+    max_streams=settings.CHAT_MAX_STREAMS, read_ahead=settings.CHAT_STREAM_READ_AHEAD
+)
@@ -0,0 +1,45 @@
+"""
+Transparent password hash upgrade
+로그인 성공 시 오래된 bcrypt 해시를 현재 작업 계수로 재해싱하는 서비스
+"""
+
+import logging
+
+from sqlalchemy import update
+
+from ..core.database import AsyncSessionLocal
+from ..models.user import User
+from ..utils.hashing import hash_password_async
+
+logger = logging.getLogger(__name__)
+
+
+async def upgrade_password_hash(user_id: int, password: str, old_hash: str) -> bool:
+    """
+    Re-hash a verified password with the current work factor
+
+    Intended to run as a background task after a successful login. The
+    update only applies if the stored hash is still old_hash, so a password
+    change made in the meantime is never overwritten.
+
+    Args:
+        user_id: User whose hash should be upgraded
+        password: Plain text password that was just verified
+        old_hash: Hash the password was verified against
+
+    Returns:
+        bool: True if the stored hash was replaced
+    """
+    try:
+        new_hash = await hash_password_async(password)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(User)
+                .where(User.id == user_id, User.password_hash == old_hash)
+                .values(password_hash=new_hash)
+            )
+            await db.commit()
+        return result.rowcount > 0
+    except Exception:
+        logger.exception("Failed to upgrade password hash for user %s", user_id)
+        return False
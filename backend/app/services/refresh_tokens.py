@@ -0,0 +1,233 @@
+"""
+Refresh token service
+리프레시 토큰 발급, 회전(rotation), 폐기 로직
+"""
+
+import hashlib
+import hmac
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import dialect_insert
+from ..models.refresh_token import RefreshToken
+from ..models.statements import REFRESH_TOKEN_WITH_USER
+from ..models.user import User
+
+DEFAULT_DEVICE_ID = "default"
+
+
+class RefreshTokenError(Exception):
+    """Raised when a refresh token is unknown, expired, revoked or replayed"""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes; they are stored in UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def hash_refresh_token(token: str) -> str:
+    """
+    Compute the stored digest of a refresh token
+
+    Args:
+        token: Opaque refresh token sent by the client
+
+    Returns:
+        str: Hex HMAC-SHA256 digest keyed with SECRET_KEY
+    """
+    return hmac.new(
+        settings.SECRET_KEY.encode("utf-8"), token.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+def refresh_token_lifetime() -> timedelta:
+    return timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+
+async def issue_refresh_token(
+    db: AsyncSession,
+    user_id: int,
+    device_id: Optional[str] = None,
+) -> str:
+    """
+    Create (or replace) the refresh token for a user's device and commit
+
+    A single INSERT ... ON CONFLICT (user_id, device_id) DO UPDATE, so
+    concurrent logins from one device both succeed; the last one wins.
+
+    Args:
+        db: Async database session
+        user_id: Token owner
+        device_id: Device identifier (defaults to "default")
+
+    Returns:
+        str: New opaque refresh token
+    """
+    device_id = device_id or DEFAULT_DEVICE_ID
+    token = secrets.token_urlsafe(32)
+    now = _utcnow()
+
+    stmt = dialect_insert(db, RefreshToken).values(
+        user_id=user_id,
+        device_id=device_id,
+        token_hash=hash_refresh_token(token),
+        previous_token_hash=None,
+        expires_at=now + refresh_token_lifetime(),
+        revoked_at=None,
+        last_used_at=now,
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["user_id", "device_id"],
+            set_={
+                column: stmt.excluded[column]
+                for column in (
+                    "token_hash",
+                    "previous_token_hash",
+                    "expires_at",
+                    "revoked_at",
+                    "last_used_at",
+                )
+            },
+        )
+    )
+    await db.commit()
+    return token
+
+
+async def rotate_refresh_token(db: AsyncSession, token: str) -> Tuple[User, str]:
+    """
+    Exchange a refresh token for a new one (sliding expiration) and commit
+
+    Presenting a token that was already rotated out revokes the whole device
+    session, since it means the token was copied. The rotation itself is a
+    compare-and-set on the current digest, so when two requests present the
+    same token at once only one gets a new token; the other counts as reuse.
+
+    Args:
+        db: Async database session
+        token: Refresh token sent by the client
+
+    Returns:
+        Tuple[User, str]: Token owner and the new refresh token
+
+    Raises:
+        RefreshTokenError: If the token is unknown, expired, revoked or replayed
+    """
+    digest = hash_refresh_token(token)
+    now = _utcnow()
+
+    # Single indexed lookup returning both the session and its user.
+    # populate_existing: the updates below bypass the identity map, so a
+    # record already loaded in this session may be stale
+    row = (
+        await db.execute(
+            REFRESH_TOKEN_WITH_USER,
+            {"digest": digest},
+            execution_options={"populate_existing": True},
+        )
+    ).first()
+    if row is None:
+        raise RefreshTokenError("Invalid refresh token")
+
+    record, user = row
+    if record.revoked_at is not None:
+        raise RefreshTokenError("Refresh token has been revoked")
+
+    if record.token_hash != digest:
+        await _revoke_reused(db, record.id, now)
+
+    if _as_utc(record.expires_at) <= now:
+        raise RefreshTokenError("Refresh token has expired")
+
+    new_token = secrets.token_urlsafe(32)
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.id == record.id,
+            RefreshToken.token_hash == digest,
+            RefreshToken.revoked_at.is_(None),
+        )
+        .values(
+            previous_token_hash=digest,
+            token_hash=hash_refresh_token(new_token),
+            expires_at=now + refresh_token_lifetime(),
+            last_used_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        # Rotated (or revoked) by another request since the lookup
+        await _revoke_reused(db, record.id, now)
+    await db.commit()
+
+    return user, new_token
+
+
+async def _revoke_reused(db: AsyncSession, record_id: int, now: datetime) -> None:
+    """Revoke the device session after a replayed token, commit and raise"""
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == record_id)
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    raise RefreshTokenError("Refresh token reuse detected; session revoked")
+
+
+async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
+    """
+    Revoke the device session that owns a refresh token and commit
+
+    Args:
+        db: Async database session
+        token: Refresh token sent by the client
+
+    Returns:
+        bool: True if an active session was revoked
+    """
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == hash_refresh_token(token),
+            RefreshToken.revoked_at.is_(None),
+        )
+        .values(revoked_at=_utcnow())
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+
+async def revoke_device(db: AsyncSession, user_id: int, device_id: str) -> bool:
+    """
+    Revoke a user's refresh token for one device and commit
+
+    Args:
+        db: Async database session
+        user_id: Token owner
+        device_id: Device identifier
+
+    Returns:
+        bool: True if an active session was revoked
+    """
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.device_id == device_id,
+            RefreshToken.revoked_at.is_(None),
+        )
+        .values(revoked_at=_utcnow())
+    )
+    await db.commit()
+    return result.rowcount > 0
@@ -0,0 +1,243 @@
+"""
+User identity cache
+인증된 요청의 사용자 조회를 캐싱하고, 변경 시 자동으로 무효화하는 서비스
+"""
+
+import asyncio
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+from ..core.cache import CacheBackend, InMemoryCacheBackend, LRUCache
+from ..core.config import settings
+from ..models.statements import USER_BY_ID
+from ..models.user import User, ParentChildLink
+
+# Session.info key collecting user IDs to invalidate after commit
+_PENDING_KEY = "user_cache_invalidate"
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """
+    Immutable copy of the user columns needed by request handlers
+
+    Exposes the same attribute names as the User model (minus password_hash)
+    so it can be used wherever a route only reads the current user.
+    """
+
+    id: int
+    email: str
+    role: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        data["updated_at"] = self.updated_at.isoformat()
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "UserSnapshot":
+        data = json.loads(raw)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        return cls(**data)
+
+
+class UserCache:
+    """
+    Two-tier user snapshot cache
+
+    Lookups go to the in-process LRU first, then the shared backend, then the
+    database. Entries are invalidated after any commit that touches a User
+    row or a ParentChildLink referencing the user.
+
+    Args:
+        backend: Shared cache backend (defaults to the in-memory stand-in)
+        max_size: Maximum entries in the in-process LRU
+        local_ttl_seconds: TTL of in-process entries (bounds staleness across workers)
+        shared_ttl_seconds: TTL of shared backend entries
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_size: int = 10000,
+        local_ttl_seconds: float = 30,
+        shared_ttl_seconds: float = 300,
+    ):
+        self.backend = backend or InMemoryCacheBackend()
+        self.local = LRUCache(max_size=max_size, ttl_seconds=local_ttl_seconds)
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self.db_loads = 0
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    async def get(self, user_id: int) -> Optional[UserSnapshot]:
+        """Return a cached snapshot without touching the database"""
+        snapshot = self.local.get(user_id)
+        if snapshot is not None:
+            return snapshot
+        raw = await self.backend.get(self._key(user_id))
+        if raw is None:
+            return None
+        snapshot = UserSnapshot.from_json(raw)
+        self.local.set(user_id, snapshot)
+        return snapshot
+
+    async def set(self, snapshot: UserSnapshot) -> None:
+        """Store a snapshot in both tiers"""
+        self.local.set(snapshot.id, snapshot)
+        await self.backend.set(
+            self._key(snapshot.id), snapshot.to_json(), self.shared_ttl_seconds
+        )
+
+    async def get_or_load(self, user_id: int, db: AsyncSession) -> Optional[UserSnapshot]:
+        """
+        Return the user snapshot, loading it from the database on miss
+
+        Args:
+            user_id: User ID
+            db: Async database session used on cache miss
+
+        Returns:
+            Optional[UserSnapshot]: Snapshot, or None if the user does not exist
+        """
+        snapshot = await self.get(user_id)
+        if snapshot is not None:
+            return snapshot
+        user = (await db.execute(USER_BY_ID, {"user_id": user_id})).scalar_one_or_none()
+        self.db_loads += 1
+        if user is None:
+            return None
+        snapshot = UserSnapshot.from_user(user)
+        await self.set(snapshot)
+        return snapshot
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        """
+        Drop users from both tiers
+
+        Both tiers are cleared before this returns, so no request can read
+        the old snapshot back from the shared tier after the commit. Called
+        from the after_commit hook of an AsyncSession, the shared delete is
+        awaited inside that session's commit (the hook runs in its greenlet);
+        outside an event loop (scripts, sync sessions) it runs to completion.
+
+        Args:
+            user_ids: IDs of users whose rows or links changed
+
+        Raises:
+            RuntimeError: Called from synchronous code on a running event loop
+                (use invalidate_async)
+        """
+        ids = {user_id for user_id in user_ids if user_id is not None}
+        if not ids:
+            return
+        for user_id in ids:
+            self.local.delete(user_id)
+
+        delete = self.backend.delete_many([self._key(user_id) for user_id in ids])
+        if in_greenlet():
+            await_only(delete)
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(delete)
+            return
+        delete.close()
+        raise RuntimeError(
+            "invalidate() cannot block a running event loop; use invalidate_async()"
+        )
+
+    async def invalidate_async(self, user_ids: Iterable[int]) -> None:
+        """
+        Drop users from both tiers from async code
+
+        Args:
+            user_ids: IDs of users whose rows or links changed
+        """
+        ids = {user_id for user_id in user_ids if user_id is not None}
+        for user_id in ids:
+            self.local.delete(user_id)
+        if ids:
+            await self.backend.delete_many([self._key(user_id) for user_id in ids])
+
+    async def clear(self) -> None:
+        """Remove all cached users"""
+        self.local.clear()
+        self.db_loads = 0
+        await self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters
+
+        Returns:
+            dict: In-process LRU counters plus database loads
+        """
+        return {**self.local.stats(), "db_loads": self.db_loads}
+
+
+# Global user cache configured from settings
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    local_ttl_seconds=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    shared_ttl_seconds=settings.USER_CACHE_SHARED_TTL_SECONDS,
+)
+
+
+def _affected_user_ids(instances: Iterable[Any]) -> Set[int]:
+    """Collect user IDs affected by changed User/ParentChildLink instances"""
+    user_ids: Set[int] = set()
+    for instance in instances:
+        if isinstance(instance, User):
+            user_ids.add(instance.id)
+        elif isinstance(instance, ParentChildLink):
+            user_ids.update((instance.parent_id, instance.child_id))
+    return user_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_invalidations(session: Session, flush_context: Any) -> None:
+    """Remember users touched by this flush until the transaction commits"""
+    user_ids = _affected_user_ids(
+        list(session.dirty) + list(session.deleted) + list(session.new)
+    )
+    if user_ids:
+        session.info.setdefault(_PENDING_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session: Session) -> None:
+    """Invalidate cached users once their changes are durable"""
+    user_ids = session.info.pop(_PENDING_KEY, None)
+    if user_ids:
+        user_cache.invalidate(user_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_invalidations(session: Session, previous_transaction: Any) -> None:
+    """Forget pending invalidations of a rolled back transaction"""
+    session.info.pop(_PENDING_KEY, None)
@@ -8,10 +8,24 @@ from .security import (
     create_access_token,
     decode_access_token,
 )
+from .token_cache import token_cache, decode_access_token_cached
+from .hashing import (
+    password_hasher,
+    hash_password_async,
+    verify_password_async,
+)
+from .etag import make_etag, etag_matches
 
 __all__ = [
     "hash_password",
     "verify_password",
     "create_access_token",
     "decode_access_token",
+    "token_cache",
+    "decode_access_token_cached",
+    "password_hasher",
+    "hash_password_async",
+    "verify_password_async",
+    "make_etag",
+    "etag_matches",
 ]
@@ -0,0 +1,107 @@
+"""
+Bloom filter
+이메일 등 문자열 집합의 확률적 멤버십 검사 (거짓 음성 없음)
+"""
+
+import hashlib
+import math
+from typing import Iterable, List
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings
+
+    Membership tests never give false negatives; false positives occur at
+    about `error_rate` once `capacity` items have been added. Bit positions
+    come from double hashing one 128-bit BLAKE2b digest.
+
+    Usage:
+        bloom = BloomFilter(capacity=1_000_000, error_rate=0.001)
+        bloom.add("a@example.com")
+        "a@example.com" in bloom  # True
+
+    Args:
+        capacity: Expected number of items
+        error_rate: Target false-positive probability at capacity
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> None:
+        """Add an item"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of the bit array in bytes"""
+        return len(self._bits)
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows by chaining larger filters as items are added
+
+    When the newest filter reaches its capacity a new one with `growth`
+    times the capacity and a tighter error rate is appended, so the overall
+    false-positive rate stays below about 2 × `error_rate`.
+
+    Args:
+        initial_capacity: Capacity of the first filter
+        error_rate: Target overall false-positive probability
+        growth: Capacity multiplier for each new filter
+    """
+
+    TIGHTENING = 0.5
+
+    def __init__(self, initial_capacity: int, error_rate: float = 0.001, growth: int = 2):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.filters: List[BloomFilter] = [BloomFilter(initial_capacity, error_rate)]
+
+    def add(self, item: str) -> None:
+        """Add an item, starting a larger filter if the current one is full"""
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(
+                current.capacity * self.growth, current.error_rate * self.TIGHTENING
+            )
+            self.filters.append(current)
+        current.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        return any(item in bloom for bloom in reversed(self.filters))
+
+    def __len__(self) -> int:
+        return sum(len(bloom) for bloom in self.filters)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Total size of all bit arrays in bytes"""
+        return sum(bloom.memory_bytes for bloom in self.filters)
@@ -0,0 +1,48 @@
+"""
+ETag helpers for conditional GET
+조건부 GET 요청을 위한 ETag 생성 및 비교 유틸리티
+"""
+
+import hashlib
+from typing import Iterable, Optional
+
+
+def make_etag(parts: Iterable[object]) -> str:
+    """
+    Build a strong ETag from the values that determine a representation
+
+    Args:
+        parts: Values whose change must change the tag (IDs, timestamps, ...)
+
+    Returns:
+        str: Quoted ETag value
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison, RFC 9110)
+
+    Args:
+        if_none_match: Raw If-None-Match header value (may be None)
+        etag: Current quoted ETag
+
+    Returns:
+        bool: True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
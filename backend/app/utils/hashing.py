@@ -0,0 +1,251 @@
+"""
+Password hashing worker pool
+bcrypt 해싱/검증을 이벤트 루프 밖의 전용 워커 풀에서 실행하는 유틸리티
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import settings
+from ..core.metrics import record_timing
+from .security import get_bcrypt_rounds, hash_password, verify_password
+
+
+def _timed_call(func: Callable[..., Any], *args: Any) -> Tuple[Any, float, float]:
+    """
+    Run func inside a worker and report wall-clock start/finish times
+
+    Wall-clock time is used because perf_counter values are not comparable
+    across processes.
+    """
+    started = time.time()
+    result = func(*args)
+    return result, started, time.time()
+
+
+def _hash_batch(passwords: Sequence[str], rounds: int) -> List[str]:
+    """Hash several passwords in one worker call (amortizes IPC overhead)"""
+    return [hash_password(password, rounds) for password in passwords]
+
+
+class HashingStats:
+    """
+    Queue depth and latency counters for the hashing pool
+
+    Attributes:
+        submitted: Jobs handed to the executor
+        completed: Jobs finished (successfully or not)
+        failed: Jobs that raised an exception
+        queued: Jobs submitted but not finished yet (waiting or running)
+        max_queued: Highest observed queue depth
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters"""
+        with self._lock:
+            self.submitted = 0
+            self.completed = 0
+            self.failed = 0
+            self.queued = 0
+            self.max_queued = 0
+            self.total_wait_seconds = 0.0
+            self.total_run_seconds = 0.0
+            self.max_wait_seconds = 0.0
+            self.max_run_seconds = 0.0
+
+    def on_submit(self) -> None:
+        with self._lock:
+            self.submitted += 1
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+    def on_done(self, wait_seconds: float, run_seconds: float, failed: bool) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.completed += 1
+            if failed:
+                self.failed += 1
+            self.total_wait_seconds += wait_seconds
+            self.total_run_seconds += run_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+            self.max_run_seconds = max(self.max_run_seconds, run_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a point-in-time copy of the counters
+
+        Returns:
+            dict: Counters plus average wait/run latency in milliseconds
+        """
+        with self._lock:
+            completed = self.completed or 1
+            return {
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "queue_depth": self.queued,
+                "max_queue_depth": self.max_queued,
+                "avg_wait_ms": round(self.total_wait_seconds / completed * 1000, 3),
+                "avg_run_ms": round(self.total_run_seconds / completed * 1000, 3),
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+                "max_run_ms": round(self.max_run_seconds * 1000, 3),
+            }
+
+
+class PasswordHasher:
+    """
+    Bounded executor that runs bcrypt work off the event loop
+
+    The executor is created lazily so that each server worker process builds
+    its own pool after it has been forked.
+
+    Usage:
+        hasher = PasswordHasher(max_workers=4, executor_type="process")
+        hashed = await hasher.hash("password123")
+        ok = await hasher.verify("password123", hashed)
+
+    Args:
+        max_workers: Pool size (0 or None uses the CPU count)
+        executor_type: "process" (default) or "thread"
+    """
+
+    EXECUTOR_TYPES = ("process", "thread")
+
+    def __init__(self, max_workers: Optional[int] = None, executor_type: str = "process"):
+        if executor_type not in self.EXECUTOR_TYPES:
+            raise ValueError(
+                f"executor_type must be one of {self.EXECUTOR_TYPES}, got {executor_type!r}"
+            )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor_type = executor_type
+        self.stats = HashingStats()
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> Executor:
+        """Create the underlying executor if it does not exist yet"""
+        with self._lock:
+            if self._executor is None:
+                if self.executor_type == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="password-hasher",
+                    )
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executor (it is recreated on next use)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a picklable function in the pool and record its metrics
+
+        Queue wait and run time are also recorded as named timings
+        ("password_hasher_wait" and the function's name, e.g. "hash_password").
+
+        Args:
+            func: Module-level function to execute
+            *args: Positional arguments for func
+
+        Returns:
+            Any: Return value of func
+        """
+        executor = self.start()
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        self.stats.on_submit()
+        try:
+            result, started, finished = await loop.run_in_executor(
+                executor, _timed_call, func, *args
+            )
+        except BaseException:
+            self.stats.on_done(time.time() - submitted, 0.0, failed=True)
+            raise
+        wait_seconds = max(started - submitted, 0.0)
+        self.stats.on_done(wait_seconds, finished - started, failed=False)
+        record_timing("password_hasher_wait", wait_seconds * 1000)
+        record_timing(func.__name__.lstrip("_"), (finished - started) * 1000)
+        return result
+
+    async def hash(self, password: str) -> str:
+        """Async wrapper around hash_password (uses the current work factor)"""
+        # Rounds are passed explicitly: pool processes don't see later changes
+        # to the parent's module state
+        return await self.run(hash_password, password, get_bcrypt_rounds())
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Async wrapper around verify_password"""
+        return await self.run(verify_password, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: Sequence[str], chunk_size: int = 16) -> List[str]:
+        """
+        Hash many passwords in parallel across the pool's workers
+
+        Args:
+            passwords: Plain text passwords
+            chunk_size: Passwords hashed per worker call
+
+        Returns:
+            List[str]: Hashes in the same order as passwords
+        """
+        rounds = get_bcrypt_rounds()
+        chunks = [
+            passwords[start : start + chunk_size]
+            for start in range(0, len(passwords), chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(self.run(_hash_batch, list(chunk), rounds) for chunk in chunks)
+        )
+        return [hashed for chunk in results for hashed in chunk]
+
+
+# Global hasher configured from settings
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in the worker pool without blocking the event loop
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        str: Hashed password
+    """
+    return await password_hasher.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the worker pool without blocking the event loop
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password from database
+
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    return await password_hasher.verify(plain_password, hashed_password)
@@ -4,18 +4,52 @@ Security utilities for password hashing and JWT token management
 """
 
 import bcrypt
+import time
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from ..core.config import settings
+from ..core.metrics import timed
 
+# bcrypt work factor currently used for new hashes (see calibrate_bcrypt_rounds)
+_bcrypt_rounds: int = settings.BCRYPT_ROUNDS
 
-def hash_password(password: str) -> str:
+# bcrypt accepts work factors between 4 and 31
+BCRYPT_MIN_ALLOWED_ROUNDS = 4
+BCRYPT_MAX_ALLOWED_ROUNDS = 31
+
+
+def get_bcrypt_rounds() -> int:
+    """Return the bcrypt work factor used for new hashes"""
+    return _bcrypt_rounds
+
+
+def set_bcrypt_rounds(rounds: int) -> None:
+    """
+    Set the bcrypt work factor used for new hashes
+
+    Args:
+        rounds: Work factor (log2 of the iteration count)
+
+    Raises:
+        ValueError: If rounds is outside bcrypt's supported range
+    """
+    global _bcrypt_rounds
+    if not BCRYPT_MIN_ALLOWED_ROUNDS <= rounds <= BCRYPT_MAX_ALLOWED_ROUNDS:
+        raise ValueError(
+            f"bcrypt rounds must be between {BCRYPT_MIN_ALLOWED_ROUNDS} "
+            f"and {BCRYPT_MAX_ALLOWED_ROUNDS}, got {rounds}"
+        )
+    _bcrypt_rounds = rounds
+
+
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
     """
     Hash a password using bcrypt
 
     Args:
         password: Plain text password
+        rounds: Optional work factor (defaults to get_bcrypt_rounds())
 
     Returns:
         str: Hashed password
@@ -25,7 +59,89 @@ def hash_password(password: str) -> str:
         >>> print(hashed)
         $2b$12$...
     """
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    salt = bcrypt.gensalt(rounds=rounds or _bcrypt_rounds)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def get_hash_rounds(hashed_password: str) -> Optional[int]:
+    """
+    Extract the work factor from a bcrypt hash
+
+    Example:
+        >>> get_hash_rounds("$2b$12$abcdefghijklmnopqrstuv...")
+        12
+
+    Args:
+        hashed_password: bcrypt hash ("$2b$<rounds>$<salt+digest>")
+
+    Returns:
+        Optional[int]: Work factor, or None if the hash is not bcrypt
+    """
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash uses an outdated work factor
+
+    Args:
+        hashed_password: Hashed password from database
+
+    Returns:
+        bool: True if the hash should be upgraded to the current work factor
+    """
+    rounds = get_hash_rounds(hashed_password)
+    return rounds is None or rounds < _bcrypt_rounds
+
+
+def measure_bcrypt_ms(rounds: int, samples: int = 1) -> float:
+    """
+    Measure the median time of one bcrypt hash at a given work factor
+
+    Args:
+        rounds: Work factor to measure
+        samples: Number of hashes to time
+
+    Returns:
+        float: Median hashing time in milliseconds
+    """
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password-1", bcrypt.gensalt(rounds=rounds))
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+) -> int:
+    """
+    Pick the highest bcrypt work factor that hashes within a time budget
+
+    Each extra round doubles the cost, so timing stops at the first level
+    over budget. min_rounds is returned even if it exceeds the budget.
+
+    Args:
+        target_ms: Time budget for one hash in milliseconds
+        min_rounds: Lowest acceptable work factor
+        max_rounds: Highest work factor to consider
+
+    Returns:
+        int: Chosen work factor
+    """
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        if measure_bcrypt_ms(rounds) > target_ms:
+            break
+        chosen = rounds
+    return chosen
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -92,6 +208,7 @@ def create_access_token(
     return encoded_jwt
 
 
+@timed("decode_access_token")
 def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and validate a JWT access token
@@ -0,0 +1,115 @@
+"""
+Verified JWT cache
+검증이 끝난 JWT 페이로드를 캐싱하여 반복 디코딩을 줄이는 유틸리티
+"""
+
+import hashlib
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ..core.cache import LRUCache
+from ..core.config import settings
+from .security import decode_access_token
+
+
+class TokenCache(LRUCache):
+    """
+    Bounded LRU cache of verified token payloads
+
+    Entries are keyed by a SHA-256 digest of the token (raw tokens are never
+    stored) and expire after ttl_seconds or at the token's own `exp` claim,
+    whichever comes first.
+
+    Usage:
+        cache = TokenCache(max_size=10000, ttl_seconds=300)
+        payload = cache.decode(token)
+
+    Args:
+        max_size: Maximum number of cached tokens
+        ttl_seconds: Upper bound on how long a verified token is trusted
+        clock: Time source returning epoch seconds (compared with `exp`)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(max_size=max_size, ttl_seconds=ttl_seconds, clock=clock)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a verified payload
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            Optional[Dict]: Cached payload, or None on miss/expiry
+        """
+        payload = super().get(self._key(token))
+        return dict(payload) if payload is not None else None
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """
+        Store a verified payload
+
+        Args:
+            token: JWT token string
+            payload: Payload returned by decode_access_token
+        """
+        now = self._clock()
+        expires_at = now + self.ttl_seconds
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return
+        self.set(self._key(token), dict(payload), expires_at=expires_at)
+
+    def decode(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Decode a token, verifying the signature only on cache miss
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            Optional[Dict]: Decoded token payload if valid, None otherwise
+        """
+        payload = self.get(token)
+        if payload is not None:
+            return payload
+        payload = decode_access_token(token)
+        if payload is not None:
+            self.put(token, payload)
+        return payload
+
+
+# Global token cache configured from settings
+token_cache = TokenCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS,
+)
+
+
+def decode_access_token_cached(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode and validate a JWT access token, reusing earlier verifications
+
+    Falls back to decode_access_token when TOKEN_CACHE_ENABLED is False.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Optional[Dict]: Decoded token payload if valid, None otherwise
+    """
+    if not settings.TOKEN_CACHE_ENABLED:
+        return decode_access_token(token)
+    return token_cache.decode(token)
@@ -0,0 +1,7 @@
+"""
+Performance benchmarks for the backend
+백엔드 성능 벤치마크 스크립트 모음
+
+Run from the backend directory, e.g.:
+    python -m benchmarks.login_storm
+"""
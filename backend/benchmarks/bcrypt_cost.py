@@ -0,0 +1,70 @@
+"""
+bcrypt cost benchmark
+작업 계수별 bcrypt 해싱/검증 지연 측정
+
+Reports median hash and verify latency for each work factor on this host,
+and the work factor auto-calibration would pick for a given budget.
+
+Usage:
+    python -m benchmarks.bcrypt_cost --min-rounds 8 --max-rounds 14 --target-ms 250
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def time_call(func, samples: int) -> float:
+    """Median wall time of func() in milliseconds"""
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main(args: argparse.Namespace) -> dict:
+    from app.utils.security import calibrate_bcrypt_rounds, hash_password, verify_password
+
+    levels = []
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        hashed = hash_password("password123", rounds=rounds)
+        levels.append(
+            {
+                "rounds": rounds,
+                "hash_ms": round(
+                    time_call(lambda: hash_password("password123", rounds), args.samples), 2
+                ),
+                "verify_ms": round(
+                    time_call(lambda: verify_password("password123", hashed), args.samples), 2
+                ),
+            }
+        )
+
+    return {
+        "samples": args.samples,
+        "levels": levels,
+        "target_ms": args.target_ms,
+        "calibrated_rounds": calibrate_bcrypt_rounds(
+            args.target_ms, args.min_rounds, args.max_rounds
+        ),
+    }
+
+
+if __name__ == "__main__":
+    # No database is used; avoid requiring a reachable DATABASE_URL
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--min-rounds", type=int, default=8)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--target-ms", type=float, default=250)
+    print(json.dumps(main(parser.parse_args()), indent=2))
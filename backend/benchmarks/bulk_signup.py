@@ -0,0 +1,107 @@
+"""
+Bulk onboarding benchmark: /bulk-signup vs one /signup per user
+대량 등록 처리량 비교 (/bulk-signup vs 사용자별 /signup)
+
+Registers a class roster through the JSON bulk endpoint and compares the
+throughput with the same number of individual /signup calls (measured on a
+smaller sample, since each one is a full request + commit).
+
+Usage:
+    python -m benchmarks.bulk_signup --users 10000 --sample 200 --rounds 12
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import use_temp_sqlite  # noqa: E402
+
+PASSWORD = "welcome123"
+
+
+async def main(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from app.core.database import init_db
+    from app.main import app
+    from app.utils.hashing import password_hasher
+
+    init_db()
+    password_hasher.start()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=None
+    ) as client:
+        parent = await client.post(
+            "/api/v1/auth/signup",
+            json={"email": "teacher@school.kr", "password": PASSWORD, "role": "parent"},
+        )
+        headers = {"Authorization": f"Bearer {parent.json()['access_token']}"}
+
+        # Individual signups, sequential (what a naive import script would do)
+        password_hasher.stats.reset()
+        started = time.perf_counter()
+        for i in range(args.sample):
+            response = await client.post(
+                "/api/v1/auth/signup",
+                json={"email": f"single{i}@school.kr", "password": PASSWORD, "role": "child"},
+            )
+            assert response.status_code == 201, response.text
+        single_seconds = time.perf_counter() - started
+
+        # One bulk request for the whole roster
+        rows = [{"email": f"bulk{i}@school.kr", "password": PASSWORD} for i in range(args.users)]
+        password_hasher.stats.reset()
+        started = time.perf_counter()
+        response = await client.post("/api/v1/auth/bulk-signup", json=rows, headers=headers)
+        bulk_seconds = time.perf_counter() - started
+        assert response.status_code == 200, response.text
+        body = response.json()
+
+    hasher_stats = password_hasher.stats.snapshot()
+    password_hasher.shutdown()
+
+    single_rate = args.sample / single_seconds
+    bulk_rate = body["created"] / bulk_seconds
+    return {
+        "bcrypt_rounds": int(os.environ["BCRYPT_ROUNDS"]),
+        "workers": password_hasher.max_workers,
+        "single": {
+            "users": args.sample,
+            "seconds": round(single_seconds, 2),
+            "users_per_second": round(single_rate, 1),
+        },
+        "bulk": {
+            "users": args.users,
+            "created": body["created"],
+            "seconds": round(bulk_seconds, 2),
+            "users_per_second": round(bulk_rate, 1),
+            "hasher": hasher_stats,
+        },
+        "speedup": round(bulk_rate / single_rate, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--users", type=int, default=10000, help="Rows in the bulk request")
+    parser.add_argument("--sample", type=int, default=200, help="Individual signups to time")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt work factor")
+    parser.add_argument("--executor", choices=("process", "thread"), default="process")
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("bulk-signup")
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    os.environ["BULK_SIGNUP_MAX_ROWS"] = str(max(args.users, 1))
+    os.environ["PASSWORD_HASH_EXECUTOR"] = args.executor
+    try:
+        print(json.dumps(asyncio.run(main(args)), indent=2))
+    finally:
+        os.remove(db_path)
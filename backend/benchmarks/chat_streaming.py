@@ -0,0 +1,142 @@
+"""
+Chat streaming latency through the API against the local mock model
+채팅 스트리밍 지연 시간 측정 (첫 토큰까지 시간 vs 전체 응답 시간)
+
+Starts app.mock_llm and the app (uvicorn, background threads, real
+sockets) and sends concurrent streamed chat requests in two ways:
+
+    direct  straight to the mock model server (what the model costs)
+    api     through POST /api/v1/chat (auth, read-ahead queue, SSE relay)
+
+For each it reports time to the first text chunk (what the user waits
+for before anything appears) and time to the complete answer (what a
+non-streaming endpoint would make them wait). The difference between
+the two paths is the API's own overhead.
+
+Usage:
+    python -m benchmarks.chat_streaming --requests 200 --concurrency 20
+    python -m benchmarks.chat_streaming --first-token-ms 500 --token-ms 30 --tokens 200
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+MESSAGES = [{"role": "user", "content": "How do plants make food from sunlight?"}]
+
+
+async def stream_once(client, path: str, body: dict) -> tuple:
+    """(seconds to the first text chunk, seconds to the end of the stream)"""
+    started = time.perf_counter()
+    first = None
+    async with client.stream("POST", path, json=body) as response:
+        assert response.status_code == 200, await response.aread()
+        async for line in response.aiter_lines():
+            if first is None and line.startswith("data: ") and '"content"' in line:
+                first = time.perf_counter() - started
+    return first, time.perf_counter() - started
+
+
+async def drive(base_url: str, path: str, headers: dict, body: dict, args) -> dict:
+    import httpx
+
+    results = []
+    remaining = iter(range(args.requests))
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, headers=headers, limits=limits, timeout=60
+    ) as client:
+
+        async def worker() -> None:
+            for _ in remaining:
+                results.append(await stream_once(client, path, body))
+
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return {
+        "first_token": summarize([first for first, _ in results]),
+        "complete": summarize([total for _, total in results]),
+    }
+
+
+def seed_token() -> str:
+    from app.core.database import SessionLocal, init_db
+    from app.models.user import User
+    from app.utils.security import create_access_token, hash_password
+
+    init_db()
+    with SessionLocal() as db:
+        user = User(
+            email="chat@example.com", password_hash=hash_password("password123", 4), role="child"
+        )
+        db.add(user)
+        db.commit()
+        return create_access_token({"sub": str(user.id), "email": user.email})
+
+
+def main(args: argparse.Namespace) -> dict:
+    from app.core.config import settings
+    from app.main import app
+    from app.mock_llm import MockLLM, serve_in_thread
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # The benchmark client's own lines
+    token = seed_token()
+    mock = MockLLM(args.first_token_ms, args.token_ms, args.tokens)
+    # Reply length = tokens, whatever CHAT_MAX_TOKENS is
+    settings.CHAT_MAX_TOKENS = max(settings.CHAT_MAX_TOKENS, args.tokens)
+    body = {"messages": MESSAGES}
+
+    with serve_in_thread(mock) as mock_url, serve_in_thread(app) as api_url:
+        settings.LLM_BASE_URL = f"{mock_url}/v1"
+        direct_body = {
+            "model": "mock",
+            "messages": MESSAGES,
+            "max_tokens": args.tokens,
+            "stream": True,
+        }
+        direct = asyncio.run(drive(mock_url, "/v1/chat/completions", {}, direct_body, args))
+        api = asyncio.run(
+            drive(api_url, "/api/v1/chat", {"Authorization": f"Bearer {token}"}, body, args)
+        )
+
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "mock": {
+            "first_token_ms": args.first_token_ms,
+            "token_ms": args.token_ms,
+            "tokens": args.tokens,
+        },
+        "direct": direct,
+        "api": api,
+        "api_overhead_ms": {
+            "first_token_p50": round(
+                api["first_token"]["p50_ms"] - direct["first_token"]["p50_ms"], 3
+            ),
+            "complete_p50": round(api["complete"]["p50_ms"] - direct["complete"]["p50_ms"], 3),
+        },
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--tokens", type=int, default=100, help="Tokens per reply")
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("chat-streaming")
+    try:
+        print(json.dumps(main(args), indent=2))
+    finally:
+        os.remove(db_path)
@@ -0,0 +1,71 @@
+"""
+Shared helpers for benchmark scripts
+벤치마크 스크립트 공통 유틸리티
+"""
+
+import os
+import statistics
+import tempfile
+from typing import Dict, List
+
+
+def use_temp_sqlite(name: str = "bench") -> str:
+    """
+    Point the application at a fresh SQLite file database
+
+    Must be called BEFORE importing any app modules, because settings are
+    read at import time.
+
+    Args:
+        name: Prefix for the temporary database file
+
+    Returns:
+        str: Path of the database file
+    """
+    fd, path = tempfile.mkstemp(prefix=f"{name}-", suffix=".db")
+    os.close(fd)
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{path}")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("DEBUG", "False")
+    # Benchmarks replay many requests from one client; measure the app, not the limiter
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "False")
+    return path
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        float: Percentile value (0.0 for an empty sample)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies_seconds: List[float]) -> Dict[str, float]:
+    """
+    Summarize a latency sample in milliseconds
+
+    Args:
+        latencies_seconds: Latencies in seconds
+
+    Returns:
+        dict: count, mean, p50, p95, p99 and max in milliseconds
+    """
+    ms = [value * 1000 for value in latencies_seconds]
+    return {
+        "count": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3) if ms else 0.0,
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "max_ms": round(max(ms), 3) if ms else 0.0,
+    }
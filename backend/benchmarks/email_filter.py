@@ -0,0 +1,122 @@
+"""
+Email availability filter benchmark
+이메일 사용 가능 여부 필터의 메모리 사용량 및 처리량 측정
+
+Reports:
+- memory per million registered emails for a few error rates
+- in-process filter build and lookup rates, and the measured false-positive rate
+- rebuild time from the users table and /email-available requests/sec
+  for free (filter-only) and taken (database-confirmed) emails
+
+Usage:
+    python -m benchmarks.email_filter --users 200000 --db-users 20000 --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+
+def filter_only(users: int, error_rate: float) -> dict:
+    """Build an in-memory filter and time adds, lookups and false positives"""
+    from app.utils.bloom import BloomFilter
+
+    bloom = BloomFilter(capacity=users, error_rate=error_rate)
+    started = time.perf_counter()
+    for i in range(users):
+        bloom.add(f"user{i}@example.com")
+    add_seconds = time.perf_counter() - started
+
+    probes = 100000
+    started = time.perf_counter()
+    false_positives = sum(f"free{i}@example.com" in bloom for i in range(probes))
+    lookup_seconds = time.perf_counter() - started
+
+    return {
+        "users": users,
+        "hashes": bloom.num_hashes,
+        "memory_bytes": bloom.memory_bytes,
+        "adds_per_second": round(users / add_seconds),
+        "lookups_per_second": round(probes / lookup_seconds),
+        "false_positive_rate": false_positives / probes,
+    }
+
+
+async def endpoint(args: argparse.Namespace) -> dict:
+    """Seed the database, rebuild the filter and time /email-available"""
+    import httpx
+    from sqlalchemy import insert
+
+    from app.core.database import AsyncSessionLocal, engine, init_db
+    from app.main import app
+    from app.models.user import User
+    from app.services.email_filter import email_filter
+
+    init_db()
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {"email": f"user{i}@example.com", "password_hash": "x", "role": "child"}
+                for i in range(args.db_users)
+            ],
+        )
+
+    async with AsyncSessionLocal() as db:
+        await email_filter.rebuild(db)
+
+    results = {"db_users": args.db_users, "rebuild_ms": email_filter.stats()["rebuild_ms"]}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, template in (("free", "free{}@example.com"), ("taken", "user{}@example.com")):
+            db_checks = email_filter.db_checks
+            latencies = []
+            started = time.perf_counter()
+            for i in range(args.requests):
+                request_started = time.perf_counter()
+                response = await client.get(
+                    "/api/v1/auth/email-available",
+                    params={"email": template.format(i % args.db_users)},
+                )
+                latencies.append(time.perf_counter() - request_started)
+                assert response.json()["available"] is (name == "free")
+            elapsed = time.perf_counter() - started
+            results[name] = {
+                "requests_per_second": round(args.requests / elapsed, 1),
+                "db_checks": email_filter.db_checks - db_checks,
+                "latency": summarize(latencies),
+            }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--users", type=int, default=200000, help="Emails in the in-memory test")
+    parser.add_argument("--db-users", type=int, default=20000, help="Rows seeded in users")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint case")
+    parser.add_argument("--error-rate", type=float, default=0.001)
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("email-filter")
+    try:
+        from app.utils.bloom import BloomFilter
+
+        results = {
+            "memory_per_million_bytes": {
+                str(rate): BloomFilter(1_000_000, rate).memory_bytes
+                for rate in (0.01, 0.001, 0.0001)
+            },
+            "filter": filter_only(args.users, args.error_rate),
+            "endpoint": asyncio.run(endpoint(args)),
+        }
+        print(json.dumps(results, indent=2))
+    finally:
+        os.remove(db_path)
@@ -0,0 +1,184 @@
+"""
+Response serialization benchmark: response_model validation vs fast orjson path
+응답 직렬화 방식별 처리량 비교 (response_model 재검증 vs orjson 빠른 경로)
+
+Measures requests/sec for /login, /me and /children with
+FAST_JSON_RESPONSES off and on. bcrypt runs at a low work factor by
+default so /login reflects request overhead rather than hashing cost.
+
+Usage:
+    python -m benchmarks.json_responses --requests 2000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+PASSWORD = "password123"
+
+
+async def measure(client, method: str, path: str, count: int, concurrency: int, **kwargs) -> dict:
+    """Send the same request count times with bounded concurrency"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def send() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send() for _ in range(count)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests_per_second": round(count / elapsed, 1),
+        "latency": summarize(latencies),
+    }
+
+
+async def serialization_only(iterations: int) -> dict:
+    """
+    Time just the response step for a 3-child list, per response
+
+    validated: hand-built models + FastAPI's response_model validation and
+    json.dumps rendering. fast: model_construct + one model_dump + orjson.
+    """
+    from datetime import datetime, timezone
+
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+
+    from app.core.responses import ORJSONResponse
+    from app.schemas.user import ChildListResponse, UserResponse
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": i,
+            "email": f"child{i}@example.com",
+            "role": "child",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(3)
+    ]
+    field = create_model_field(name="response", type_=ChildListResponse, mode="serialization")
+
+    async def validated() -> bytes:
+        model = ChildListResponse(
+            children=[UserResponse(**row) for row in rows], total=len(rows), max_allowed=3
+        )
+        content = await serialize_response(field=field, response_content=model)
+        return JSONResponse(content).body
+
+    async def fast() -> bytes:
+        model = ChildListResponse.model_construct(
+            children=[UserResponse.model_construct(**row) for row in rows],
+            total=len(rows),
+            max_allowed=3,
+        )
+        return ORJSONResponse(model.model_dump()).body
+
+    timings = {}
+    for name, func in (("validated", validated), ("fast", fast)):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await func()
+        timings[f"{name}_us"] = round((time.perf_counter() - started) / iterations * 1e6, 2)
+    timings["speedup"] = round(timings["validated_us"] / timings["fast_us"], 2)
+    return timings
+
+
+async def main(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from app.core.config import settings
+    from app.core.database import init_db
+    from app.main import app
+    from app.utils.hashing import password_hasher
+
+    init_db()
+    password_hasher.start()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        parent = (
+            await client.post(
+                "/api/v1/auth/signup",
+                json={"email": "parent@example.com", "password": PASSWORD, "role": "parent"},
+            )
+        ).json()
+        headers = {"Authorization": f"Bearer {parent['access_token']}"}
+        for i in range(3):
+            child = (
+                await client.post(
+                    "/api/v1/auth/signup",
+                    json={"email": f"child{i}@example.com", "password": PASSWORD, "role": "child"},
+                )
+            ).json()
+            await client.post(
+                "/api/v1/auth/link-child", json={"child_id": child["user"]["id"]}, headers=headers
+            )
+
+        scenarios = {
+            "login": (
+                "POST",
+                "/api/v1/auth/login",
+                {"json": {"email": "parent@example.com", "password": PASSWORD}},
+                args.requests // 10 or 1,
+            ),
+            "me": ("GET", "/api/v1/auth/me", {"headers": headers}, args.requests),
+            "children": ("GET", "/api/v1/auth/children", {"headers": headers}, args.requests),
+        }
+
+        # Warm up caches (token, user) and connection paths before timing
+        for method, path, kwargs, count in scenarios.values():
+            await measure(client, method, path, min(count, 50), args.concurrency, **kwargs)
+
+        results = {}
+        for mode, fast in (("validated", False), ("fast", True)):
+            settings.FAST_JSON_RESPONSES = fast
+            results[mode] = {
+                name: await measure(client, method, path, count, args.concurrency, **kwargs)
+                for name, (method, path, kwargs, count) in scenarios.items()
+            }
+
+    password_hasher.shutdown()
+    results["speedup"] = {
+        name: round(
+            results["fast"][name]["requests_per_second"]
+            / results["validated"][name]["requests_per_second"],
+            2,
+        )
+        for name in scenarios
+    }
+    results["serialize_only"] = await serialization_only(args.requests * 5)
+    results["bcrypt_rounds"] = int(os.environ["BCRYPT_ROUNDS"])
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per GET scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=4, help="bcrypt work factor")
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("json-responses")
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    os.environ["PASSWORD_HASH_EXECUTOR"] = "thread"
+    try:
+        print(json.dumps(asyncio.run(main(args)), indent=2))
+    finally:
+        os.remove(db_path)
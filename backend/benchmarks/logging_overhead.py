@@ -0,0 +1,177 @@
+"""
+Request latency with logging off, synchronous and queued
+로깅 방식(끔/동기 파일/큐)에 따른 요청 지연 시간 비교
+
+Drives an authenticated GET /me through the ASGI app (in process, no
+network) with concurrent clients and reports latency percentiles for:
+
+    off    no handlers, access log disabled
+    sync   JSON lines written by a file handler on the request thread
+    queue  the LoggingPipeline (request thread only enqueues)
+
+Both logging modes write the access line for every request; --sql-echo
+also logs every SQL statement. --write-delay-ms adds a sleep to every file
+write, standing in for a slow or contended disk: that stall is what the
+queue keeps off the request path.
+
+Usage:
+    python -m benchmarks.logging_overhead --requests 2000 --concurrency 16
+    python -m benchmarks.logging_overhead --sql-echo --write-delay-ms 1
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+
+async def drive(app, token: str, requests: int, concurrency: int) -> list:
+    import httpx
+
+    latencies = []
+    remaining = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", headers=headers
+    ) as client:
+
+        async def worker() -> None:
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get("/api/v1/auth/me")
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def add_write_delay(handler: logging.Handler, delay_ms: float) -> None:
+    """Make every write to the handler stall for delay_ms"""
+    if not delay_ms:
+        return
+    emit = handler.emit
+
+    def slow_emit(record: logging.LogRecord) -> None:
+        time.sleep(delay_ms / 1000)
+        emit(record)
+
+    handler.emit = slow_emit
+
+
+def sync_handler(path: str) -> logging.Handler:
+    """The pipeline's formatting and file rotation, but on the request thread"""
+    from app.core.logs import ContextFilter, JsonFormatter, build_file_handler
+
+    handler = build_file_handler(path)
+    handler.setFormatter(JsonFormatter())
+    handler.addFilter(ContextFilter())
+    return handler
+
+
+async def measure(mode: str, app, token: str, args: argparse.Namespace, log_dir: str) -> dict:
+    from app.core.config import settings
+    from app.core.logs import LoggingPipeline
+
+    root = logging.getLogger()
+    path = os.path.join(log_dir, f"{mode}.log")
+    settings.LOG_FILE_PATH = path
+    settings.LOG_ACCESS = mode != "off"
+    sql_level = logging.INFO if args.sql_echo else logging.WARNING
+    pipeline, handler = None, None
+    if mode == "sync":
+        handler = sync_handler(path)
+        add_write_delay(handler, args.write_delay_ms)
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+        logging.getLogger("sqlalchemy.engine").setLevel(sql_level)
+    elif mode == "queue":
+        pipeline = LoggingPipeline()
+        pipeline.start()
+        for listener_handler in pipeline.listener.handlers:
+            add_write_delay(listener_handler, args.write_delay_ms)
+    try:
+        await drive(app, token, min(200, args.requests), args.concurrency)  # warm up
+        started = time.perf_counter()
+        latencies = await drive(app, token, args.requests, args.concurrency)
+        elapsed = time.perf_counter() - started
+        stats = pipeline.stats() if pipeline else None
+    finally:
+        if pipeline:
+            pipeline.stop()
+        if handler:
+            root.removeHandler(handler)
+            handler.close()
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+    result = summarize(latencies)
+    result["requests_per_second"] = round(len(latencies) / elapsed, 1)
+    if stats:
+        result["dropped"] = stats["dropped"]
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as log_file:
+            result["lines_written"] = sum(1 for _ in log_file)
+    return result
+
+
+async def main(args: argparse.Namespace) -> dict:
+    from app.core.config import settings
+    from app.core.database import SessionLocal, init_db
+    from app.main import app
+    from app.models.user import User
+    from app.utils.security import create_access_token, hash_password
+
+    settings.SQL_ECHO = args.sql_echo
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # The benchmark client's own lines
+    init_db()
+    with SessionLocal() as db:
+        user = User(
+            email="logging@example.com",
+            password_hash=hash_password("password123", 4),
+            role="parent",
+        )
+        db.add(user)
+        db.commit()
+        token = create_access_token({"sub": str(user.id), "email": user.email})
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="logging-bench-") as log_dir:
+        for mode in args.modes:
+            results[mode] = await measure(mode, app, token, args, log_dir)
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "sql_echo": args.sql_echo,
+        "write_delay_ms": args.write_delay_ms,
+        "modes": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--modes", nargs="+", default=["off", "sync", "queue"])
+    parser.add_argument("--sql-echo", action="store_true", help="Also log every SQL statement")
+    parser.add_argument(
+        "--write-delay-ms", type=float, default=0.0, help="Simulated stall per file write"
+    )
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("logging-overhead")
+    # Measure logging, not the caches that would skip the per-request query
+    os.environ.setdefault("USER_CACHE_ENABLED", "False")
+    try:
+        print(json.dumps(asyncio.run(main(args)), indent=2))
+    finally:
+        os.remove(db_path)
@@ -0,0 +1,144 @@
+"""
+Login storm benchmark
+로그인 폭주 중 /me 응답 지연 측정
+
+Fires a burst of concurrent /login requests (each one a bcrypt verify) while
+a probe loop keeps calling /me, and reports /me latency percentiles for:
+
+- idle:   no logins in flight
+- inline: bcrypt runs on the event loop (previous behaviour)
+- pool:   bcrypt runs in the hashing worker pool
+
+Usage:
+    python -m benchmarks.login_storm --logins 40 --probes 100
+    python -m benchmarks.login_storm --executor thread --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+EMAIL = "storm@example.com"
+PASSWORD = "password123"
+
+
+async def probe_me(client, headers, count: int, interval: float) -> list:
+    """Call /me repeatedly and collect latencies"""
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        latencies.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.text
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def login_storm(client, count: int) -> float:
+    """Fire count concurrent logins and return the wall time"""
+    started = time.perf_counter()
+    responses = await asyncio.gather(
+        *(
+            client.post("/api/v1/auth/login", json={"email": EMAIL, "password": PASSWORD})
+            for _ in range(count)
+        )
+    )
+    assert all(r.status_code == 200 for r in responses)
+    return time.perf_counter() - started
+
+
+async def run_scenario(client, headers, logins: int, probes: int, interval: float) -> dict:
+    """Run the probe loop, optionally alongside a login storm"""
+    if logins:
+        storm = asyncio.create_task(login_storm(client, logins))
+        latencies = await probe_me(client, headers, probes, interval)
+        storm_seconds = await storm
+    else:
+        latencies = await probe_me(client, headers, probes, interval)
+        storm_seconds = 0.0
+    result = {"me_latency": summarize(latencies)}
+    if logins:
+        result["storm_seconds"] = round(storm_seconds, 3)
+        result["logins_per_second"] = round(logins / storm_seconds, 2)
+    return result
+
+
+async def main(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from app.api import auth as auth_module
+    from app.core.database import init_db
+    from app.main import app
+    from app.utils import hashing
+    from app.utils.security import verify_password
+
+    init_db()
+
+    async def inline_verify(plain_password: str, hashed_password: str) -> bool:
+        return verify_password(plain_password, hashed_password)
+
+    pooled_verify = auth_module.verify_password_async
+    hashing.password_hasher.start()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post(
+            "/api/v1/auth/signup",
+            json={"email": EMAIL, "password": PASSWORD, "role": "parent"},
+        )
+        login = await client.post(
+            "/api/v1/auth/login", json={"email": EMAIL, "password": PASSWORD}
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        results = {
+            "executor": hashing.password_hasher.executor_type,
+            "workers": hashing.password_hasher.max_workers,
+            "logins": args.logins,
+        }
+        results["idle"] = await run_scenario(client, headers, 0, args.probes, args.interval)
+
+        auth_module.verify_password_async = inline_verify
+        try:
+            results["inline"] = await run_scenario(
+                client, headers, args.logins, args.probes, args.interval
+            )
+        finally:
+            auth_module.verify_password_async = pooled_verify
+
+        hashing.password_hasher.stats.reset()
+        results["pool"] = await run_scenario(
+            client, headers, args.logins, args.probes, args.interval
+        )
+        results["pool"]["hasher"] = hashing.password_hasher.stats.snapshot()
+
+    hashing.password_hasher.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--logins", type=int, default=40, help="Concurrent logins in the storm")
+    parser.add_argument("--probes", type=int, default=100, help="Number of /me probes")
+    parser.add_argument("--interval", type=float, default=0.005, help="Pause between probes (s)")
+    parser.add_argument("--executor", choices=["process", "thread"], default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("login-storm")
+    if args.executor:
+        os.environ["PASSWORD_HASH_EXECUTOR"] = args.executor
+    if args.workers is not None:
+        os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    try:
+        print(json.dumps(asyncio.run(main(args)), indent=2))
+    finally:
+        os.remove(db_path)
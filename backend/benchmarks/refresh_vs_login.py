@@ -0,0 +1,133 @@
+"""
+Token renewal cost benchmark: /login vs /refresh
+토큰 갱신 비용 비교 (/login 재로그인 vs /refresh)
+
+Simulates a population of active clients renewing their access token, once
+by re-running /login (bcrypt verify) and once through /refresh (indexed
+lookup + HMAC), and reports process CPU time per renewal plus the implied
+CPU per active user per hour (one renewal per access-token lifetime).
+
+bcrypt runs in a thread pool here so its CPU time is counted by
+time.process_time().
+
+Usage:
+    python -m benchmarks.refresh_vs_login --users 20 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+PASSWORD = "password123"
+
+
+async def renew_all(client, requests, concurrency: int) -> dict:
+    """Send renewal requests with bounded concurrency and measure CPU/wall time"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def send(path: str, body: dict) -> dict:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(path, json=body)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+            return response.json()
+
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    responses = await asyncio.gather(*(send(path, body) for path, body in requests))
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+    return {
+        "responses": responses,
+        "renewals": len(requests),
+        "cpu_ms_per_renewal": round(cpu / len(requests) * 1000, 3),
+        "renewals_per_second": round(len(requests) / wall, 1),
+        "latency": summarize(latencies),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from app.core.config import settings
+    from app.core.database import init_db
+    from app.main import app
+    from app.utils.hashing import password_hasher
+
+    init_db()
+    password_hasher.start()
+    emails = [f"user{i}@example.com" for i in range(args.users)]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        signups = await asyncio.gather(
+            *(
+                client.post(
+                    "/api/v1/auth/signup",
+                    json={"email": email, "password": PASSWORD, "role": "child"},
+                )
+                for email in emails
+            )
+        )
+        refresh_tokens = [r.json()["refresh_token"] for r in signups]
+
+        login = await renew_all(
+            client,
+            [
+                (
+                    "/api/v1/auth/login",
+                    {"email": email, "password": PASSWORD, "device_id": "relogin"},
+                )
+                for email in emails
+            ]
+            * args.rounds,
+            args.concurrency,
+        )
+
+        refresh = None
+        for _ in range(args.rounds):
+            refresh = await renew_all(
+                client,
+                [("/api/v1/auth/refresh", {"refresh_token": t}) for t in refresh_tokens],
+                args.concurrency,
+            )
+            refresh_tokens = [r["refresh_token"] for r in refresh["responses"]]
+
+    password_hasher.shutdown()
+    renewals_per_hour = 60 / settings.ACCESS_TOKEN_EXPIRE_MINUTES
+    results = {"users": args.users, "renewals_per_user_per_hour": renewals_per_hour}
+    for name, result in (("login", login), ("refresh", refresh)):
+        result.pop("responses")
+        result["cpu_ms_per_active_user_hour"] = round(
+            result["cpu_ms_per_renewal"] * renewals_per_hour, 3
+        )
+        results[name] = result
+    results["cpu_reduction_factor"] = round(
+        login["cpu_ms_per_renewal"] / max(refresh["cpu_ms_per_renewal"], 1e-6), 1
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--users", type=int, default=20, help="Active users")
+    parser.add_argument("--rounds", type=int, default=1, help="Renewals per user")
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("refresh-vs-login")
+    os.environ["PASSWORD_HASH_EXECUTOR"] = "thread"
+    try:
+        print(json.dumps(asyncio.run(main(args)), indent=2))
+    finally:
+        os.remove(db_path)
@@ -0,0 +1,102 @@
+"""
+Signup latency under concurrent duplicate attempts
+동일 이메일 동시 가입 시도 상황의 회원가입 지연 측정
+
+Fires several concurrent signups per email (as double-taps and client
+retries do) and reports latency for the winning and the rejected
+requests, plus the SQL statements each kind of request executes.
+
+Usage:
+    python -m benchmarks.signup_conflicts --emails 50 --attempts 4 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+PASSWORD = "password123"
+
+
+async def main(args: argparse.Namespace) -> dict:
+    import httpx
+    from sqlalchemy import event
+
+    from app.core.database import async_engine, init_db
+    from app.main import app
+    from app.utils.hashing import password_hasher
+
+    init_db()
+    password_hasher.start()
+
+    statements = {"count": 0}
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def count_statement(*_):
+        statements["count"] += 1
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = {201: [], 400: []}
+
+    async def signup(client, email: str) -> int:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/v1/auth/signup",
+                json={"email": email, "password": PASSWORD, "role": "child"},
+            )
+            latencies[response.status_code].append(time.perf_counter() - started)
+            return response.status_code
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Statements per request kind, measured in isolation
+        statements["count"] = 0
+        await signup(client, "probe@example.com")
+        created_statements = statements["count"]
+        statements["count"] = 0
+        await signup(client, "probe@example.com")
+        duplicate_statements = statements["count"]
+        latencies = {201: [], 400: []}
+
+        emails = [f"user{i}@example.com" for i in range(args.emails)]
+        requests = [email for email in emails for _ in range(args.attempts)]
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*(signup(client, email) for email in requests))
+        elapsed = time.perf_counter() - started
+
+    password_hasher.shutdown()
+    return {
+        "requests": len(requests),
+        "created": statuses.count(201),
+        "rejected_duplicates": statuses.count(400),
+        "requests_per_second": round(len(requests) / elapsed, 1),
+        "created_latency": summarize(latencies[201]),
+        "duplicate_latency": summarize(latencies[400]),
+        "statements_per_created_signup": created_statements,
+        "statements_per_duplicate_signup": duplicate_statements,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--emails", type=int, default=50, help="Distinct emails")
+    parser.add_argument("--attempts", type=int, default=4, help="Concurrent attempts per email")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt work factor")
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("signup-conflicts")
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    os.environ["PASSWORD_HASH_EXECUTOR"] = "thread"
+    try:
+        print(json.dumps(asyncio.run(main(args)), indent=2))
+    finally:
+        os.remove(db_path)
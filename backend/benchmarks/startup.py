@@ -0,0 +1,142 @@
+"""
+Worker startup benchmark
+워커 시작 비용 측정 (import 시간 및 첫 요청까지의 시간)
+
+Runs fresh interpreters and reports:
+- the `python -X importtime` cumulative cost of `import app.main`, with the
+  most expensive top-level packages
+- time to first request: interpreter start -> lifespan startup -> first
+  GET /health answered
+
+Exits with status 1 if the median of either figure exceeds its budget, so
+it can guard CI against import-cost regressions.
+
+Usage:
+    python -m benchmarks.startup --runs 5 --import-budget-ms 2500 --ready-budget-ms 4000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+FIRST_REQUEST = """
+import asyncio, httpx
+from app.main import app
+
+async def main():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            assert (await client.get("/health")).status_code == 200
+
+asyncio.run(main())
+"""
+
+
+def child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite://")
+    env.setdefault("PASSWORD_HASH_EXECUTOR", "thread")
+    env.setdefault("DEBUG", "False")
+    return env
+
+
+def import_profile() -> Tuple[float, Dict[str, float]]:
+    """Cumulative import time of app.main and per top-level package (ms)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        env=child_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # importtime lists children before their parent; depth-1 lines directly
+    # preceding the "app.main" line are the packages app.main pulled in
+    total = 0.0
+    pending: Dict[str, float] = defaultdict(float)
+    packages: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        if depth == 1:
+            pending[name.split(".")[0]] += int(cumulative) / 1000
+        elif depth == 0:
+            if name == "app.main":
+                total = int(cumulative) / 1000
+                packages = dict(pending)
+            pending = defaultdict(float)
+    return total, packages
+
+
+def time_to_first_request() -> float:
+    """Wall time from interpreter launch to the first answered request (ms)"""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST],
+        cwd=BACKEND_DIR,
+        env=child_env(),
+        capture_output=True,
+        check=True,
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def main(args: argparse.Namespace) -> Tuple[dict, List[str]]:
+    # One untimed run so bytecode compilation doesn't count
+    import_profile()
+
+    import_totals = []
+    package_totals: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(args.runs):
+        total, packages = import_profile()
+        import_totals.append(total)
+        for name, value in packages.items():
+            package_totals[name].append(value)
+    ready = [time_to_first_request() for _ in range(args.runs)]
+
+    top = sorted(
+        ((name, statistics.median(values)) for name, values in package_totals.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )[: args.top]
+    results = {
+        "runs": args.runs,
+        "import_app_main_ms": round(statistics.median(import_totals), 1),
+        "time_to_first_request_ms": round(statistics.median(ready), 1),
+        "top_packages_ms": {name: round(value, 1) for name, value in top},
+        "budgets_ms": {"import": args.import_budget_ms, "ready": args.ready_budget_ms},
+    }
+
+    failures = []
+    if results["import_app_main_ms"] > args.import_budget_ms:
+        failures.append("import budget exceeded")
+    if results["time_to_first_request_ms"] > args.ready_budget_ms:
+        failures.append("time-to-first-request budget exceeded")
+    return results, failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Packages to list")
+    parser.add_argument("--import-budget-ms", type=float, default=2500)
+    parser.add_argument("--ready-budget-ms", type=float, default=4000)
+    args = parser.parse_args()
+
+    results, failures = main(args)
+    results["failures"] = failures
+    print(json.dumps(results, indent=2))
+    sys.exit(1 if failures else 0)
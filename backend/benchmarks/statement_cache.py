@@ -0,0 +1,153 @@
+"""
+Prebuilt vs per-request statements for the hot auth lookups
+자주 쓰는 조회 쿼리: 요청마다 생성 vs 미리 생성한 문장(바인드 파라미터) 비교
+
+For each lookup in app.models.statements, reports microseconds per call for
+
+    build      constructing the select() (what a prebuilt statement skips)
+    cache_key  construction + deriving the compiled-cache key
+    execute    a full AsyncSession.execute() on a SQLite file, for the
+               per-request select(), a lambda_stmt() and the prebuilt statement
+
+The database round trip is the same in every variant, so the execute
+difference is the Python (CPU) time saved per query.
+
+Usage:
+    python -m benchmarks.statement_cache --iterations 5000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import use_temp_sqlite  # noqa: E402
+
+
+def per_call_us(func, iterations: int) -> float:
+    func()  # warm up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return round((time.perf_counter() - started) / iterations * 1e6, 2)
+
+
+async def per_call_us_async(func, iterations: int) -> float:
+    await func()  # warm up (fills the compiled cache)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    return round((time.perf_counter() - started) / iterations * 1e6, 2)
+
+
+def lookups(seed: dict) -> dict:
+    """name -> (per-request builder, lambda_stmt builder or None, prebuilt statement, params)"""
+    from sqlalchemy import func, lambda_stmt, select
+
+    from app.models import statements
+    from app.models.user import ParentChildLink, User
+
+    user_id, email = seed["user_id"], seed["email"]
+    parent_id, child_id = seed["parent_id"], seed["child_id"]
+    return {
+        "user_by_id": (
+            lambda: select(User).where(User.id == user_id),
+            lambda: lambda_stmt(lambda: select(User).where(User.id == user_id)),
+            statements.USER_BY_ID,
+            {"user_id": user_id},
+        ),
+        "user_by_email": (
+            lambda: select(User).where(func.lower(User.email) == email),
+            None,  # lambda_stmt can't analyze a closure over func.lower() (RecursionError)
+            statements.USER_BY_EMAIL,
+            {"email": email},
+        ),
+        "link_by_pair": (
+            lambda: select(ParentChildLink).where(
+                ParentChildLink.parent_id == parent_id, ParentChildLink.child_id == child_id
+            ),
+            lambda: lambda_stmt(
+                lambda: select(ParentChildLink).where(
+                    ParentChildLink.parent_id == parent_id,
+                    ParentChildLink.child_id == child_id,
+                )
+            ),
+            statements.LINK_BY_PAIR,
+            {"parent_id": parent_id, "child_id": child_id},
+        ),
+    }
+
+
+def seed_rows() -> dict:
+    from app.core.database import SessionLocal, init_db
+    from app.models.user import ParentChildLink, User
+
+    init_db()
+    with SessionLocal() as db:
+        parent = User(email="statements@example.com", password_hash="x", role="parent")
+        child = User(email="statements.child@example.com", password_hash="x", role="child")
+        db.add_all([parent, child])
+        db.flush()
+        db.add(ParentChildLink(parent_id=parent.id, child_id=child.id))
+        db.commit()
+        return {
+            "user_id": parent.id,
+            "email": parent.email,
+            "parent_id": parent.id,
+            "child_id": child.id,
+        }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    from app.core.database import AsyncSessionLocal
+
+    results = {}
+    async with AsyncSessionLocal() as db:
+        for name, (build, build_lambda, prebuilt, params) in lookups(seed_rows()).items():
+            n = args.iterations
+
+            async def run_rebuilt():
+                (await db.execute(build())).first()
+                db.expunge_all()
+
+            async def run_lambda():
+                (await db.execute(build_lambda())).first()
+                db.expunge_all()
+
+            async def run_prebuilt():
+                (await db.execute(prebuilt, params)).first()
+                db.expunge_all()
+
+            execute = {"per_request": await per_call_us_async(run_rebuilt, n)}
+            if build_lambda is not None:
+                execute["lambda_stmt"] = await per_call_us_async(run_lambda, n)
+            execute["prebuilt"] = await per_call_us_async(run_prebuilt, n)
+            results[name] = {
+                "build_us": per_call_us(build, n),
+                "cache_key_us": {
+                    "per_request": per_call_us(lambda: build()._generate_cache_key(), n),
+                    "prebuilt": per_call_us(prebuilt._generate_cache_key, n),
+                },
+                "execute_us": execute,
+                "execute_saving_pct": round(
+                    (1 - execute["prebuilt"] / execute["per_request"]) * 100, 1
+                ),
+            }
+    return {"iterations": args.iterations, "queries": results}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("statement-cache")
+    try:
+        print(json.dumps(asyncio.run(main(args)), indent=2))
+    finally:
+        os.remove(db_path)
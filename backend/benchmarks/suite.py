@@ -0,0 +1,325 @@
+"""
+Auth API benchmark suite
+인증 API 성능 벤치마크 모음 (기준값 비교 포함)
+
+Drives signup, login, /me, link/unlink and /children through the ASGI app
+at a fixed concurrency and reports throughput and latency percentiles per
+scenario as JSON. Each scenario is timed --repeats times after a warm-up.
+With --baseline the results are compared against a stored run; a scenario
+regresses when its median-run p95 latency rises, or its median-run
+throughput drops, by more than --tolerance, or when any request fails.
+The exit status is 1 on any regression.
+
+The default database is a fresh SQLite file. Pass --database-url to run
+against a local PostgreSQL (the tables are created if missing; all rows use
+a per-run email prefix, so repeated runs do not collide).
+
+benchmarks/baseline.json is the stored reference. Refresh it with
+--save-baseline on the machine the comparison runs on, since absolute
+numbers only compare on the same hardware.
+
+Usage:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --baseline benchmarks/baseline.json
+    python -m benchmarks.suite --database-url postgresql://user:pw@localhost/bench \\
+        --output results.json
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+PASSWORD = "password123"
+SCENARIOS = ("signup", "login", "me", "link", "unlink", "children")
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+class Recorder:
+    """Latencies and failures for one scenario, over one or more timed runs"""
+
+    def __init__(self) -> None:
+        self.runs: List[Dict[str, float]] = []
+        self.latencies: List[float] = []
+        self.errors = 0
+        self._run_start = 0
+
+    async def call(self, request: Callable[[], Awaitable], expected: int) -> None:
+        started = time.perf_counter()
+        response = await request()
+        self.latencies.append(time.perf_counter() - started)
+        if response.status_code != expected:
+            self.errors += 1
+
+    def end_run(self, elapsed: float) -> None:
+        """Close a timed run that started after the previous end_run()"""
+        run = self.latencies[self._run_start :]
+        self._run_start = len(self.latencies)
+        self.runs.append(
+            {
+                "p95_ms": summarize(run)["p95_ms"],
+                "requests_per_second": round(len(run) / elapsed, 1) if elapsed else 0.0,
+            }
+        )
+
+    def result(self) -> dict:
+        """
+        Percentiles over all samples; p95 and throughput as the median run
+        (what the baseline comparison uses, since single runs are noisy)
+        """
+        result = summarize(self.latencies)
+        result["errors"] = self.errors
+        result["median_run_p95_ms"] = statistics.median(run["p95_ms"] for run in self.runs)
+        result["requests_per_second"] = statistics.median(
+            run["requests_per_second"] for run in self.runs
+        )
+        result["runs"] = self.runs
+        return result
+
+
+async def run_workers(
+    concurrency: int, requests: int, worker: Callable[[int, int], Awaitable]
+) -> float:
+    """
+    Split requests over concurrency workers and return the wall time
+
+    worker(slot, iteration) performs one unit of work for its slot.
+    """
+    per_worker = [
+        requests // concurrency + (slot < requests % concurrency) for slot in range(concurrency)
+    ]
+
+    async def loop(slot: int) -> None:
+        for iteration in range(per_worker[slot]):
+            await worker(slot, iteration)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop(slot) for slot in range(concurrency)))
+    return time.perf_counter() - started
+
+
+async def signup(client, email: str, role: str) -> dict:
+    response = await client.post(
+        "/api/v1/auth/signup", json={"email": email, "password": PASSWORD, "role": role}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def main(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from app.core.database import init_db
+    from app.main import app
+    from app.utils.hashing import password_hasher
+
+    init_db()
+    password_hasher.start()
+    run = uuid.uuid4().hex[:8]
+    concurrency = args.concurrency
+    recorders: Dict[str, Recorder] = {name: Recorder() for name in SCENARIOS}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Seed one parent per worker slot with three children (one of which
+        # is left unlinked for the link/unlink scenario)
+        parents = []
+        for slot in range(concurrency):
+            parent = await signup(client, f"{run}-parent{slot}@example.com", "parent")
+            headers = {"Authorization": f"Bearer {parent['access_token']}"}
+            children = [
+                (await signup(client, f"{run}-child{slot}-{n}@example.com", "child"))["user"]["id"]
+                for n in range(3)
+            ]
+            response = await client.post(
+                "/api/v1/auth/link-children", json={"child_ids": children[:2]}, headers=headers
+            )
+            assert response.status_code == 200, response.text
+            parents.append(
+                {"email": parent["user"]["email"], "headers": headers, "spare": children[2]}
+            )
+
+        signup_ids = itertools.count()
+
+        async def do_signup(slot: int, iteration: int) -> None:
+            email = f"{run}-signup{next(signup_ids)}@example.com"
+            await recorders["signup"].call(
+                lambda: client.post(
+                    "/api/v1/auth/signup",
+                    json={"email": email, "password": PASSWORD, "role": "parent"},
+                ),
+                201,
+            )
+
+        async def do_login(slot: int, iteration: int) -> None:
+            await recorders["login"].call(
+                lambda: client.post(
+                    "/api/v1/auth/login",
+                    json={"email": parents[slot]["email"], "password": PASSWORD},
+                ),
+                200,
+            )
+
+        async def do_me(slot: int, iteration: int) -> None:
+            await recorders["me"].call(
+                lambda: client.get("/api/v1/auth/me", headers=parents[slot]["headers"]), 200
+            )
+
+        async def do_link_unlink(slot: int, iteration: int) -> None:
+            parent = parents[slot]
+            await recorders["link"].call(
+                lambda: client.post(
+                    "/api/v1/auth/link-child",
+                    json={"child_id": parent["spare"]},
+                    headers=parent["headers"],
+                ),
+                201,
+            )
+            await recorders["unlink"].call(
+                lambda: client.delete(
+                    f"/api/v1/auth/link-child/{parent['spare']}", headers=parent["headers"]
+                ),
+                200,
+            )
+
+        async def do_children(slot: int, iteration: int) -> None:
+            await recorders["children"].call(
+                lambda: client.get("/api/v1/auth/children", headers=parents[slot]["headers"]),
+                200,
+            )
+
+        phases = [
+            (("signup",), do_signup),
+            (("login",), do_login),
+            (("me",), do_me),
+            (("link", "unlink"), do_link_unlink),
+            (("children",), do_children),
+        ]
+        for names, worker in phases:
+            # Warm-up pass, then reset and measure
+            await run_workers(concurrency, min(args.requests, concurrency * 2), worker)
+            for name in names:
+                recorders[name] = Recorder()
+            for _ in range(args.repeats):
+                elapsed = await run_workers(concurrency, args.requests, worker)
+                for name in names:
+                    recorders[name].end_run(elapsed)
+
+    password_hasher.shutdown()
+    return {
+        "meta": {
+            "database": os.environ["DATABASE_URL"].split("://", 1)[0],
+            "concurrency": concurrency,
+            "requests": args.requests,
+            "repeats": args.repeats,
+            "bcrypt_rounds": args.rounds,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "scenarios": {name: recorders[name].result() for name in SCENARIOS},
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> dict:
+    """
+    Compare median-run p95 latency and throughput per scenario against a baseline
+
+    Args:
+        results: Output of main()
+        baseline: Stored output of an earlier run
+        tolerance: Allowed relative change (0.25 = 25%)
+
+    Returns:
+        dict: Per-scenario ratios plus the list of regressed scenarios
+    """
+    scenarios = {}
+    regressions = []
+    for name, current in results["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if not reference:
+            continue
+        p95_ratio = (
+            current["median_run_p95_ms"] / reference["median_run_p95_ms"]
+            if reference["median_run_p95_ms"]
+            else 1.0
+        )
+        rps_ratio = (
+            current["requests_per_second"] / reference["requests_per_second"]
+            if reference["requests_per_second"]
+            else 1.0
+        )
+        regressed = (
+            p95_ratio > 1 + tolerance or rps_ratio < 1 - tolerance or current["errors"] > 0
+        )
+        scenarios[name] = {
+            "p95_ratio": round(p95_ratio, 3),
+            "throughput_ratio": round(rps_ratio, 3),
+            "regressed": regressed,
+        }
+        if regressed:
+            regressions.append(name)
+    return {"tolerance": tolerance, "scenarios": scenarios, "regressions": regressions}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--database-url", help="Database to benchmark (default: temporary SQLite)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per run")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per scenario")
+    parser.add_argument("--rounds", type=int, default=4, help="bcrypt work factor")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const=str(DEFAULT_BASELINE),
+        help="Compare against this report (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed relative regression")
+    parser.add_argument("--save-baseline", help="Write the results as the new baseline")
+    args = parser.parse_args()
+
+    db_path = None
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        db_path = use_temp_sqlite("suite")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("DEBUG", "False")
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "False")
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    os.environ["PASSWORD_HASH_EXECUTOR"] = "thread"
+    try:
+        report = asyncio.run(main(args))
+    finally:
+        if db_path:
+            os.remove(db_path)
+
+    regressed = False
+    if args.baseline:
+        with open(args.baseline) as handle:
+            report["comparison"] = compare(report, json.load(handle), args.tolerance)
+        regressed = bool(report["comparison"]["regressions"])
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    if args.save_baseline:
+        baseline = {key: report[key] for key in ("meta", "scenarios")}
+        Path(args.save_baseline).write_text(json.dumps(baseline, indent=2) + "\n")
+    sys.exit(1 if regressed else 0)
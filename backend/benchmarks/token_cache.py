@@ -0,0 +1,114 @@
+"""
+get_current_user throughput benchmark
+토큰 캐시 사용 여부에 따른 get_current_user 처리량 측정
+
+Calls the get_current_user dependency directly (no HTTP layer) with the same
+token over and over, once with the verified-token cache disabled and once
+with it enabled, and reports calls per second. The token-decoding step is
+also timed on its own, since the user lookup dominates the full dependency.
+
+Usage:
+    python -m benchmarks.token_cache --iterations 5000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import use_temp_sqlite  # noqa: E402
+
+
+async def measure(iterations: int, credentials, session_factory, get_current_user) -> dict:
+    """Run get_current_user in a loop and return throughput figures"""
+    async with session_factory() as db:
+        await get_current_user(credentials, db)  # warm up
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await get_current_user(credentials, db)
+        elapsed = time.perf_counter() - started
+    return {
+        "iterations": iterations,
+        "seconds": round(elapsed, 4),
+        "calls_per_second": round(iterations / elapsed, 1),
+        "us_per_call": round(elapsed / iterations * 1e6, 2),
+    }
+
+
+def measure_decode(iterations: int, token: str, decode) -> dict:
+    """Time the token decoding step alone"""
+    decode(token)  # warm up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        decode(token)
+    elapsed = time.perf_counter() - started
+    return {
+        "iterations": iterations,
+        "us_per_call": round(elapsed / iterations * 1e6, 2),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    from fastapi.security import HTTPAuthorizationCredentials
+
+    from app.api.dependencies import get_current_user
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal, SessionLocal, init_db
+    from app.models.user import User
+    from app.utils.security import create_access_token, decode_access_token, hash_password
+    from app.utils.token_cache import token_cache
+
+    init_db()
+    with SessionLocal() as db:
+        user = User(
+            email="bench@example.com",
+            password_hash=hash_password("password123"),
+            role="parent",
+        )
+        db.add(user)
+        db.commit()
+        token = create_access_token({"sub": str(user.id), "email": user.email})
+
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    results = {}
+
+    settings.TOKEN_CACHE_ENABLED = False
+    results["without_cache"] = await measure(
+        args.iterations, credentials, AsyncSessionLocal, get_current_user
+    )
+
+    settings.TOKEN_CACHE_ENABLED = True
+    token_cache.clear()
+    results["with_cache"] = await measure(
+        args.iterations, credentials, AsyncSessionLocal, get_current_user
+    )
+    results["with_cache"]["cache"] = token_cache.stats()
+
+    results["speedup"] = round(
+        results["with_cache"]["calls_per_second"]
+        / results["without_cache"]["calls_per_second"],
+        2,
+    )
+
+    results["decode_only"] = {
+        "jose_decode": measure_decode(args.iterations, token, decode_access_token),
+        "cached_decode": measure_decode(args.iterations, token, token_cache.decode),
+    }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("token-cache")
+    try:
+        print(json.dumps(asyncio.run(main(args)), indent=2))
+    finally:
+        os.remove(db_path)
@@ -0,0 +1,188 @@
+"""
+Throughput scaling across server workers
+서버 워커 수(1~N)에 따른 처리량 측정
+
+Starts the production launcher (gunicorn + uvicorn workers) with 1..N
+workers on a local port and drives an authenticated GET /me over real
+HTTP from separate client processes, reporting requests per second and
+latency percentiles for each worker count.
+
+The load generator shares the machine with the server, so leave it cores
+of its own (e.g. --client-processes 2 on an 8-core box and compare up to
+6 workers); otherwise the numbers flatten because the client saturates.
+
+Usage:
+    python -m benchmarks.worker_scaling --workers 1 2 4 --duration 10
+    python -m benchmarks.worker_scaling --path /health --connections 64
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.common import summarize, use_temp_sqlite  # noqa: E402
+
+EMAIL = "scaling@example.com"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed_user() -> str:
+    """Create the benchmark user and return an access token for it"""
+    from app.core.database import SessionLocal, init_db
+    from app.models.user import User
+    from app.utils.security import create_access_token, hash_password
+
+    init_db()
+    with SessionLocal() as db:
+        user = User(email=EMAIL, password_hash=hash_password("password123", 4), role="parent")
+        db.add(user)
+        db.commit()
+        return create_access_token({"sub": str(user.id), "email": EMAIL, "role": "parent"})
+
+
+def client_process(url: str, token: str, connections: int, duration: float, queue) -> None:
+    """Closed-loop load: each connection sends its next request when the last one returns"""
+    import httpx
+
+    async def run() -> tuple:
+        latencies, errors = [], 0
+        deadline = time.perf_counter() + duration
+        limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+        headers = {"Authorization": f"Bearer {token}"}
+        async with httpx.AsyncClient(limits=limits, headers=headers, timeout=30) as client:
+
+            async def connection() -> None:
+                nonlocal errors
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    response = await client.get(url)
+                    latencies.append(time.perf_counter() - started)
+                    errors += response.status_code != 200
+
+            await asyncio.gather(*(connection() for _ in range(connections)))
+        return latencies, errors
+
+    queue.put(asyncio.run(run()))
+
+
+def wait_until_ready(base_url: str, timeout: float = 60.0) -> None:
+    import httpx
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("Server did not become ready")
+
+
+def measure(workers: int, token: str, args: argparse.Namespace) -> dict:
+    port = free_port()
+    pidfile = os.path.join(tempfile.gettempdir(), f"scaling-{port}.pid")
+    env = {
+        **os.environ,
+        "WEB_WORKERS": str(workers),
+        "API_PORT": str(port),
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "GUNICORN_PIDFILE": pidfile,
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(base_url)
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        per_process = max(1, args.connections // args.client_processes)
+        # Warm-up (fills every worker's token and user caches)
+        client_process(f"{base_url}{args.path}", token, per_process, 1.0, queue)
+        queue.get()
+
+        clients = [
+            context.Process(
+                target=client_process,
+                args=(f"{base_url}{args.path}", token, per_process, args.duration, queue),
+            )
+            for _ in range(args.client_processes)
+        ]
+        for process in clients:
+            process.start()
+        latencies, errors = [], 0
+        for _ in clients:
+            sample, failed = queue.get()
+            latencies.extend(sample)
+            errors += failed
+        for process in clients:
+            process.join()
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+    result = summarize(latencies)
+    result["errors"] = errors
+    result["requests_per_second"] = round(len(latencies) / args.duration, 1)
+    return result
+
+
+def main(args: argparse.Namespace) -> dict:
+    token = seed_user()
+    results = {}
+    for workers in args.workers:
+        results[str(workers)] = measure(workers, token, args)
+    base = results[str(args.workers[0])]["requests_per_second"] or 1.0
+    for result in results.values():
+        result["speedup"] = round(result["requests_per_second"] / base, 2)
+    return {
+        "cpus": os.cpu_count(),
+        "path": args.path,
+        "connections": args.connections,
+        "client_processes": args.client_processes,
+        "duration_seconds": args.duration,
+        "workers": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--workers", type=int, nargs="+", help="Worker counts to compare")
+    parser.add_argument("--path", default="/api/v1/auth/me")
+    parser.add_argument("--connections", type=int, default=32, help="Concurrent connections")
+    parser.add_argument("--client-processes", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per worker count")
+    args = parser.parse_args()
+
+    db_path = use_temp_sqlite("worker-scaling")
+    os.environ["PASSWORD_HASH_EXECUTOR"] = "thread"
+    if not args.workers:
+        from app.server import available_cpus
+
+        args.workers = list(range(1, available_cpus() + 1))
+    try:
+        print(json.dumps(main(args), indent=2))
+    finally:
+        os.remove(db_path)
@@ -1,6 +1,10 @@
 """
 Database initialization script
-데이터베이스 테이블을 생성합니다.
+데이터베이스 스키마를 최신 마이그레이션으로 생성/업그레이드합니다.
+
+Runs the Alembic migrations (same as `alembic upgrade head`). A database
+created by the old create_all version of this script is stamped at the
+baseline revision first, then upgraded.
 
 Usage:
     python init_db.py
@@ -12,7 +16,7 @@ from pathlib import Path
 # Add app directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.core.database import Base, engine, init_db
+from app.core.database import Base, run_migrations
 from app.models.user import User, ParentChildLink
 
 print("=" * 60)
@@ -23,14 +27,13 @@ print("\n[1/2] Importing models...")
 print(f"✓ User model: {User.__tablename__}")
 print(f"✓ ParentChildLink model: {ParentChildLink.__tablename__}")
 
-print("\n[2/2] Creating database tables...")
+print("\n[2/2] Applying migrations (alembic upgrade head)...")
 try:
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-    print("✓ Database tables created successfully!")
+    run_migrations()
+    print("✓ Database schema is up to date!")
 
-    # List created tables
-    print("\nCreated tables:")
+    # List tables
+    print("\nTables:")
     for table_name in Base.metadata.tables:
         print(f"  • {table_name}")
 
@@ -39,11 +42,11 @@ try:
     print("=" * 60)
     print("\nYou can now start the API server:")
     print("  cd backend")
-    print("  uvicorn app.main:app --reload")
+    print("  python -m app.server")
     print("\nOr run the test:")
     print("  python test_signup_api.py")
     print("=" * 60)
 
 except Exception as e:
-    print(f"✗ Error creating database tables: {e}")
+    print(f"✗ Error applying migrations: {e}")
     sys.exit(1)
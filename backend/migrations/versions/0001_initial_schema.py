@@ -0,0 +1,62 @@
+"""initial schema
+
+users and parent_child_links, as created by the original init_db.py
+(Base.metadata.create_all) before refresh tokens and migrations existed.
+Databases created that way are marked with `alembic stamp 0001` and then
+upgraded.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 23:20:50.779017
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("password_hash", sa.String(length=255), nullable=False),
+        sa.Column("role", sa.String(length=20), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"], unique=False)
+
+    op.create_table(
+        "parent_child_links",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("parent_id", sa.Integer(), nullable=False),
+        sa.Column("child_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "linked_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["child_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["parent_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("parent_id", "child_id", name="uq_parent_child"),
+    )
+    op.create_index("ix_parent_child_links_id", "parent_child_links", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("parent_child_links")
+    op.drop_table("users")
@@ -0,0 +1,48 @@
+"""child-side link and lower(email) indexes
+
+uq_parent_child (parent_id, child_id) only serves lookups by parent.
+Lookups by child (User.parents, ON DELETE CASCADE from users.child_id)
+scanned parent_child_links; (child_id, parent_id) covers them without
+touching the table. lower(email) serves the case-insensitive login lookup.
+
+IF NOT EXISTS: databases built with create_all from the current models
+already have both indexes when they are stamped.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 23:40:12.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_parent_child_links_child_id",
+        "parent_child_links",
+        ["child_id", "parent_id"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.drop_index("ix_parent_child_links_child_id", table_name="parent_child_links")
@@ -0,0 +1,62 @@
+"""store emails in lower case, unique on lower(email)
+
+Signup now lower-cases emails, and login matches them exactly. Existing
+rows are lower-cased here, and ix_users_email_lower becomes unique so
+that addresses differing only in case cannot both be registered.
+
+Accounts that already exist under several casings of one address cannot
+be merged automatically; the upgrade stops and lists them instead.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:12:40.501273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Emails registered more than once with different case must be merged "
+            f"or renamed before upgrading: {', '.join(sorted(duplicates))}"
+        )
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    # Emails stay lower-cased; only the index loses its uniqueness
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=False,
+    )
@@ -3,39 +3,97 @@ Pytest fixtures for authentication API tests
 인증 API 테스트를 위한 pytest fixtures
 """
 
+import asyncio
 import os
 import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+# Test database (SQLite file shared by sync fixtures and the async app)
+TEST_DB_PATH = os.path.join(tempfile.gettempdir(), f"eduguard-test-{os.getpid()}.db")
+TEST_DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
 
 # Set test environment variables BEFORE importing app modules
-os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing"
 os.environ["DEBUG"] = "False"
+os.environ["PASSWORD_HASH_EXECUTOR"] = "thread"
+os.environ["BCRYPT_ROUNDS"] = "5"  # Keep hashing fast; tests don't need production cost
+os.environ["RATE_LIMIT_ENABLED"] = "False"  # Enabled explicitly in test_rate_limit.py
+os.environ["LOG_FILE_PATH"] = ""  # Keep app logs out of the working tree
 
 import pytest
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_read_db, get_async_database_url
 from app.models.user import User, ParentChildLink
+from app.core.instrumentation import instrument_query_timing
+from app.core.query_stats import capture_queries
+from app.core.config import settings
+from app.core.rate_limit import rate_limiter
+from app.services.email_filter import email_filter
+from app.services.user_cache import user_cache
 from app.utils.security import hash_password
+from app.utils.token_cache import token_cache
 
 
-# Test database URL (SQLite in-memory)
-TEST_DATABASE_URL = "sqlite:///:memory:"
-
-# Create test engine with StaticPool for SQLite in-memory
+# Create sync test engine (fixtures seed and inspect data through it)
 test_engine = create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
 
-# Create test session factory
+# Create async test engine used by the app under test
+# NullPool: every TestClient runs its own event loop, so connections must not
+# be reused across tests
+test_async_engine = create_async_engine(
+    get_async_database_url(TEST_DATABASE_URL),
+    poolclass=NullPool,
+)
+
+# Count the app's statements (assert_max_queries)
+instrument_query_timing(test_async_engine)
+
+# Create test session factories
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+TestAsyncSessionLocal = async_sessionmaker(
+    bind=test_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_database_file() -> Generator[str, None, None]:
+    """
+    Remove the SQLite test database file after the test session.
+    테스트 세션 종료 후 SQLite 테스트 DB 파일을 삭제합니다.
+    """
+    yield TEST_DB_PATH
+    test_engine.dispose()
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator[None, None, None]:
+    """
+    Reset in-process caches so IDs reused across tests never hit stale entries.
+    테스트 간 ID 재사용으로 인한 캐시 오염을 막기 위해 캐시를 초기화합니다.
+    """
+    token_cache.clear()
+    asyncio.run(user_cache.clear())
+    asyncio.run(rate_limiter.clear())
+    email_filter.clear()
+    yield
 
 
 @pytest.fixture(scope="function")
@@ -63,15 +121,19 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
     Create a test client with database session override.
     데이터베이스 세션을 오버라이드한 테스트 클라이언트를 생성합니다.
     """
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with TestAsyncSessionLocal() as session:
+            yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     with TestClient(app) as test_client:
+        # The email filter loads in the background; wait as a warm worker would
+        deadline = time.monotonic() + 5
+        while settings.EMAIL_FILTER_ENABLED and not email_filter.ready:
+            assert time.monotonic() < deadline, "Email filter did not load"
+            time.sleep(0.005)
         yield test_client
 
     app.dependency_overrides.clear()
@@ -176,3 +238,33 @@ def child_auth_headers(child_token: str) -> dict:
     자녀 토큰이 포함된 인증 헤더를 가져옵니다.
     """
     return {"Authorization": f"Bearer {child_token}"}
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    Fail if a block runs more SQL statements than allowed, or repeats one
+    statement (a likely N+1 loop).
+    블록 안에서 실행된 SQL 수가 한도를 넘거나 같은 쿼리가 반복되면 실패합니다.
+
+    Usage:
+        def test_children(client, assert_max_queries):
+            with assert_max_queries(2):
+                client.get("/api/v1/auth/children", headers=...)
+    """
+    @contextmanager
+    def check(limit: int, allow_repeats: bool = False):
+        with capture_queries() as stats:
+            yield stats
+        executed = "\n".join(
+            f"  {count}x {' '.join(statement.split())}"
+            for statement, count in stats.statements.most_common()
+        )
+        assert stats.count <= limit, (
+            f"Expected at most {limit} statements, ran {stats.count}:\n{executed}"
+        )
+        if not allow_repeats:
+            repeated = stats.repeated(2)
+            assert not repeated, f"Statement repeated (possible N+1):\n{executed}"
+
+    return check
@@ -12,11 +12,17 @@ Authentication API Unit Tests (CLEAN-10)
 - [x] 최대 3개 제한 테스트
 """
 
+import asyncio
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.main import app
 from app.models.user import User, ParentChildLink
+from app.services.email_filter import email_filter
+from app.utils.hashing import password_hasher
 
 
 class TestSignup:
@@ -92,6 +98,101 @@ class TestSignup:
         data = response.json()
         assert "already registered" in data["detail"].lower()
 
+    def test_signup_duplicate_email_skips_hashing(
+        self, client: TestClient, parent_user: User
+    ):
+        """
+        중복 이메일 회원가입 시 비밀번호 해싱 생략 테스트
+        A registered email is rejected before any bcrypt work.
+        """
+        # Given
+        email_filter.add(parent_user.email)  # As after the next filter refresh
+        submitted = password_hasher.stats.submitted
+        signup_data = {
+            "email": "parent@test.com",
+            "password": "anotherpass123",
+            "role": "parent",
+        }
+
+        # When
+        response = client.post("/api/v1/auth/signup", json=signup_data)
+
+        # Then
+        assert response.status_code == 400
+        assert password_hasher.stats.submitted == submitted
+
+    def test_signup_new_email_skips_lookup(self, client: TestClient, assert_max_queries):
+        """
+        미등록 이메일 회원가입 시 사전 조회 생략 테스트
+        An email the filter has never seen is inserted without a SELECT first.
+        """
+        # Given
+        signup_data = {"email": "fresh@test.com", "password": "password123", "role": "parent"}
+
+        # When
+        with assert_max_queries(2) as stats:
+            response = client.post("/api/v1/auth/signup", json=signup_data)
+
+        # Then
+        assert response.status_code == 201
+        assert not any(
+            statement.lstrip().upper().startswith("SELECT") for statement in stats.statements
+        )
+
+    def test_signup_concurrent_duplicates(self, client: TestClient, db_session: Session):
+        """
+        동시 중복 회원가입 테스트
+        Concurrent signups for one email create exactly one user.
+        """
+        # Given
+        signup_data = {
+            "email": "race@test.com",
+            "password": "password123",
+            "role": "parent",
+        }
+
+        async def scenario() -> list[int]:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+                responses = await asyncio.gather(
+                    *(ac.post("/api/v1/auth/signup", json=signup_data) for _ in range(5))
+                )
+            return [response.status_code for response in responses]
+
+        # When
+        statuses = asyncio.run(scenario())
+
+        # Then
+        assert sorted(statuses) == [201, 400, 400, 400, 400]
+        assert db_session.query(User).filter_by(email="race@test.com").count() == 1
+
+    def test_signup_email_case_insensitive(self, client: TestClient):
+        """
+        이메일 대소문자 정규화 테스트
+        Emails are stored lower-cased, so a case variant is a duplicate and any casing logs in.
+        """
+        # Given
+        first = client.post(
+            "/api/v1/auth/signup",
+            json={"email": "Mixed.Case@Test.com", "password": "password123", "role": "parent"},
+        )
+
+        # When
+        second = client.post(
+            "/api/v1/auth/signup",
+            json={"email": "mixed.case@test.com", "password": "password123", "role": "parent"},
+        )
+        login = client.post(
+            "/api/v1/auth/login",
+            json={"email": "MIXED.case@test.com", "password": "password123"},
+        )
+
+        # Then
+        assert first.status_code == 201
+        assert first.json()["user"]["email"] == "mixed.case@test.com"
+        assert second.status_code == 400
+        assert login.status_code == 200
+
     def test_signup_weak_password_no_letters(self, client: TestClient):
         """
         약한 비밀번호 회원가입 실패 테스트 - 문자 없음
@@ -0,0 +1,242 @@
+"""
+Bulk signup API tests
+대량 회원가입 API 테스트
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.user import ParentChildLink, User
+from app.services.bulk_signup import BulkSignup, iter_csv_rows
+from app.utils.hashing import password_hasher
+
+from .conftest import TestAsyncSessionLocal
+
+
+class TestBulkSignupJson:
+    """JSON 대량 회원가입 테스트"""
+
+    def test_per_row_results(
+        self, client: TestClient, db_session: Session, child_user: User, auth_headers: dict
+    ):
+        """
+        행별 결과 반환 테스트
+        Valid rows are created; invalid, non-child and duplicate rows are reported per row.
+        """
+        rows = [
+            {"email": "s1@school.kr", "password": "welcome123"},
+            {"email": "s2@school.kr", "password": "short"},
+            {"email": "child@test.com", "password": "welcome123"},
+            {"email": "s1@school.kr", "password": "welcome123"},
+            {"email": "s3@school.kr", "password": "welcome123", "role": "parent"},
+        ]
+
+        response = client.post("/api/v1/auth/bulk-signup", json=rows, headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == [
+            "created",
+            "invalid",
+            "duplicate",
+            "duplicate",
+            "invalid",
+        ]
+        assert data["created"] == 1
+        assert data["failed"] == 4
+        assert "password" in data["results"][1]["error"]
+        assert data["results"][4]["error"] == "Bulk signup only creates child accounts"
+
+        created = {u.email: u for u in db_session.query(User).all()}
+        assert created["s1@school.kr"].role == "child"
+        assert "s3@school.kr" not in created
+        assert created["s1@school.kr"].id == data["results"][0]["user_id"]
+
+    def test_creation_not_limited_by_link_slots(
+        self,
+        client: TestClient,
+        db_session: Session,
+        parent_user: User,
+        auth_headers: dict,
+        monkeypatch,
+    ):
+        """
+        연동 한도와 무관한 계정 생성 테스트
+        Every row is created; only the first rows up to the free link slots are linked.
+        """
+        monkeypatch.setattr(settings, "BULK_SIGNUP_BATCH_SIZE", 2)
+        rows = [{"email": f"s{i}@school.kr", "password": "welcome123"} for i in range(5)]
+
+        response = client.post("/api/v1/auth/bulk-signup", json=rows, headers=auth_headers)
+
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == ["created"] * 5
+        assert [r["linked"] for r in data["results"]] == [True] * 3 + [False] * 2
+        assert (data["created"], data["linked"], data["failed"]) == (5, 3, 0)
+        linked = {
+            link.child_id
+            for link in db_session.query(ParentChildLink).filter_by(parent_id=parent_user.id)
+        }
+        assert linked == {r["user_id"] for r in data["results"][:3]}
+        assert db_session.query(User).filter(User.email.like("s%@school.kr")).count() == 5
+
+        children = client.get("/api/v1/auth/children", headers=auth_headers)
+        assert len(children.json()) == 3
+
+    def test_hashing_outside_transaction(self, db_session: Session, parent_user: User, monkeypatch):
+        """
+        트랜잭션 밖 해싱 테스트
+        No database transaction (and connection) is held while passwords are hashed.
+        """
+        hash_many = password_hasher.hash_many
+        in_transaction = []
+
+        async def run():
+            async with TestAsyncSessionLocal() as db:
+                async def recording_hash_many(passwords):
+                    in_transaction.append(db.in_transaction())
+                    return await hash_many(passwords)
+
+                monkeypatch.setattr(password_hasher, "hash_many", recording_hash_many)
+                bulk = BulkSignup(db, parent_user.id, batch_size=1, max_rows=10)
+                for i in range(2):
+                    await bulk.add({"email": f"s{i}@school.kr", "password": "welcome123"})
+                return await bulk.finish()
+
+        response = asyncio.run(run())
+
+        assert response.created == 2
+        assert in_transaction == [False, False]
+
+    def test_created_users_can_login(self, client: TestClient, auth_headers: dict):
+        """
+        대량 등록 계정 로그인 테스트
+        Users created in bulk should be able to log in with their password.
+        """
+        client.post(
+            "/api/v1/auth/bulk-signup",
+            json=[{"email": "s1@school.kr", "password": "welcome123"}],
+            headers=auth_headers,
+        )
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": "s1@school.kr", "password": "welcome123"},
+        )
+
+        assert response.status_code == 200
+
+    def test_row_limit(self, client: TestClient, auth_headers: dict, monkeypatch):
+        """
+        최대 행 수 초과 테스트
+        Requests above BULK_SIGNUP_MAX_ROWS should be rejected with 413.
+        """
+        monkeypatch.setattr(settings, "BULK_SIGNUP_MAX_ROWS", 1)
+        rows = [
+            {"email": "s1@school.kr", "password": "welcome123"},
+            {"email": "s2@school.kr", "password": "welcome123"},
+        ]
+
+        response = client.post("/api/v1/auth/bulk-signup", json=rows, headers=auth_headers)
+
+        assert response.status_code == 413
+
+    def test_requires_parent(self, client: TestClient, child_auth_headers: dict):
+        """
+        자녀 계정의 대량 등록 차단 테스트
+        Child accounts cannot use bulk signup.
+        """
+        response = client.post(
+            "/api/v1/auth/bulk-signup",
+            json=[{"email": "s1@school.kr", "password": "welcome123"}],
+            headers=child_auth_headers,
+        )
+
+        assert response.status_code == 403
+
+
+class TestBulkSignupCsv:
+    """CSV 대량 회원가입 테스트"""
+
+    def test_csv_upload(
+        self, client: TestClient, db_session: Session, auth_headers: dict, monkeypatch
+    ):
+        """
+        CSV 스트리밍 등록 테스트
+        CSV rows are processed across several batches in one request.
+        """
+        monkeypatch.setattr(settings, "BULK_SIGNUP_BATCH_SIZE", 2)
+        body = (
+            "email,password,role\n"
+            "c1@school.kr,welcome123,\n"
+            "c2@school.kr,welcome123,parent\n"
+            "\n"
+            "c3@school.kr,nodigits,child\n"
+            "c4@school.kr,welcome123,child\n"
+            "c5@school.kr,welcome123,child"
+        )
+
+        response = client.post(
+            "/api/v1/auth/bulk-signup/csv",
+            content=body.encode("utf-8"),
+            headers={**auth_headers, "Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        assert [r["status"] for r in data["results"]] == [
+            "created",
+            "invalid",
+            "invalid",
+            "created",
+            "created",
+        ]
+        assert db_session.query(User).filter(User.email.like("c%@school.kr")).count() == 3
+
+    def test_quoted_newlines_across_chunks(self):
+        """
+        따옴표 안 줄바꿈 CSV 파싱 테스트
+        A quoted field may contain newlines, even when split across chunks.
+        """
+        body = 'email,password,note\r\na@school.kr,"pass\nword1","say ""hi""\r\nbye"\nb@school.kr,pw2,\n'
+
+        async def rows(chunk_size):
+            async def chunks():
+                data = body.encode("utf-8")
+                for start in range(0, len(data), chunk_size):
+                    yield data[start:start + chunk_size]
+
+            return [row async for row in iter_csv_rows(chunks())]
+
+        expected = [
+            {"email": "a@school.kr", "password": "pass\nword1", "note": 'say "hi"\r\nbye'},
+            {"email": "b@school.kr", "password": "pw2"},
+        ]
+        for chunk_size in (1, 7, len(body)):
+            assert asyncio.run(rows(chunk_size)) == expected
+
+    def test_csv_row_limit_rolls_back(
+        self, client: TestClient, db_session: Session, auth_headers: dict, monkeypatch
+    ):
+        """
+        CSV 최대 행 수 초과 시 전체 롤백 테스트
+        Exceeding the row limit mid-stream must not leave partial inserts.
+        """
+        monkeypatch.setattr(settings, "BULK_SIGNUP_MAX_ROWS", 2)
+        monkeypatch.setattr(settings, "BULK_SIGNUP_BATCH_SIZE", 1)
+        body = "email,password\n" + "".join(
+            f"x{i}@school.kr,welcome123\n" for i in range(3)
+        )
+
+        response = client.post(
+            "/api/v1/auth/bulk-signup/csv",
+            content=body.encode("utf-8"),
+            headers={**auth_headers, "Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == 413
+        assert db_session.query(User).filter(User.email.like("x%@school.kr")).count() == 0
@@ -0,0 +1,242 @@
+"""
+Chat streaming API tests
+채팅 스트리밍 API 테스트 (로컬 모의 모델 서버 사용)
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import chat as chat_api
+from app.core.config import settings
+from app.main import app
+from app.mock_llm import MockLLM, serve_in_thread
+from app.services.llm_client import ChatStream, LLMClient, LLMError, parse_sse_events
+
+QUESTION = [{"role": "user", "content": "what is photosynthesis"}]
+
+
+def parse_events(body: str) -> list:
+    """(event name, payload) pairs of an SSE response body"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((fields.get("event", "message"), json.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+def llm(monkeypatch) -> LLMClient:
+    """Fresh stream counters for the chat endpoint"""
+    client = LLMClient(max_streams=4)
+    monkeypatch.setattr(chat_api, "llm_client", client)
+    return client
+
+
+@pytest.fixture
+def mock_llm(monkeypatch, llm):
+    """
+    Mock model server in a background thread, configured as LLM_BASE_URL.
+    로컬 모의 모델 서버를 LLM_BASE_URL로 설정합니다.
+    """
+    mock = MockLLM(first_token_ms=5, token_ms=1)
+    with serve_in_thread(mock) as url:
+        monkeypatch.setattr(settings, "LLM_BASE_URL", f"{url}/v1")
+        yield mock
+
+
+class TestChatStream:
+    """SSE 스트리밍 테스트"""
+
+    def test_streams_tokens_as_events(
+        self, client: TestClient, auth_headers: dict, mock_llm: MockLLM, llm: LLMClient
+    ):
+        """
+        답변이 텍스트 조각 이벤트로 전송되고 done 이벤트로 끝나는지 테스트
+        """
+        response = client.post("/api/v1/chat", json={"messages": QUESTION}, headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-cache"
+        events = parse_events(response.text)
+        assert events[-1] == ("done", {"finish_reason": "stop"})
+        text = "".join(payload["content"] for name, payload in events[:-1])
+        assert text == "Echo: what is photosynthesis "
+        assert llm.stats()["completed"] == 1
+        assert llm.stats()["active"] == 0
+
+    def test_max_tokens_finish_reason(
+        self, client: TestClient, auth_headers: dict, mock_llm: MockLLM, monkeypatch
+    ):
+        """
+        CHAT_MAX_TOKENS에 도달하면 finish_reason이 length
+        """
+        monkeypatch.setattr(settings, "CHAT_MAX_TOKENS", 2)
+
+        response = client.post("/api/v1/chat", json={"messages": QUESTION}, headers=auth_headers)
+
+        events = parse_events(response.text)
+        assert events[-1] == ("done", {"finish_reason": "length"})
+        assert "".join(payload["content"] for _, payload in events[:-1]) == "Echo: what "
+
+    def test_slow_reader_gets_coalesced_chunks(self, mock_llm: MockLLM, llm: LLMClient):
+        """
+        읽기가 느리면 도착한 토큰을 한 조각으로 묶어 전달 (업스트림은 대기)
+        """
+        mock_llm.tokens = 50
+
+        async def read_slowly() -> list:
+            stream = await llm.open_stream(QUESTION)
+            chunks = []
+            try:
+                async for text in stream:
+                    chunks.append(text)
+                    await asyncio.sleep(0.1)
+            finally:
+                await stream.aclose()
+            await llm.aclose()
+            return chunks
+
+        chunks = asyncio.run(read_slowly())
+
+        assert "".join(chunks).split() == ["Echo:", "what", "is", "photosynthesis"] * 12 + [
+            "Echo:",
+            "what",
+        ]
+        assert len(chunks) < 50
+        assert llm.stats()["completed"] == 1
+
+
+class TestChatErrors:
+    """스트림 시작 전 오류 응답 테스트"""
+
+    def test_requires_valid_token(self, client: TestClient):
+        """
+        유효하지 않은 토큰은 401
+        """
+        response = client.post(
+            "/api/v1/chat",
+            json={"messages": QUESTION},
+            headers={"Authorization": "Bearer invalid"},
+        )
+        assert response.status_code == 401
+
+    def test_last_message_must_be_user(self, client: TestClient, auth_headers: dict):
+        """
+        마지막 메시지가 assistant이면 422
+        """
+        messages = QUESTION + [{"role": "assistant", "content": "Plants make food."}]
+        response = client.post("/api/v1/chat", json={"messages": messages}, headers=auth_headers)
+        assert response.status_code == 422
+
+    def test_not_configured(self, client: TestClient, auth_headers: dict, llm, monkeypatch):
+        """
+        모델 설정이 없으면 503
+        """
+        monkeypatch.setattr(settings, "LLM_BASE_URL", None)
+        monkeypatch.setattr(settings, "AZURE_OPENAI_ENDPOINT", None)
+
+        response = client.post("/api/v1/chat", json={"messages": QUESTION}, headers=auth_headers)
+
+        assert response.status_code == 503
+        assert response.json()["detail"] == "Chat is not available"
+
+    def test_upstream_error_status(
+        self, client: TestClient, auth_headers: dict, mock_llm: MockLLM, llm, monkeypatch
+    ):
+        """
+        모델 서버 오류 응답은 502
+        """
+        monkeypatch.setattr(settings, "LLM_BASE_URL", settings.LLM_BASE_URL + "/missing/x")
+
+        response = client.post("/api/v1/chat", json={"messages": QUESTION}, headers=auth_headers)
+
+        assert response.status_code == 502
+        assert llm.stats()["errors"] == 1
+        assert llm.stats()["active"] == 0
+
+    def test_stream_limit(self, client: TestClient, auth_headers: dict, mock_llm, llm):
+        """
+        워커의 동시 스트림 한도를 넘으면 503과 Retry-After
+        """
+        llm.active = llm.max_streams
+
+        response = client.post("/api/v1/chat", json={"messages": QUESTION}, headers=auth_headers)
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert llm.stats()["rejected"] == 1
+        assert mock_llm.stats["requests"] == 0
+
+
+class TestDisconnect:
+    """클라이언트 연결 종료 시 업스트림 취소 테스트"""
+
+    def test_client_disconnect_cancels_upstream(
+        self, auth_headers: dict, mock_llm: MockLLM, llm: LLMClient
+    ):
+        """
+        첫 토큰 수신 후 연결을 끊으면 모델 서버 요청도 중단
+        """
+        mock_llm.tokens, mock_llm.token_ms = 500, 20
+
+        with serve_in_thread(app) as url:
+            with httpx.Client(base_url=url, headers=auth_headers) as http:
+                with http.stream("POST", "/api/v1/chat", json={"messages": QUESTION}) as response:
+                    assert response.status_code == 200
+                    first = next(line for line in response.iter_lines() if line)
+                    assert first.startswith("data: ")
+
+            deadline = time.monotonic() + 5
+            while (mock_llm.stats["cancelled"] == 0 or llm.active) and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+        assert mock_llm.stats["cancelled"] == 1
+        assert mock_llm.stats["tokens_sent"] < 100
+        assert llm.stats()["cancelled"] == 1
+        assert llm.stats()["active"] == 0
+
+
+class TestSseParsing:
+    """업스트림 SSE 파싱 테스트"""
+
+    def test_partial_and_crlf_events(self):
+        """
+        이벤트 경계가 잘린 조각과 CRLF 구분자 처리
+        """
+        payloads, rest = parse_sse_events(b'data: {"a": 1}\r\n\r\n: comment\n\ndata: {"b"')
+        assert payloads == [b'{"a": 1}']
+        assert rest == b'data: {"b"'
+
+        payloads, rest = parse_sse_events(rest + b": 2}\n\ndata: [DONE]\n\n")
+        assert payloads == [b'{"b": 2}', b"[DONE]"]
+        assert rest == b""
+
+    def test_unexpected_event_shape_ends_stream(self):
+        """
+        객체가 아닌 이벤트나 형식이 다른 이벤트는 오류로 스트림을 끝냄 (멈추지 않음)
+        """
+        async def consume(body: bytes) -> list:
+            llm = LLMClient(max_streams=1)
+            llm.active = 1
+            stream = ChatStream(llm, httpx.Response(200, content=body), time.perf_counter(), 4)
+            chunks = []
+            try:
+                with pytest.raises(LLMError, match="invalid stream event"):
+                    async for text in stream:
+                        chunks.append(text)
+            finally:
+                await stream.aclose()
+            assert llm.stats()["errors"] == 1
+            assert llm.stats()["active"] == 0
+            return chunks
+
+        first = b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\n'
+        for event in (b'data: "x"\n\n', b'data: {"choices": ["x"]}\n\n', b"data: [1]\n\n"):
+            chunks = asyncio.run(asyncio.wait_for(consume(first + event), timeout=5))
+            assert chunks == ["Hi"]
@@ -0,0 +1,237 @@
+"""
+Bulk parent-child linking tests
+부모-자녀 일괄 연동 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.models.user import User, ParentChildLink
+
+
+class TestLinkChildren:
+    """자녀 일괄 연동 테스트"""
+
+    def test_mixed_outcomes(
+        self,
+        client: TestClient,
+        db_session: Session,
+        parent_user: User,
+        multiple_children: list[User],
+        auth_headers: dict,
+    ):
+        """
+        항목별 결과 테스트
+        Each requested child gets its own outcome, in request order.
+        """
+        db_session.add(ParentChildLink(parent_id=parent_user.id, child_id=multiple_children[0].id))
+        db_session.commit()
+        other_parent = User(email="other@test.com", password_hash="x", role="parent")
+        db_session.add(other_parent)
+        db_session.commit()
+
+        child_ids = [
+            multiple_children[1].id,
+            multiple_children[0].id,  # already linked
+            99999,  # missing
+            parent_user.id,  # self
+            other_parent.id,  # wrong role
+            multiple_children[1].id,  # repeated in request
+        ]
+        response = client.post(
+            "/api/v1/auth/link-children", json={"child_ids": child_ids}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == [
+            "linked",
+            "duplicate",
+            "not_found",
+            "invalid",
+            "invalid",
+            "duplicate",
+        ]
+        assert data["linked"] == 1
+        assert data["failed"] == 5
+        assert data["results"][0]["link_id"] is not None
+        assert db_session.query(ParentChildLink).filter_by(parent_id=parent_user.id).count() == 2
+
+    def test_limit_applied_in_order(
+        self,
+        client: TestClient,
+        db_session: Session,
+        parent_user: User,
+        multiple_children: list[User],
+        auth_headers: dict,
+    ):
+        """
+        최대 연동 수 적용 테스트
+        Only the first children up to the 3-child limit are linked.
+        """
+        db_session.add(ParentChildLink(parent_id=parent_user.id, child_id=multiple_children[0].id))
+        db_session.commit()
+
+        response = client.post(
+            "/api/v1/auth/link-children",
+            json={"child_ids": [c.id for c in multiple_children[1:]]},
+            headers=auth_headers,
+        )
+
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == ["linked", "linked", "limit_exceeded"]
+        children = client.get("/api/v1/auth/children", headers=auth_headers).json()
+        assert children["total"] == 3
+
+    def test_requires_parent(self, client: TestClient, child_user: User, child_auth_headers: dict):
+        """
+        자녀 계정의 일괄 연동 차단 테스트
+        Child accounts cannot link children.
+        """
+        response = client.post(
+            "/api/v1/auth/link-children",
+            json={"child_ids": [child_user.id]},
+            headers=child_auth_headers,
+        )
+
+        assert response.status_code == 403
+
+    def test_empty_request_rejected(self, client: TestClient, auth_headers: dict):
+        """
+        빈 요청 거절 테스트
+        At least one child ID is required.
+        """
+        response = client.post(
+            "/api/v1/auth/link-children", json={"child_ids": []}, headers=auth_headers
+        )
+
+        assert response.status_code == 422
+
+
+class TestConcurrentLinking:
+    """동시 연동 요청 테스트"""
+
+    def test_parallel_requests_respect_limit(
+        self,
+        client: TestClient,
+        db_session: Session,
+        parent_user: User,
+        multiple_children: list[User],
+        auth_headers: dict,
+    ):
+        """
+        동시 요청 시 최대 연동 수 보장 테스트
+        Parallel link requests for one parent never create more than 3 links
+        or duplicate links.
+        """
+        child_ids = [child.id for child in multiple_children] * 3
+
+        async def scenario() -> list[int]:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+                responses = await asyncio.gather(
+                    *(
+                        ac.post(
+                            "/api/v1/auth/link-child",
+                            json={"child_id": child_id},
+                            headers=auth_headers,
+                        )
+                        for child_id in child_ids
+                    )
+                )
+            return [response.status_code for response in responses]
+
+        statuses = asyncio.run(scenario())
+
+        assert statuses.count(201) == 3
+        assert statuses.count(400) == len(child_ids) - 3
+        links = db_session.query(ParentChildLink).filter_by(parent_id=parent_user.id).all()
+        assert len(links) == 3
+        assert len({link.child_id for link in links}) == 3
+
+
+class TestChildListEtag:
+    """자녀 목록 조건부 GET 테스트"""
+
+    def test_not_modified_until_links_change(
+        self,
+        client: TestClient,
+        db_session: Session,
+        parent_user: User,
+        multiple_children: list[User],
+        auth_headers: dict,
+    ):
+        """
+        ETag 기반 304 응답 테스트
+        A matching If-None-Match returns 304 until a link is added or removed.
+        """
+        client.post(
+            "/api/v1/auth/link-child",
+            json={"child_id": multiple_children[0].id},
+            headers=auth_headers,
+        )
+        first = client.get("/api/v1/auth/children", headers=auth_headers)
+        etag = first.headers["etag"]
+
+        cached = client.get(
+            "/api/v1/auth/children", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        client.post(
+            "/api/v1/auth/link-child",
+            json={"child_id": multiple_children[1].id},
+            headers=auth_headers,
+        )
+        changed = client.get(
+            "/api/v1/auth/children", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert [c["id"] for c in changed.json()["children"]] == [
+            multiple_children[0].id,
+            multiple_children[1].id,
+        ]
+
+        client.delete(
+            f"/api/v1/auth/link-child/{multiple_children[1].id}", headers=auth_headers
+        )
+        after_unlink = client.get(
+            "/api/v1/auth/children",
+            headers={**auth_headers, "If-None-Match": changed.headers["etag"]},
+        )
+        assert after_unlink.status_code == 200
+        assert after_unlink.json()["total"] == 1
+
+    def test_etag_changes_when_child_updated(
+        self,
+        client: TestClient,
+        db_session: Session,
+        parent_user: User,
+        child_user: User,
+        auth_headers: dict,
+    ):
+        """
+        자녀 정보 변경 시 ETag 갱신 테스트
+        Updating a linked child's row invalidates the ETag.
+        """
+        db_session.add(ParentChildLink(parent_id=parent_user.id, child_id=child_user.id))
+        db_session.commit()
+        etag = client.get("/api/v1/auth/children", headers=auth_headers).headers["etag"]
+
+        child_user.email = "renamed@test.com"
+        child_user.updated_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+        db_session.commit()
+
+        response = client.get(
+            "/api/v1/auth/children", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["children"][0]["email"] == "renamed@test.com"
@@ -0,0 +1,167 @@
+"""
+Email availability filter tests
+이메일 사용 가능 여부 필터 테스트
+"""
+
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.models.user import User
+from app.services.email_filter import email_filter, refresh_email_filter_periodically
+from app.utils.security import hash_password
+
+from .conftest import TestAsyncSessionLocal
+from app.utils.bloom import BloomFilter, ScalableBloomFilter
+
+
+class TestBloomFilter:
+    """Bloom 필터 테스트"""
+
+    def test_no_false_negatives(self):
+        """
+        거짓 음성 없음 테스트
+        Every added item is reported as present.
+        """
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        items = [f"user{i}@example.com" for i in range(2000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert len(bloom) == 2000
+
+    def test_false_positive_rate_near_target(self):
+        """
+        거짓 양성 비율 테스트
+        At capacity the false-positive rate stays close to the target.
+        """
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f"user{i}@example.com")
+
+        false_positives = sum(f"other{i}@example.com" in bloom for i in range(20000))
+
+        assert false_positives / 20000 < 0.02
+
+    def test_scalable_filter_grows(self):
+        """
+        용량 초과 시 확장 테스트
+        The scalable filter chains a larger filter instead of saturating.
+        """
+        bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"user{i}@example.com")
+
+        assert len(bloom.filters) > 1
+        assert all(f"user{i}@example.com" in bloom for i in range(1000))
+
+
+class TestEmailAvailable:
+    """이메일 사용 가능 여부 API 테스트"""
+
+    def test_unregistered_email_skips_database(self, client: TestClient):
+        """
+        미등록 이메일의 DB 미조회 테스트
+        A definite negative is answered from the filter alone.
+        """
+        db_checks = email_filter.db_checks
+
+        response = client.get("/api/v1/auth/email-available", params={"email": "free@test.com"})
+
+        assert response.status_code == 200
+        assert response.json() == {"email": "free@test.com", "available": True}
+        assert email_filter.db_checks == db_checks
+
+    def test_existing_user_loaded_at_startup(self, parent_user: User, client: TestClient):
+        """
+        시작 시 필터 재구성 테스트
+        Users present at startup are reported as taken.
+        """
+        response = client.get(
+            "/api/v1/auth/email-available", params={"email": "parent@test.com"}
+        )
+
+        assert response.json()["available"] is False
+
+    def test_other_worker_signup_seen_after_refresh(self, client: TestClient, db_session: Session):
+        """
+        다른 워커의 가입 반영 테스트
+        Users inserted outside this process are picked up by the periodic refresh.
+        """
+        db_session.add(
+            User(email="elsewhere@test.com", password_hash=hash_password("password123"), role="parent")
+        )
+        db_session.commit()
+
+        async def refresh_once():
+            task = asyncio.create_task(
+                refresh_email_filter_periodically(TestAsyncSessionLocal, 0.01, 0)
+            )
+            while "elsewhere@test.com" not in email_filter.bloom:
+                await asyncio.sleep(0.01)
+            task.cancel()
+
+        asyncio.run(asyncio.wait_for(refresh_once(), timeout=5))
+        response = client.get(
+            "/api/v1/auth/email-available", params={"email": "elsewhere@test.com"}
+        )
+
+        assert response.json()["available"] is False
+        assert email_filter.last_user_id >= 1
+
+    def test_startup_does_not_wait_for_rebuild(
+        self, db_session: Session, parent_user: User, monkeypatch
+    ):
+        """
+        필터 로딩을 기다리지 않고 시작하는지 테스트
+        The app serves while the filter loads; checks use the database until then.
+        """
+        loaded = threading.Event()
+        release = threading.Event()
+        rebuild = email_filter.rebuild
+
+        async def slow_rebuild(db):
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+            count = await rebuild(db)
+            loaded.set()
+            return count
+
+        monkeypatch.setattr(email_filter, "rebuild", slow_rebuild)
+        with TestClient(app) as client:
+            assert not email_filter.ready
+            response = client.get(
+                "/api/v1/auth/email-available", params={"email": "Parent@Test.com"}
+            )
+            assert response.json() == {"email": "parent@test.com", "available": False}
+
+            release.set()
+            assert loaded.wait(5)
+            assert email_filter.ready
+
+    def test_signup_updates_filter(self, client: TestClient):
+        """
+        회원가입 시 필터 갱신 테스트
+        An email registered through /signup becomes unavailable immediately.
+        """
+        client.post(
+            "/api/v1/auth/signup",
+            json={"email": "new@test.com", "password": "password123", "role": "parent"},
+        )
+
+        response = client.get("/api/v1/auth/email-available", params={"email": "new@test.com"})
+
+        assert response.json()["available"] is False
+
+    def test_invalid_email(self, client: TestClient):
+        """
+        잘못된 이메일 형식 테스트
+        Malformed addresses are rejected with 422.
+        """
+        response = client.get("/api/v1/auth/email-available", params={"email": "not-an-email"})
+
+        assert response.status_code == 422
@@ -0,0 +1,128 @@
+"""
+Password hashing pool tests
+bcrypt 워커 풀 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.utils.hashing import PasswordHasher
+from app.utils.security import (
+    calibrate_bcrypt_rounds,
+    get_bcrypt_rounds,
+    get_hash_rounds,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+
+
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+def test_hash_and_verify_in_pool(executor_type: str):
+    """
+    워커 풀에서 해싱/검증 테스트
+    Hashing and verification should work in both executor types.
+    """
+    hasher = PasswordHasher(max_workers=2, executor_type=executor_type)
+
+    async def scenario():
+        hashed = await hasher.hash("password123")
+        return (
+            hashed,
+            await hasher.verify("password123", hashed),
+            await hasher.verify("wrongpass1", hashed),
+        )
+
+    try:
+        hashed, ok, wrong = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    assert hashed.startswith("$2b$")
+    assert ok is True
+    assert wrong is False
+
+
+def test_stats_track_queue_depth():
+    """
+    큐 깊이 및 지연 지표 테스트
+    Concurrent jobs beyond the pool size should show up as queue depth.
+    """
+    hasher = PasswordHasher(max_workers=1, executor_type="thread")
+
+    async def scenario():
+        await asyncio.gather(*(hasher.hash("password123") for _ in range(3)))
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    stats = hasher.stats.snapshot()
+    assert stats["submitted"] == 3
+    assert stats["completed"] == 3
+    assert stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] == 3
+    assert stats["max_wait_ms"] > 0
+
+
+def test_invalid_executor_type():
+    """
+    잘못된 실행기 타입 테스트
+    Unknown executor types should be rejected.
+    """
+    with pytest.raises(ValueError):
+        PasswordHasher(executor_type="fiber")
+
+
+def test_hash_rounds_and_rehash_detection():
+    """
+    작업 계수 추출 및 재해싱 필요 여부 테스트
+    Hashes below the current work factor should be flagged for rehash.
+    """
+    current = get_bcrypt_rounds()
+    old_hash = hash_password("password123", rounds=4)
+
+    assert get_hash_rounds(old_hash) == 4
+    assert password_needs_rehash(old_hash) is True
+    assert password_needs_rehash(hash_password("password123")) is False
+    assert get_hash_rounds(hash_password("password123")) == current
+    assert get_hash_rounds("not-a-bcrypt-hash") is None
+
+
+def test_calibrate_respects_bounds():
+    """
+    작업 계수 자동 보정 범위 테스트
+    Calibration never goes below min_rounds, even with an impossible budget.
+    """
+    assert calibrate_bcrypt_rounds(target_ms=0, min_rounds=4, max_rounds=6) == 4
+    assert 4 <= calibrate_bcrypt_rounds(target_ms=10_000, min_rounds=4, max_rounds=6) <= 6
+
+
+def test_login_upgrades_outdated_hash(client: TestClient, db_session: Session):
+    """
+    로그인 시 오래된 해시 자동 업그레이드 테스트
+    A successful login with a low-cost hash should rewrite it at the current cost.
+    """
+    user = User(
+        email="legacy@test.com",
+        password_hash=hash_password("password123", rounds=4),
+        role="parent",
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": "legacy@test.com", "password": "password123"},
+    )
+
+    assert response.status_code == 200
+    db_session.expire_all()
+    upgraded = db_session.get(User, user.id)
+    assert get_hash_rounds(upgraded.password_hash) == get_bcrypt_rounds()
+    assert verify_password("password123", upgraded.password_hash)
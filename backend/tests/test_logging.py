@@ -0,0 +1,231 @@
+"""
+Structured logging pipeline tests
+비동기 JSON 로깅 파이프라인 및 요청 ID 연동 테스트
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import logs
+from app.core.config import settings
+from app.core.database import build_engine_kwargs
+from app.core.logs import (
+    ContextFilter,
+    JsonFormatter,
+    LoggingPipeline,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    build_file_handler,
+    parse_sample_rates,
+    request_id_var,
+)
+
+
+class _Collect(logging.Handler):
+    """Keeps records after the context filter ran (on the calling thread)"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.addFilter(ContextFilter())
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def collected():
+    handler = _Collect()
+    root = logging.getLogger()
+    previous_level = root.level
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    yield handler.records
+    root.removeHandler(handler)
+    root.setLevel(previous_level)
+
+
+def _record(level=logging.INFO, route=None, request_id="-", **extra):
+    record = logging.LogRecord("app.test", level, __file__, 1, "hello %s", ("world",), None)
+    record.route = route
+    record.request_id = request_id
+    record.__dict__.update(extra)
+    return record
+
+
+class TestFormatting:
+    """JSON 라인 포맷 테스트"""
+
+    def test_json_line(self):
+        """
+        메시지, 요청 ID, extra 필드 출력 테스트
+        """
+        line = JsonFormatter().format(_record(request_id="abc", user_id=7))
+        entry = json.loads(line)
+
+        assert entry["message"] == "hello world"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "app.test"
+        assert entry["request_id"] == "abc"
+        assert entry["user_id"] == 7
+        assert "args" not in entry and "route" not in entry
+
+    def test_exception_rendered(self):
+        """
+        예외 traceback 포함 테스트
+        """
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "app.test", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+            )
+        entry = json.loads(JsonFormatter().format(record))
+        assert "ValueError: boom" in entry["exception"]
+
+
+class TestSampling:
+    """레벨별 샘플링 테스트"""
+
+    def test_parse_rates(self):
+        """
+        LOG_SAMPLE_RATES 파싱 테스트
+        """
+        assert parse_sample_rates("INFO=0.1, debug=0") == {logging.INFO: 0.1, logging.DEBUG: 0.0}
+        assert parse_sample_rates("") == {}
+        with pytest.raises(ValueError):
+            parse_sample_rates("LOUD=0.5")
+
+    def test_only_listed_routes_and_levels(self):
+        """
+        지정한 경로와 레벨만 샘플링되는지 테스트
+        """
+        sampler = SamplingFilter({logging.INFO: 0.0}, ["/health"])
+
+        assert not sampler.filter(_record(route="/health"))
+        assert sampler.filter(_record(route="/api/v1/auth/login"))
+        assert sampler.filter(_record(level=logging.WARNING, route="/health"))
+
+    def test_decision_is_per_request(self):
+        """
+        같은 요청 ID는 항상 같은 결정, 전체 비율은 설정값에 근접
+        """
+        sampler = SamplingFilter({logging.INFO: 0.25}, ["/health"])
+        ids = [f"request-{i}" for i in range(4000)]
+        kept = [sampler.filter(_record(route="/health", request_id=i)) for i in ids]
+
+        assert kept == [sampler.filter(_record(route="/health", request_id=i)) for i in ids]
+        assert 0.2 < sum(kept) / len(ids) < 0.3
+
+
+class TestQueue:
+    """논블로킹 큐 테스트"""
+
+    def test_full_queue_drops(self):
+        """
+        큐가 가득 차면 블로킹 대신 버리고 개수를 센다
+        """
+        handler = NonBlockingQueueHandler(queue.Queue(2))
+        for _ in range(5):
+            handler.handle(_record())
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+        # Arguments are merged before the record crosses threads
+        assert handler.queue.get_nowait().msg == "hello world"
+
+    def test_pipeline_writes_json_lines(self, tmp_path, monkeypatch):
+        """
+        리스너 스레드가 LOG_FILE_PATH에 JSON 라인을 기록하는지 테스트
+        """
+        path = tmp_path / "app-{pid}.log"
+        monkeypatch.setattr(settings, "LOG_FILE_PATH", str(path))
+        monkeypatch.setattr(settings, "LOG_LEVEL", "INFO")
+        pipeline = LoggingPipeline()
+        pipeline.start()
+        token = request_id_var.set("req-1")
+        try:
+            logging.getLogger("app.test").info("signed up", extra={"user_id": 3})
+        finally:
+            request_id_var.reset(token)
+            pipeline.stop()
+
+        [written] = list(tmp_path.glob("app-*.log"))
+        entries = [json.loads(line) for line in written.read_text().splitlines()]
+        assert {"message": "signed up", "request_id": "req-1", "user_id": 3}.items() <= entries[
+            -1
+        ].items()
+        assert pipeline.queue_handler not in logging.getLogger().handlers
+
+    def test_file_handler_per_rotation_mode(self, tmp_path, monkeypatch):
+        """
+        LOG_ROTATION별 파일 핸들러 테스트
+        Workers rotate their own files by default; "external" leaves it to logrotate.
+        """
+        assert "{pid}" in type(settings).model_fields["LOG_FILE_PATH"].default
+        path = str(tmp_path / "app.log")
+        expected = {
+            "size": logging.handlers.RotatingFileHandler,
+            "time": logging.handlers.TimedRotatingFileHandler,
+            "external": logging.handlers.WatchedFileHandler,
+        }
+        for rotation, handler_class in expected.items():
+            monkeypatch.setattr(settings, "LOG_ROTATION", rotation)
+            handler = build_file_handler(path)
+            handler.close()
+            assert type(handler) is handler_class
+
+    def test_engine_does_not_echo(self, monkeypatch):
+        """
+        DEBUG여도 엔진 echo(동기 stdout 출력)를 사용하지 않음
+        """
+        monkeypatch.setattr(settings, "DEBUG", True)
+        assert not build_engine_kwargs("sqlite:///./x.db").get("echo")
+        assert not build_engine_kwargs("postgresql+asyncpg://u@h/db", is_async=True).get("echo")
+
+
+class TestRequestId:
+    """요청 ID 연동 테스트"""
+
+    def test_generated_and_echoed(self, client: TestClient, collected):
+        """
+        요청 ID 생성, 응답 헤더, 액세스 로그 연동 테스트
+        """
+        response = client.get("/health")
+        request_id = response.headers["x-request-id"]
+
+        assert len(request_id) == 32
+        [access] = [r for r in collected if r.name == logs.access_logger.name]
+        assert access.request_id == request_id
+        assert access.route == "/health"
+        assert access.status == 200
+
+    def test_client_id_propagates(self, client: TestClient, auth_headers: dict, collected):
+        """
+        클라이언트가 보낸 X-Request-ID가 요청 중 모든 로그에 전파
+        """
+        response = client.get(
+            "/api/v1/auth/me", headers={**auth_headers, "X-Request-ID": "trace-42"}
+        )
+
+        assert response.headers["x-request-id"] == "trace-42"
+        access = [r for r in collected if r.name == logs.access_logger.name][-1]
+        assert access.request_id == "trace-42"
+        assert access.route == "/api/v1/auth/me"
+        assert request_id_var.get() == "-"
+
+    def test_access_log_disabled(self, client: TestClient, collected, monkeypatch):
+        """
+        LOG_ACCESS=False면 액세스 로그 미기록
+        """
+        monkeypatch.setattr(settings, "LOG_ACCESS", False)
+        response = client.get("/health")
+
+        assert "x-request-id" in response.headers
+        assert not [r for r in collected if r.name == logs.access_logger.name]
@@ -0,0 +1,253 @@
+"""
+Metrics subsystem tests
+메트릭 수집 및 /metrics 엔드포인트 테스트
+"""
+
+import json
+import os
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.core.instrumentation import http_request_duration, http_requests, instrument_query_timing
+from app.core.metrics import Histogram, MetricsRegistry, operation_duration, timed
+from app.core.prometheus import (
+    EXITED_WORKERS_FILE,
+    MultiprocessCollector,
+    merge_snapshots,
+    render,
+    snapshot_families,
+)
+from app.models.user import User
+
+
+class TestPrimitives:
+    """메트릭 기본 타입 테스트"""
+
+    def test_histogram_buckets_and_quantiles(self):
+        """
+        히스토그램 버킷/분위수 테스트
+        Bucket bounds are inclusive and quantiles resolve to a bucket bound.
+        """
+        histogram = Histogram("latency", buckets=(1, 5, 10))
+        for value in (0.5, 1, 3, 7, 20):
+            histogram.observe(value)
+
+        assert histogram.cumulative_counts() == {"1": 2, "5": 3, "10": 4, "+Inf": 5}
+        assert histogram.quantile(0.5) == 5
+        assert histogram.quantile(0.99) == 20
+        assert histogram.count == 5
+
+    def test_family_reuses_children(self):
+        """
+        라벨별 자식 메트릭 재사용 테스트
+        """
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("route",))
+
+        requests.labels("/a").inc()
+        requests.labels("/a").inc()
+        requests.labels("/b").inc()
+
+        assert registry.counter("requests_total") is requests
+        assert requests.labels("/a").value == 2
+        assert len(requests.children()) == 2
+
+    def test_timed_decorator_records_operation(self):
+        """
+        이름 있는 타이머 테스트
+        """
+        @timed("unit_test_operation")
+        def work():
+            return 42
+
+        before = operation_duration.labels("unit_test_operation").count
+        assert work() == 42
+        with timed("unit_test_operation"):
+            pass
+
+        assert operation_duration.labels("unit_test_operation").count == before + 2
+
+
+class TestExposition:
+    """Prometheus 텍스트 포맷 테스트"""
+
+    def test_render_counter_and_histogram(self):
+        """
+        텍스트 포맷 출력 테스트
+        """
+        registry = MetricsRegistry()
+        registry.counter("hits_total", "Hits", ("route",)).labels('/a"b').inc(3)
+        registry.histogram("wait_ms", "Wait", buckets=(1, 10)).labels().observe(4)
+
+        output = render(snapshot_families(registry.collect()))
+
+        assert "# TYPE hits_total counter" in output
+        assert 'hits_total{route="/a\\"b"} 3' in output
+        assert 'wait_ms_bucket{le="1"} 0' in output
+        assert 'wait_ms_bucket{le="10"} 1' in output
+        assert 'wait_ms_bucket{le="+Inf"} 1' in output
+        assert "wait_ms_sum 4" in output
+        assert "wait_ms_count 1" in output
+
+    def test_merge_sums_workers(self):
+        """
+        워커별 스냅샷 합산 테스트
+        """
+        def worker(hits, observed):
+            registry = MetricsRegistry()
+            registry.counter("hits_total", "Hits").labels().inc(hits)
+            histogram = registry.histogram("wait_ms", "Wait", buckets=(1, 10)).labels()
+            for value in observed:
+                histogram.observe(value)
+            return snapshot_families(registry.collect())
+
+        snapshots = [worker(2, [0.5]), worker(3, [5, 50])]
+        merged = {family["name"]: family for family in merge_snapshots(snapshots)}
+
+        assert merged["hits_total"]["samples"][0]["value"] == 5
+        histogram = merged["wait_ms"]["samples"][0]
+        assert histogram["buckets"] == {"1": 1, "10": 2, "+Inf": 3}
+        assert histogram["count"] == 3
+
+    def test_multiprocess_drops_dead_worker_gauges(self, tmp_path):
+        """
+        종료된 워커의 게이지 제외 테스트
+        Counters of exited workers are kept; their gauges are not.
+        """
+        dead_worker = [
+            {"name": "eduguard_http_requests_in_progress", "kind": "gauge", "help": "",
+             "labelnames": [], "samples": [{"labels": [], "value": 7}]},
+            {"name": "eduguard_http_requests_total", "kind": "counter", "help": "",
+             "labelnames": ["method", "route", "status"],
+             "samples": [{"labels": ["GET", "/gone", "200"], "value": 11}]},
+        ]
+        # PIDs are far below this on Linux, so the process cannot exist
+        (tmp_path / "metrics-999999999.json").write_text(json.dumps(dead_worker))
+
+        collector = MultiprocessCollector(str(tmp_path))
+        merged = {family["name"]: family for family in collector.collect()}
+
+        assert os.path.exists(collector.path)
+        samples = merged["eduguard_http_requests_total"]["samples"]
+        assert {"labels": ["GET", "/gone", "200"], "value": 11} in samples
+        in_progress = merged["eduguard_http_requests_in_progress"]["samples"][0]["value"]
+        assert in_progress < 7
+
+    def test_exited_worker_folded_into_one_file(self, tmp_path):
+        """
+        종료된 워커 스냅샷을 합친 뒤 삭제하는지 테스트
+        Totals are unchanged, and recycled workers leave no files behind.
+        """
+        collector = MultiprocessCollector(str(tmp_path))
+        for pid, hits in ((999999998, 4), (999999999, 11)):
+            worker = [
+                {"name": "eduguard_http_requests_in_progress", "kind": "gauge", "help": "",
+                 "labelnames": [], "samples": [{"labels": [], "value": 7}]},
+                {"name": "eduguard_http_requests_total", "kind": "counter", "help": "",
+                 "labelnames": ["method", "route", "status"],
+                 "samples": [{"labels": ["GET", "/gone", "200"], "value": hits}]},
+            ]
+            (tmp_path / f"metrics-{pid}.json").write_text(json.dumps(worker))
+        before = {family["name"]: family for family in collector.collect()}
+
+        collector.mark_process_dead(999999998)
+        collector.mark_process_dead(999999999)
+        collector.mark_process_dead(999999999)  # Already gone: no-op
+        after = {family["name"]: family for family in collector.collect()}
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            EXITED_WORKERS_FILE,
+            os.path.basename(collector.path),
+        ]
+        for merged in (before, after):
+            samples = merged["eduguard_http_requests_total"]["samples"]
+            assert {"labels": ["GET", "/gone", "200"], "value": 15} in samples
+
+
+class TestInstrumentation:
+    """요청/쿼리 계측 테스트"""
+
+    def test_requests_labelled_by_route_template(
+        self, client: TestClient, parent_token: str, child_user: User, monkeypatch
+    ):
+        """
+        라우트 템플릿 라벨 테스트
+        Path parameters are not part of the route label.
+        """
+        monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+        series = http_requests.labels("DELETE", "/api/v1/auth/link-child/{child_id}", "404")
+        before = series.value
+
+        response = client.delete(
+            f"/api/v1/auth/link-child/{child_user.id}",
+            headers={"Authorization": f"Bearer {parent_token}"},
+        )
+
+        assert response.status_code == 404
+        assert series.value == before + 1
+        assert http_request_duration.labels(
+            "DELETE", "/api/v1/auth/link-child/{child_id}"
+        ).count >= 1
+
+    def test_login_records_bcrypt_and_token_timings(self, client: TestClient, parent_token: str):
+        """
+        bcrypt/토큰 디코딩 타이머 테스트
+        """
+        verify = operation_duration.labels("verify_password")
+        decode = operation_duration.labels("decode_access_token")
+        verify_before, decode_before = verify.count, decode.count
+
+        client.post(
+            "/api/v1/auth/login",
+            json={"email": "parent@test.com", "password": "password123"},
+        )
+        client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {parent_token}"})
+
+        assert verify.count == verify_before + 1
+        assert decode.count >= decode_before + 1
+
+    def test_query_timing(self, tmp_path):
+        """
+        DB 쿼리 시간 계측 테스트
+        """
+        engine = create_engine(f"sqlite:///{tmp_path / 'timing.db'}")
+        instrument_query_timing(engine)
+        instrument_query_timing(engine)  # Idempotent
+        queries = operation_duration.labels("db_query")
+        before = queries.count
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        engine.dispose()
+
+        assert queries.count == before + 2
+
+
+class TestMetricsEndpoint:
+    """/metrics 엔드포인트 테스트"""
+
+    def test_exposes_prometheus_text(self, client: TestClient, monkeypatch):
+        """
+        Prometheus 포맷 응답 테스트
+        """
+        monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+        client.get("/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'eduguard_http_requests_total{method="GET",route="/health",status="200"}' in response.text
+        assert "eduguard_db_pool_checkout_duration_milliseconds_count" in response.text
+
+    def test_disabled(self, client: TestClient, monkeypatch):
+        """
+        메트릭 비활성화 시 404 테스트 (인증이 없으므로 기본값은 비활성화)
+        """
+        assert type(settings).model_fields["METRICS_ENABLED"].default is False
+        monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+
+        assert client.get("/metrics").status_code == 404
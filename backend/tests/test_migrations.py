@@ -0,0 +1,215 @@
+"""
+Schema migration tests
+Alembic 마이그레이션과 모델 정의 일치 테스트
+"""
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    create_engine,
+    func,
+    inspect,
+    text,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.database import ALEMBIC_INI, Base, run_migrations
+from app.models import RefreshToken, User
+
+
+def _engine(path):
+    return create_engine(f"sqlite:///{path}", poolclass=NullPool)
+
+
+def _original_schema() -> MetaData:
+    # Tables as the first init_db.py created them, before refresh tokens,
+    # lookup indexes and migrations. Spelled out here rather than taken
+    # from the models, which have moved on.
+    metadata = MetaData()
+    Table(
+        "users",
+        metadata,
+        Column("id", Integer, primary_key=True, index=True, autoincrement=True),
+        Column("email", String(255), unique=True, nullable=False, index=True),
+        Column("password_hash", String(255), nullable=False),
+        Column("role", String(20), nullable=False),
+        Column("created_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+        Column("updated_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+    )
+    Table(
+        "parent_child_links",
+        metadata,
+        Column("id", Integer, primary_key=True, index=True, autoincrement=True),
+        Column("parent_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        Column("child_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        Column("linked_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+        UniqueConstraint("parent_id", "child_id", name="uq_parent_child"),
+    )
+    return metadata
+
+
+def _revision(engine) -> str:
+    with engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+
+def _indexes(engine, table: str) -> set:
+    # From sqlite_master: reflection skips expression indexes such as lower(email)
+    with engine.connect() as conn:
+        return set(
+            conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+                {"table": table},
+            ).scalars()
+        )
+
+
+class TestMigrations:
+    """마이그레이션 테스트"""
+
+    def test_upgrade_matches_models(self, tmp_path):
+        """
+        upgrade head 결과가 모델 정의와 일치하는지 테스트
+        """
+        path = tmp_path / "migrated.db"
+        run_migrations(url=f"sqlite:///{path}")
+        engine = _engine(path)
+
+        with engine.connect() as conn:
+            diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+        assert diff == []
+        assert "ix_parent_child_links_child_id" in _indexes(engine, "parent_child_links")
+        assert "ix_users_email_lower" in _indexes(engine, "users")
+        engine.dispose()
+
+    def test_downgrade_to_base(self, tmp_path):
+        """
+        downgrade base로 모든 테이블 제거 테스트
+        """
+        url = f"sqlite:///{tmp_path / 'roundtrip.db'}"
+        run_migrations(url=url)
+        config = Config(str(ALEMBIC_INI))
+        config.attributes["configure_logger"] = False
+        config.set_main_option("sqlalchemy.url", url)
+
+        command.downgrade(config, "0002")
+        engine = _engine(tmp_path / "roundtrip.db")
+        assert "ix_users_email_lower" not in _indexes(engine, "users")
+
+        command.downgrade(config, "0001")
+        assert "refresh_tokens" not in inspect(engine).get_table_names()
+
+        command.downgrade(config, "base")
+        assert set(inspect(engine).get_table_names()) == {"alembic_version"}
+        engine.dispose()
+
+    def test_existing_create_all_database_is_adopted(self, tmp_path):
+        """
+        마이그레이션 도입 전 create_all로 만든 DB를 기준 리비전으로 표시 후 업그레이드
+        """
+        path = tmp_path / "legacy.db"
+        engine = _engine(path)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_parent_child_links_child_id")
+            conn.exec_driver_sql("DROP INDEX ix_users_email_lower")
+
+        run_migrations(url=f"sqlite:///{path}")
+
+        assert _revision(engine) == "0004"
+        assert "ix_parent_child_links_child_id" in _indexes(engine, "parent_child_links")
+        assert "ix_users_email_lower" in _indexes(engine, "users")
+        engine.dispose()
+
+    def test_original_database_gets_refresh_tokens(self, tmp_path):
+        """
+        refresh_tokens 도입 전 스키마(users, parent_child_links)의 DB는 0001로 표시 후
+        refresh_tokens 테이블까지 생성되는지 테스트
+        """
+        path = tmp_path / "original.db"
+        engine = _engine(path)
+        _original_schema().create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO users (email, password_hash, role) "
+                    "VALUES ('old@test.com', 'hash', 'parent')"
+                )
+            )
+
+        run_migrations(url=f"sqlite:///{path}")
+
+        assert _revision(engine) == "0004"
+        with engine.connect() as conn:
+            assert compare_metadata(MigrationContext.configure(conn), Base.metadata) == []
+        with Session(engine) as db:
+            user = db.query(User).filter_by(email="old@test.com").one()
+            db.add(
+                RefreshToken(
+                    user_id=user.id,
+                    device_id="phone",
+                    token_hash="a" * 64,
+                    expires_at=user.created_at,
+                )
+            )
+            db.commit()
+        engine.dispose()
+
+    def test_emails_lower_cased(self, tmp_path):
+        """
+        기존 이메일을 소문자로 변환하고, 대소문자만 다른 중복이 있으면 업그레이드 중단
+        """
+        url = f"sqlite:///{tmp_path / 'emails.db'}"
+        run_migrations("0003", url=url)
+        engine = _engine(tmp_path / "emails.db")
+        insert = text(
+            "INSERT INTO users (email, password_hash, role) VALUES (:email, 'hash', 'parent')"
+        )
+        with engine.begin() as conn:
+            conn.execute(insert, {"email": "Old.User@Test.com"})
+
+        run_migrations(url=url)
+
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT email FROM users")).scalars().all() == [
+                "old.user@test.com"
+            ]
+        with engine.begin() as conn, pytest.raises(IntegrityError):
+            conn.execute(insert, {"email": "OLD.user@test.com"})
+        engine.dispose()
+
+    def test_case_duplicates_stop_upgrade(self, tmp_path):
+        """
+        대소문자만 다른 중복 계정은 자동 병합하지 않고 업그레이드 중단
+        """
+        url = f"sqlite:///{tmp_path / 'duplicates.db'}"
+        run_migrations("0003", url=url)
+        engine = _engine(tmp_path / "duplicates.db")
+        with engine.begin() as conn:
+            for email in ("a@test.com", "A@test.com"):
+                conn.execute(
+                    text(
+                        "INSERT INTO users (email, password_hash, role) "
+                        "VALUES (:email, 'hash', 'parent')"
+                    ),
+                    {"email": email},
+                )
+
+        with pytest.raises(RuntimeError, match="a@test.com"):
+            run_migrations(url=url)
+
+        assert _revision(engine) == "0003"
+        engine.dispose()
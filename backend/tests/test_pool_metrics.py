@@ -0,0 +1,161 @@
+"""
+Connection pool telemetry tests
+커넥션 풀 계측 테스트
+"""
+
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.pool_metrics import PoolTelemetry
+
+
+@pytest.fixture
+def pooled_engine():
+    """
+    Single-connection QueuePool engine on a temporary SQLite file.
+    연결 1개짜리 QueuePool 엔진 (임시 SQLite 파일)
+    """
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(
+        f"sqlite:///{path}",
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+        pool_pre_ping=True,
+        connect_args={"check_same_thread": False},
+    )
+    yield engine
+    engine.dispose()
+    os.remove(path)
+
+
+class TestPoolTelemetry:
+    """커넥션 풀 계측 테스트"""
+
+    def test_checkout_gauges_and_latency(self, pooled_engine):
+        """
+        체크아웃 지표 테스트
+        Checkouts are timed and gauges follow in-use/idle connections.
+        """
+        telemetry = PoolTelemetry(pooled_engine, name="test")
+
+        with pooled_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            assert telemetry.in_use.value == 1
+            assert telemetry.idle.value == 0
+
+        snapshot = telemetry.snapshot()
+        assert snapshot["in_use"] == 0
+        assert snapshot["idle"] == 1
+        assert snapshot["connects"] == 1
+        assert snapshot["checkouts"] == 1
+        assert snapshot["checkout_ms"]["count"] == 1
+        assert snapshot["pool_size"] == 1
+
+    def test_timeout_counted(self, pooled_engine):
+        """
+        풀 타임아웃 집계 테스트
+        A checkout that exceeds pool_timeout is counted and still timed.
+        """
+        telemetry = PoolTelemetry(pooled_engine, name="test")
+
+        with pooled_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                pooled_engine.connect()
+
+        assert telemetry.timeouts.value == 1
+        assert telemetry.checkout_ms.count == 2
+        assert telemetry.checkout_ms.snapshot()["max"] >= 100
+
+    def test_pre_ping_failure_counted(self, pooled_engine):
+        """
+        pre-ping 실패 집계 테스트
+        A pooled connection closed behind the pool's back is detected by
+        pre-ping, counted and replaced.
+        """
+        telemetry = PoolTelemetry(pooled_engine, name="test")
+        with pooled_engine.connect() as conn:
+            dbapi_connection = conn.connection.dbapi_connection
+        dbapi_connection.close()
+
+        with pooled_engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+
+        assert telemetry.pre_ping_failures.value == 1
+        assert telemetry.invalidations.value >= 1
+        assert telemetry.connects.value == 2
+
+    def test_survives_dispose(self, pooled_engine):
+        """
+        엔진 dispose 이후 계측 유지 테스트
+        dispose() replaces the pool; checkouts on the new pool are still timed.
+        """
+        telemetry = PoolTelemetry(pooled_engine, name="test")
+        pooled_engine.dispose()
+
+        with pooled_engine.connect():
+            pass
+
+        assert telemetry.checkout_ms.count == 1
+
+
+class TestAdminPoolEndpoint:
+    """관리자 커넥션 풀 API 테스트"""
+
+    def test_disabled_without_key(self, client: TestClient, monkeypatch):
+        """
+        관리자 키 미설정 시 404 테스트
+        """
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", None)
+
+        response = client.get("/api/v1/admin/pool", headers={"X-Admin-Key": "anything"})
+
+        assert response.status_code == 404
+
+    def test_wrong_key_rejected(self, client: TestClient, monkeypatch):
+        """
+        잘못된 관리자 키 403 테스트
+        """
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", "admin-secret")
+
+        response = client.get("/api/v1/admin/pool", headers={"X-Admin-Key": "wrong"})
+
+        assert response.status_code == 403
+
+    def test_returns_primary_pool(self, client: TestClient, monkeypatch):
+        """
+        커넥션 풀 지표 조회 테스트
+        """
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", "admin-secret")
+
+        response = client.get("/api/v1/admin/pool", headers={"X-Admin-Key": "admin-secret"})
+
+        assert response.status_code == 200
+        primary = response.json()["primary"]
+        assert {"in_use", "idle", "overflow", "timeouts", "pre_ping_failures"} <= primary.keys()
+        assert "p99" in primary["checkout_ms"]
+
+    def test_stats_behind_admin_key(self, client: TestClient, monkeypatch):
+        """
+        내부 지표는 관리자 API에서만 제공 (/health는 최소 응답)
+        """
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", "admin-secret")
+
+        health = client.get("/health").json()
+        denied = client.get("/api/v1/admin/stats")
+        response = client.get("/api/v1/admin/stats", headers={"X-Admin-Key": "admin-secret"})
+
+        assert set(health) == {"status", "environment", "debug"}
+        assert denied.status_code == 403
+        assert response.status_code == 200
+        assert {"db_pool", "rate_limiter", "user_cache", "read_replicas", "chat_streams"} <= (
+            response.json().keys()
+        )
@@ -0,0 +1,156 @@
+"""
+Query plan tests for the hot auth queries
+주요 인증 쿼리의 실행 계획 검사 (대용량 테이블 전체 스캔 금지)
+
+Seeds large users/parent_child_links/refresh_tokens tables, runs the auth
+flows while capturing every statement, then runs EXPLAIN QUERY PLAN on
+each one. A plan step that scans one of the seeded tables (instead of
+searching it through an index) fails the test.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.query_stats import capture_queries
+from app.models.refresh_token import RefreshToken
+from app.models.user import ParentChildLink, User
+
+from .conftest import test_engine
+
+SEED_USERS = 20000
+LARGE_TABLES = ("users", "parent_child_links", "refresh_tokens")
+FULL_SCAN = re.compile(rf"^SCAN ({'|'.join(LARGE_TABLES)})\b")
+# Statements that read a table (plain INSERT ... VALUES has no plan to check)
+PLANNED = re.compile(
+    r"^\s*(SELECT|UPDATE|DELETE|INSERT\s+INTO\s+\w+\s*\(.*?\)\s*SELECT)", re.S | re.I
+)
+
+
+@pytest.fixture
+def large_tables(db_session: Session) -> None:
+    """
+    SEED_USERS parents and children, one link and one session each.
+    부모/자녀 각 SEED_USERS명, 연동 및 리프레시 세션 시드
+    """
+    expires = datetime.now(timezone.utc) + timedelta(days=1)
+    with test_engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "id": i,
+                    "email": f"seed{i}@example.com",
+                    "password_hash": "x",
+                    "role": "parent" if i % 2 else "child",
+                }
+                for i in range(1, 2 * SEED_USERS + 1)
+            ],
+        )
+        conn.execute(
+            insert(ParentChildLink),
+            [{"parent_id": i, "child_id": i + 1} for i in range(1, 2 * SEED_USERS, 2)],
+        )
+        conn.execute(
+            insert(RefreshToken),
+            [
+                {
+                    "user_id": i,
+                    "device_id": "seed",
+                    "token_hash": f"{i:064d}",
+                    "previous_token_hash": f"{-i:064d}",  # Refreshed at least once
+                    "expires_at": expires,
+                }
+                for i in range(1, 2 * SEED_USERS + 1)
+            ],
+        )
+        conn.execute(text("ANALYZE"))
+
+
+def full_scans(statement: str) -> list:
+    """Plan steps of `statement` that scan a large table"""
+    with test_engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", tuple([None] * statement.count("?"))
+        ).all()
+    return [row[-1] for row in plan if FULL_SCAN.match(row[-1])]
+
+
+def run_auth_flows(client: TestClient) -> None:
+    """Every hot auth endpoint once, with user lookups hitting the database"""
+    signup = client.post(
+        "/api/v1/auth/signup",
+        json={"email": "new.parent@example.com", "password": "password123", "role": "parent"},
+    )
+    assert signup.status_code == 201, signup.text
+    client.get("/api/v1/auth/email-available", params={"email": "seed5@example.com"})
+
+    login = client.post(
+        "/api/v1/auth/login",
+        json={"email": "New.Parent@example.com", "password": "password123", "device_id": "web"},
+    )
+    assert login.status_code == 200, login.text
+    tokens = login.json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    assert client.post(
+        "/api/v1/auth/link-child", json={"child_id": 2}, headers=headers
+    ).status_code == 201
+    client.post("/api/v1/auth/link-children", json={"child_ids": [4, 6]}, headers=headers)
+    assert client.get("/api/v1/auth/children", headers=headers).status_code == 200
+    assert client.delete("/api/v1/auth/link-child/2", headers=headers).status_code == 200
+
+    refreshed = client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert refreshed.status_code == 200, refreshed.text
+    client.delete("/api/v1/auth/sessions/web", headers=headers)
+    client.post("/api/v1/auth/logout", json={"refresh_token": refreshed.json()["refresh_token"]})
+
+
+class TestQueryPlans:
+    """대용량 테이블 실행 계획 테스트"""
+
+    def test_auth_queries_use_indexes(self, client: TestClient, large_tables, monkeypatch):
+        """
+        인증 API의 모든 쿼리가 인덱스를 사용하는지 테스트
+        """
+        monkeypatch.setattr(settings, "USER_CACHE_ENABLED", False)
+        with capture_queries() as stats:
+            run_auth_flows(client)
+
+        statements = [s for s in stats.statements if PLANNED.match(s)]
+        assert len(statements) >= 10
+        scans = {s: full_scans(s) for s in statements}
+        assert {s: steps for s, steps in scans.items() if steps} == {}
+
+    def test_child_side_lookups_use_indexes(self, db_session: Session, large_tables):
+        """
+        자녀 기준 조회(User.parents)가 child_id 인덱스를 사용하는지 테스트
+        """
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", record)
+        try:
+            child = db_session.get(User, 2)
+            assert [parent.id for parent in child.parents] == [1]
+        finally:
+            event.remove(test_engine, "before_cursor_execute", record)
+
+        [parents_query] = [s for s in statements if "parent_child_links" in s]
+        assert full_scans(parents_query) == []
+
+    def test_detects_full_scan(self, large_tables):
+        """
+        검사기 자체 확인: 인덱스 없는 조건은 전체 스캔으로 검출
+        """
+        assert full_scans("SELECT id FROM users WHERE role = ?") == ["SCAN users"]
@@ -0,0 +1,168 @@
+"""
+Per-request query counting tests
+요청별 쿼리 수 집계 및 N+1 감지 테스트
+"""
+
+import asyncio
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.core.instrumentation import instrument_query_timing
+from app.core.query_stats import QueryStatsMiddleware, capture_queries
+from app.models.user import User
+
+
+class TestQueryBudgets:
+    """엔드포인트별 쿼리 수 상한 테스트"""
+
+    def test_me(self, client: TestClient, auth_headers: dict, assert_max_queries):
+        """
+        /me 쿼리 수 테스트 (캐시 미스 시 사용자 조회 1회)
+        """
+        with assert_max_queries(1):
+            response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 200
+
+    def test_link_child(
+        self, client: TestClient, auth_headers: dict, child_user: User, assert_max_queries
+    ):
+        """
+        자녀 연동 쿼리 수 테스트
+        """
+        with assert_max_queries(2):
+            response = client.post(
+                "/api/v1/auth/link-child",
+                json={"child_id": child_user.id},
+                headers=auth_headers,
+            )
+        assert response.status_code == 201
+
+    def test_children_does_not_grow_with_children(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        multiple_children: list[User],
+        assert_max_queries,
+    ):
+        """
+        자녀 목록 조회 쿼리 수 테스트
+        Listing linked children costs the same number of statements for
+        one child as for three.
+        """
+        client.post(
+            "/api/v1/auth/link-children",
+            json={"child_ids": [child.id for child in multiple_children[:3]]},
+            headers=auth_headers,
+        )
+
+        with assert_max_queries(2):
+            response = client.get("/api/v1/auth/children", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+
+    def test_unlink_child(
+        self, client: TestClient, auth_headers: dict, child_user: User, assert_max_queries
+    ):
+        """
+        자녀 연동 해제 쿼리 수 테스트
+        """
+        client.post("/api/v1/auth/link-child", json={"child_id": child_user.id}, headers=auth_headers)
+
+        with assert_max_queries(3):
+            response = client.delete(
+                f"/api/v1/auth/link-child/{child_user.id}", headers=auth_headers
+            )
+        assert response.status_code == 200
+
+    def test_login_and_signup(self, client: TestClient, parent_user: User, assert_max_queries):
+        """
+        로그인/회원가입 쿼리 수 테스트
+        """
+        with assert_max_queries(3):
+            client.post(
+                "/api/v1/auth/login",
+                json={"email": "parent@test.com", "password": "password123"},
+            )
+        with assert_max_queries(3):
+            client.post(
+                "/api/v1/auth/signup",
+                json={"email": "new@test.com", "password": "password123", "role": "parent"},
+            )
+
+    def test_helper_flags_repeated_statement(self, tmp_path, assert_max_queries):
+        """
+        반복 쿼리(N+1) 감지 테스트
+        """
+        engine = create_engine(f"sqlite:///{tmp_path / 'loop.db'}")
+        instrument_query_timing(engine)
+
+        with pytest.raises(AssertionError, match="possible N\\+1"):
+            with assert_max_queries(10):
+                with engine.connect() as conn:
+                    for value in range(3):
+                        conn.execute(text("SELECT :value"), {"value": value})
+        engine.dispose()
+
+
+class TestQueryStatsMiddleware:
+    """쿼리 통계 미들웨어 테스트"""
+
+    def test_debug_headers(self, client: TestClient, auth_headers: dict, monkeypatch):
+        """
+        디버그 모드 응답 헤더 테스트
+        """
+        monkeypatch.setattr(settings, "QUERY_STATS_ENABLED", True)
+        monkeypatch.setattr(settings, "DEBUG", True)
+
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+
+        assert response.headers["x-db-query-count"] == "1"
+        assert float(response.headers["x-db-query-time-ms"]) >= 0
+
+    def test_no_headers_outside_debug(self, client: TestClient, auth_headers: dict, monkeypatch):
+        """
+        디버그 모드가 아니면 헤더 미포함 테스트
+        """
+        monkeypatch.setattr(settings, "QUERY_STATS_ENABLED", True)
+        monkeypatch.setattr(settings, "DEBUG", False)
+
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+
+        assert "x-db-query-count" not in response.headers
+
+    def test_logs_slow_and_repeated_requests(self, tmp_path, monkeypatch, caplog):
+        """
+        임계값 초과/반복 쿼리 로그 테스트
+        """
+        monkeypatch.setattr(settings, "QUERY_STATS_ENABLED", True)
+        monkeypatch.setattr(settings, "QUERY_STATS_WARN_COUNT", 2)
+        engine = create_engine(f"sqlite:///{tmp_path / 'n_plus_one.db'}")
+        instrument_query_timing(engine)
+
+        async def app(scope, receive, send):
+            with engine.connect() as conn:
+                for value in range(4):
+                    conn.execute(text("SELECT :value"), {"value": value})
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            pass
+
+        scope = {"type": "http", "method": "GET", "path": "/loop", "headers": []}
+        with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+            with capture_queries() as stats:
+                asyncio.run(QueryStatsMiddleware(app)(scope, receive, send))
+        engine.dispose()
+
+        assert stats.count == 4
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("GET /loop ran 4 statements" in message for message in messages)
+        assert any("repeated a statement 4 times" in message for message in messages)
@@ -0,0 +1,215 @@
+"""
+Rate limiting tests
+요청 속도 제한 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.rate_limit import (
+    MAX_INSPECTED_BODY_BYTES,
+    Rate,
+    RateLimiter,
+    RateLimitMiddleware,
+    ShardedMemoryStore,
+)
+from app.models.user import User
+from app.utils.hashing import password_hasher
+
+
+@pytest.fixture
+def rate_limited(monkeypatch):
+    """Enable rate limiting with a small per-minute budget"""
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 3)
+    monkeypatch.setattr(settings, "RATE_LIMIT_PER_HOUR", 100)
+
+
+class TestGcraStore:
+    """GCRA 저장소 테스트"""
+
+    def test_burst_then_sustained_rate(self):
+        """
+        버스트 허용 후 지속 속도 제한 테스트
+        A full burst is allowed, then one request per emission interval.
+        """
+        store = ShardedMemoryStore(shards=4)
+        rates = [Rate(3, 60)]
+
+        assert [store.hit_sync("ip:a", rates, 0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert store.hit_sync("ip:a", rates, 0.0) == pytest.approx(20.0)
+        assert store.hit_sync("ip:b", rates, 0.0) == 0.0
+        assert store.hit_sync("ip:a", rates, 20.0) == 0.0
+        assert store.hit_sync("ip:a", rates, 20.0) > 0
+
+    def test_denied_request_does_not_consume_other_rates(self):
+        """
+        거절된 요청의 예산 미소모 테스트
+        A request rejected by one rate leaves every rate's state untouched.
+        """
+        store = ShardedMemoryStore(shards=1)
+        rates = [Rate(100, 60), Rate(2, 3600)]
+
+        store.hit_sync("k", rates, 0.0)
+        store.hit_sync("k", rates, 0.0)
+        for _ in range(5):
+            assert store.hit_sync("k", rates, 0.0) > 0
+        assert store.hit_sync("k", [rates[0]], 0.0) == 0.0
+
+    def test_bounded_size(self):
+        """
+        샤드별 최대 키 수 유지 테스트
+        Shards never grow beyond max_keys_per_shard.
+        """
+        store = ShardedMemoryStore(shards=1, max_keys_per_shard=10)
+        for i in range(50):
+            store.hit_sync(f"ip:{i}", [Rate(5, 60)], float(i))
+
+        assert len(store) <= 10
+
+
+class TestRateLimitMiddleware:
+    """속도 제한 미들웨어 테스트"""
+
+    def test_login_limited_before_bcrypt(
+        self, client: TestClient, parent_user: User, rate_limited
+    ):
+        """
+        로그인 제한 시 bcrypt 미실행 테스트
+        Over the limit, /login answers 429 with Retry-After and no hashing work.
+        """
+        credentials = {"email": "parent@test.com", "password": "wrong-password1"}
+        for _ in range(3):
+            assert client.post("/api/v1/auth/login", json=credentials).status_code == 401
+
+        submitted = password_hasher.stats.snapshot()["submitted"]
+        response = client.post("/api/v1/auth/login", json=credentials)
+
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) >= 1
+        assert password_hasher.stats.snapshot()["submitted"] == submitted
+
+    def test_email_key_is_case_insensitive(
+        self, client: TestClient, parent_user: User, rate_limited, monkeypatch
+    ):
+        """
+        이메일 기준 제한 테스트
+        The email budget is shared by every spelling of the address.
+        """
+        monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 2)
+        for email in ("parent@test.com", "PARENT@test.com"):
+            client.post("/api/v1/auth/login", json={"email": email, "password": "x"})
+
+        response = client.post(
+            "/api/v1/auth/login", json={"email": "Parent@Test.com", "password": "x"}
+        )
+
+        assert response.status_code == 429
+
+    def test_rejection_has_cors_headers(self, client: TestClient, rate_limited):
+        """
+        429 응답의 CORS 헤더 테스트
+        Browsers can read the 429 because CORS wraps the rate limiter.
+        """
+        headers = {"Origin": "https://app.example.com"}
+        credentials = {"email": "nobody@test.com", "password": "x"}
+        for _ in range(3):
+            client.post("/api/v1/auth/login", json=credentials, headers=headers)
+
+        response = client.post("/api/v1/auth/login", json=credentials, headers=headers)
+
+        assert response.status_code == 429
+        assert "access-control-allow-origin" in response.headers
+
+    def test_authenticated_requests_limited_by_user(
+        self, client: TestClient, auth_headers: dict, child_auth_headers: dict, rate_limited
+    ):
+        """
+        사용자 ID 기준 제한 테스트
+        Authenticated requests are limited per user, independently of others.
+        """
+        for _ in range(3):
+            assert client.get("/api/v1/auth/me", headers=auth_headers).status_code == 200
+
+        assert client.get("/api/v1/auth/me", headers=auth_headers).status_code == 429
+        assert client.get("/api/v1/auth/me", headers=child_auth_headers).status_code == 200
+
+    def test_body_is_replayed_to_route(self, client: TestClient, rate_limited):
+        """
+        본문 재전달 테스트
+        The buffered credential body still reaches the route intact.
+        """
+        response = client.post(
+            "/api/v1/auth/signup",
+            json={"email": "new@test.com", "password": "password123", "role": "parent"},
+        )
+
+        assert response.status_code == 201
+
+    def test_oversized_body_not_buffered(self, rate_limited):
+        """
+        큰 본문 버퍼링 중단 테스트
+        Past MAX_INSPECTED_BODY_BYTES the middleware stops reading; the app gets every chunk.
+        """
+        chunk = b"x" * (16 * 1024)
+        total_chunks = 64  # 1 MiB, no Content-Length (chunked upload)
+
+        async def scenario(headers):
+            sent = 0
+            read_before_app = None
+
+            async def receive():
+                nonlocal sent
+                sent += 1
+                return {
+                    "type": "http.request",
+                    "body": chunk,
+                    "more_body": sent < total_chunks,
+                }
+
+            async def app(scope, receive, send):
+                nonlocal read_before_app
+                read_before_app = sent
+                body = b""
+                while True:
+                    message = await receive()
+                    body += message["body"]
+                    if not message["more_body"]:
+                        break
+                await send({"type": "http.response.start", "status": 200, "headers": []})
+                await send({"type": "http.response.body", "body": str(len(body)).encode()})
+
+            responses = []
+
+            async def send(message):
+                responses.append(message)
+
+            middleware = RateLimitMiddleware(app, RateLimiter(ShardedMemoryStore()))
+            scope = {
+                "type": "http",
+                "method": "POST",
+                "path": "/api/v1/auth/login",
+                "headers": headers,
+                "client": ("10.0.0.1", 1234),
+            }
+            await middleware(scope, receive, send)
+            return read_before_app, responses[-1]["body"]
+
+        size = str(len(chunk) * total_chunks).encode()
+        chunked = asyncio.run(scenario([]))
+        declared = asyncio.run(scenario([(b"content-length", size)]))
+
+        assert chunked == (MAX_INSPECTED_BODY_BYTES // len(chunk) + 1, size)
+        assert declared == (0, size)
+
+    def test_disabled(self, client: TestClient, auth_headers: dict, monkeypatch):
+        """
+        비활성화 테스트
+        Nothing is limited when RATE_LIMIT_ENABLED is False.
+        """
+        monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 1)
+        for _ in range(3):
+            assert client.get("/api/v1/auth/me", headers=auth_headers).status_code == 200
@@ -0,0 +1,227 @@
+"""
+Refresh token API tests
+리프레시 토큰 발급/회전/폐기 API 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.refresh_token import RefreshToken
+from app.models.statements import REFRESH_TOKEN_WITH_USER
+from app.models.user import User
+from app.services.refresh_tokens import (
+    RefreshTokenError,
+    issue_refresh_token,
+    rotate_refresh_token,
+)
+
+from .conftest import TestAsyncSessionLocal
+
+
+def login(client: TestClient, device_id: str = "phone") -> dict:
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": "parent@test.com", "password": "password123", "device_id": device_id},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestRefresh:
+    """토큰 갱신 API 테스트"""
+
+    def test_login_returns_refresh_token(self, client: TestClient, parent_user: User):
+        """
+        로그인 시 리프레시 토큰 발급 테스트
+        Login should return a refresh token alongside the access token.
+        """
+        data = login(client)
+
+        assert data["refresh_token"]
+        assert data["refresh_expires_in"] > data["expires_in"]
+
+    def test_refresh_rotates_token(self, client: TestClient, parent_user: User):
+        """
+        토큰 갱신 및 교체 테스트
+        Refresh should return a new access token and a new refresh token.
+        """
+        tokens = login(client)
+
+        response = client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["refresh_token"] != tokens["refresh_token"]
+        assert data["user"]["id"] == parent_user.id
+        me = client.get(
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {data['access_token']}"},
+        )
+        assert me.status_code == 200
+
+    def test_reused_refresh_token_revokes_session(
+        self, client: TestClient, parent_user: User
+    ):
+        """
+        교체된 토큰 재사용 시 세션 폐기 테스트
+        Replaying a rotated token must fail and revoke the newer token as well.
+        """
+        old_token = login(client)["refresh_token"]
+        new_token = client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": old_token}
+        ).json()["refresh_token"]
+
+        replay = client.post("/api/v1/auth/refresh", json={"refresh_token": old_token})
+        after = client.post("/api/v1/auth/refresh", json={"refresh_token": new_token})
+
+        assert replay.status_code == 401
+        assert after.status_code == 401
+
+    def test_expired_refresh_token(
+        self, client: TestClient, db_session: Session, parent_user: User
+    ):
+        """
+        만료된 리프레시 토큰 테스트
+        An expired refresh token should return 401.
+        """
+        token = login(client)["refresh_token"]
+        record = db_session.query(RefreshToken).one()
+        record.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        db_session.commit()
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+
+        assert response.status_code == 401
+
+    def test_invalid_refresh_token(self, client: TestClient):
+        """
+        알 수 없는 리프레시 토큰 테스트
+        Unknown refresh tokens should return 401.
+        """
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": "nope"})
+
+        assert response.status_code == 401
+
+
+class TestConcurrency:
+    """동시 발급/갱신 테스트"""
+
+    def test_concurrent_logins_for_one_device(self, db_session: Session, parent_user: User):
+        """
+        같은 기기의 동시 로그인 시 세션 하나만 남는지 테스트
+        Concurrent issues for one device upsert the same row instead of failing.
+        """
+
+        async def issue() -> str:
+            async with TestAsyncSessionLocal() as db:
+                return await issue_refresh_token(db, parent_user.id, "phone")
+
+        async def scenario() -> list:
+            return await asyncio.gather(*(issue() for _ in range(5)))
+
+        tokens = asyncio.run(scenario())
+
+        assert len(set(tokens)) == 5
+        assert db_session.query(RefreshToken).filter_by(device_id="phone").count() == 1
+
+    def test_login_replaces_revoked_session(self, db_session: Session, parent_user: User):
+        """
+        폐기된 기기 세션에 다시 로그인 테스트
+        """
+
+        async def scenario() -> str:
+            async with TestAsyncSessionLocal() as db:
+                old = await issue_refresh_token(db, parent_user.id, "phone")
+                await rotate_refresh_token(db, old)
+                with pytest.raises(RefreshTokenError):
+                    await rotate_refresh_token(db, old)  # Replay revokes the session
+                new = await issue_refresh_token(db, parent_user.id, "phone")
+                user, _ = await rotate_refresh_token(db, new)
+                return user.email
+
+        assert asyncio.run(scenario()) == "parent@test.com"
+
+    def test_simultaneous_refresh_with_one_token(
+        self, db_session: Session, parent_user: User, monkeypatch
+    ):
+        """
+        같은 토큰으로 동시 갱신 시 하나만 성공하고 세션이 폐기되는지 테스트
+        The second request looked the token up before the first rotated it.
+        """
+
+        async def scenario() -> str:
+            async with TestAsyncSessionLocal() as first, TestAsyncSessionLocal() as second:
+                token = await issue_refresh_token(first, parent_user.id, "phone")
+                results = {}
+                lookup = second.execute
+
+                async def lookup_then_race(statement, *args, **kwargs):
+                    result = await lookup(statement, *args, **kwargs)
+                    if statement is REFRESH_TOKEN_WITH_USER and "first" not in results:
+                        results["first"] = await rotate_refresh_token(first, token)
+                    return result
+
+                monkeypatch.setattr(second, "execute", lookup_then_race)
+                with pytest.raises(RefreshTokenError, match="reuse"):
+                    await rotate_refresh_token(second, token)
+
+                # The winner's new token belongs to the revoked session
+                _, winner_token = results["first"]
+                with pytest.raises(RefreshTokenError, match="revoked"):
+                    await rotate_refresh_token(first, winner_token)
+                return winner_token
+
+        asyncio.run(scenario())
+        assert db_session.query(RefreshToken).one().revoked_at is not None
+
+
+class TestRevoke:
+    """세션 폐기 API 테스트"""
+
+    def test_logout_revokes_refresh_token(self, client: TestClient, parent_user: User):
+        """
+        로그아웃 후 갱신 실패 테스트
+        After logout the refresh token can no longer be used.
+        """
+        token = login(client)["refresh_token"]
+
+        logout = client.post("/api/v1/auth/logout", json={"refresh_token": token})
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+
+        assert logout.status_code == 200
+        assert logout.json()["data"]["revoked"] is True
+        assert response.status_code == 401
+
+    def test_revoke_single_device(self, client: TestClient, parent_user: User):
+        """
+        기기별 세션 폐기 테스트
+        Revoking one device must leave other devices' sessions working.
+        """
+        phone = login(client, "phone")
+        tablet = login(client, "tablet")
+        headers = {"Authorization": f"Bearer {tablet['access_token']}"}
+
+        response = client.delete("/api/v1/auth/sessions/phone", headers=headers)
+
+        assert response.status_code == 200
+        assert client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": phone["refresh_token"]}
+        ).status_code == 401
+        assert client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": tablet["refresh_token"]}
+        ).status_code == 200
+
+    def test_revoke_unknown_device(self, client: TestClient, auth_headers: dict):
+        """
+        존재하지 않는 기기 세션 폐기 테스트
+        Revoking a device without an active session should return 404.
+        """
+        response = client.delete("/api/v1/auth/sessions/watch", headers=auth_headers)
+
+        assert response.status_code == 404
@@ -0,0 +1,242 @@
+"""
+Read-replica routing tests
+읽기 복제본 라우팅 테스트 (SQLite 파일 2개로 primary/replica 구성)
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base, get_read_db, replica_router
+from app.core.replicas import READ_ONLY, Replica, ReplicaRouter, RoutingSession, use_primary_for
+from app.main import app
+from app.models.user import User
+
+
+def _sqlite_file(tag: str):
+    fd, path = tempfile.mkstemp(prefix=f"replica-{tag}-", suffix=".db")
+    os.close(fd)
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    return path, sync_engine, async_engine
+
+
+@pytest.fixture
+def databases():
+    """
+    Primary and two replicas, each holding user 1 with a different email.
+    이메일로 어느 DB에서 읽었는지 구분합니다.
+    """
+    created = {tag: _sqlite_file(tag) for tag in ("primary", "replica0", "replica1")}
+    for tag, (_, sync_engine, _) in created.items():
+        with sync_engine.begin() as conn:
+            conn.execute(
+                insert(User).values(
+                    id=1, email=f"{tag}@example.com", password_hash="x", role="parent"
+                )
+            )
+    yield {tag: async_engine for tag, (_, _, async_engine) in created.items()}
+    for path, sync_engine, async_engine in created.values():
+        sync_engine.dispose()
+        asyncio.run(async_engine.dispose())
+        os.remove(path)
+
+
+def _router(databases, **options) -> ReplicaRouter:
+    return ReplicaRouter(
+        [Replica(name, databases[name]) for name in ("replica0", "replica1")], **options
+    )
+
+
+async def _read_email(databases, router, key=None) -> str:
+    factory = async_sessionmaker(
+        bind=databases["primary"], class_=AsyncSession, sync_session_class=RoutingSession
+    )
+    async with factory(info={READ_ONLY: router}) as db:
+        if key is not None:
+            use_primary_for(db, router, key)
+        return (await db.execute(select(User.email).where(User.id == 1))).scalar_one()
+
+
+class TestRouting:
+    """세션 라우팅 테스트"""
+
+    def test_round_robin_across_replicas(self, databases):
+        """
+        읽기 세션이 복제본에 번갈아 분배되는지 테스트
+        """
+        router = _router(databases)
+
+        emails = [asyncio.run(_read_email(databases, router)) for _ in range(4)]
+
+        assert emails == ["replica0@example.com", "replica1@example.com"] * 2
+        assert router.stats()["replica_reads"] == 4
+
+    def test_plain_sessions_use_primary(self, databases):
+        """
+        get_db 세션(READ_ONLY 없음)은 항상 primary 사용
+        """
+        factory = async_sessionmaker(
+            bind=databases["primary"], class_=AsyncSession, sync_session_class=RoutingSession
+        )
+
+        async def read() -> str:
+            async with factory() as db:
+                return (await db.execute(select(User.email))).scalar_one()
+
+        assert asyncio.run(read()) == "primary@example.com"
+
+    def test_writes_go_to_primary(self, databases):
+        """
+        읽기 세션에서도 flush/INSERT는 primary에 기록
+        """
+        router = _router(databases)
+        factory = async_sessionmaker(
+            bind=databases["primary"], class_=AsyncSession, sync_session_class=RoutingSession
+        )
+
+        async def write() -> None:
+            async with factory(info={READ_ONLY: router}) as db:
+                db.add(User(id=2, email="new@example.com", password_hash="x", role="child"))
+                await db.commit()
+
+        asyncio.run(write())
+
+        async def count(engine) -> int:
+            async with engine.connect() as conn:
+                return len((await conn.execute(select(User.id))).all())
+
+        assert asyncio.run(count(databases["primary"])) == 2
+        assert asyncio.run(count(databases["replica0"])) == 1
+
+
+class TestFallback:
+    """헬스 체크 및 지연 기반 폴백 테스트"""
+
+    def test_unhealthy_replica_skipped(self, databases, tmp_path):
+        """
+        연결할 수 없는 복제본은 헬스 체크 후 제외
+        """
+        broken = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path}/missing/dir/replica.db", poolclass=NullPool
+        )
+        router = ReplicaRouter(
+            [Replica("broken", broken), Replica("replica0", databases["replica0"])]
+        )
+
+        asyncio.run(router.check())
+
+        stats = router.stats()["replicas"]
+        assert stats["broken"]["healthy"] is False
+        assert stats["broken"]["last_error"]
+        assert stats["replica0"]["healthy"] is True
+        emails = {asyncio.run(_read_email(databases, router)) for _ in range(3)}
+        assert emails == {"replica0@example.com"}
+
+    def test_lagging_replicas_fall_back_to_primary(self, databases):
+        """
+        허용 지연을 넘는 복제본만 있으면 primary에서 읽기
+        """
+        router = _router(databases, max_lag_seconds=1.0)
+        for replica in router.replicas:
+            replica.lag_seconds = 3.0
+
+        assert asyncio.run(_read_email(databases, router)) == "primary@example.com"
+        assert router.stats()["primary_fallbacks"] == 1
+
+        router.replicas[1].lag_seconds = 0.5
+        assert asyncio.run(_read_email(databases, router)) == "replica1@example.com"
+
+    def test_read_after_write_is_sticky(self, databases):
+        """
+        방금 쓰기한 사용자는 일정 시간 primary에서 읽기
+        """
+        router = _router(databases, sticky_seconds=60)
+        router.mark_write(1)
+
+        assert asyncio.run(_read_email(databases, router, key=1)) == "primary@example.com"
+        assert asyncio.run(_read_email(databases, router, key=2)).startswith("replica")
+
+        router.sticky_seconds = 0
+        router.mark_write(1)
+        assert asyncio.run(_read_email(databases, router, key=1)).startswith("replica")
+
+
+class TestEndpoints:
+    """엔드포인트 라우팅 테스트"""
+
+    @pytest.fixture
+    def routed_client(self, client: TestClient, parent_user: User, monkeypatch, tmp_path):
+        """
+        Real get_read_db with a replica that has the parent but no links.
+        부모 계정만 복제된 (연동 정보 없는) 복제본
+        """
+        path = tmp_path / "replica.db"
+        sync_engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(sync_engine)
+        with sync_engine.begin() as conn:
+            conn.execute(
+                insert(User).values(
+                    id=parent_user.id,
+                    email=parent_user.email,
+                    password_hash=parent_user.password_hash,
+                    role="parent",
+                )
+            )
+        sync_engine.dispose()
+        replica = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+        monkeypatch.setattr(replica_router, "replicas", [Replica("test", replica)])
+        monkeypatch.setattr(replica_router, "_recent_writes", {})
+        monkeypatch.setattr(replica_router, "replica_reads", 0)
+        app.dependency_overrides.pop(get_read_db)
+        yield client
+        asyncio.run(replica.dispose())
+
+    def test_reads_use_replica_until_a_write(
+        self, routed_client: TestClient, auth_headers: dict, child_user: User, monkeypatch
+    ):
+        """
+        /children은 복제본에서 읽고, 연동 직후에는 primary에서 읽기
+        """
+        response = routed_client.get("/api/v1/auth/children", headers=auth_headers)
+        assert response.json()["total"] == 0
+        assert replica_router.replica_reads == 1
+
+        # The new link is only on the primary; the parent reads it back from there
+        routed_client.post(
+            "/api/v1/auth/link-child", json={"child_id": child_user.id}, headers=auth_headers
+        )
+        response = routed_client.get("/api/v1/auth/children", headers=auth_headers)
+        assert response.json()["total"] == 1
+
+        # Once the sticky window is over, reads go back to the (stale) replica
+        monkeypatch.setattr(replica_router, "_recent_writes", {})
+        response = routed_client.get("/api/v1/auth/children", headers=auth_headers)
+        assert response.json()["total"] == 0
+
+    def test_user_missing_on_replica_is_read_from_primary(
+        self, routed_client: TestClient, monkeypatch
+    ):
+        """
+        복제본에 아직 없는 사용자는 primary에서 다시 조회
+        The sticky pin is per worker; here the signup's pin is forgotten.
+        """
+        response = routed_client.post(
+            "/api/v1/auth/signup",
+            json={"email": "new@test.com", "password": "password123", "role": "parent"},
+        )
+        token = response.json()["access_token"]
+        monkeypatch.setattr(replica_router, "_recent_writes", {})
+
+        me = routed_client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+        assert me.status_code == 200
+        assert me.json()["email"] == "new@test.com"
+        assert replica_router.replica_reads == 1
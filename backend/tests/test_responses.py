@@ -0,0 +1,72 @@
+"""
+Fast JSON response tests
+orjson 응답 경로 테스트
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.models.user import User, ParentChildLink
+
+
+@pytest.fixture
+def linked_child(db_session, parent_user: User, child_user: User) -> User:
+    db_session.add(ParentChildLink(parent_id=parent_user.id, child_id=child_user.id))
+    db_session.commit()
+    return child_user
+
+
+class TestFastJsonResponses:
+    """빠른 직렬화 모드 테스트"""
+
+    @pytest.mark.parametrize("path", ["/api/v1/auth/me", "/api/v1/auth/children"])
+    def test_same_payload_in_both_modes(
+        self, client: TestClient, linked_child: User, auth_headers: dict, monkeypatch, path
+    ):
+        """
+        두 모드의 응답 동일성 테스트
+        The orjson path returns exactly what response_model validation would.
+        """
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+        slow = client.get(path, headers=auth_headers)
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        fast = client.get(path, headers=auth_headers)
+
+        assert slow.status_code == fast.status_code == 200
+        assert fast.json() == slow.json()
+        assert fast.headers.get("etag") == slow.headers.get("etag")
+        for mode in (slow, fast):
+            names = [name.lower() for name, _ in mode.headers.multi_items()]
+            assert len(names) == len(set(names)), f"Duplicate headers: {names}"
+
+    def test_login_payload_in_both_modes(
+        self, client: TestClient, parent_user: User, monkeypatch
+    ):
+        """
+        로그인 응답 동일성 테스트
+        Token responses keep the same shape and user data in both modes.
+        """
+        credentials = {"email": "parent@test.com", "password": "password123"}
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+        slow = client.post("/api/v1/auth/login", json=credentials).json()
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        fast = client.post("/api/v1/auth/login", json=credentials).json()
+
+        assert fast.keys() == slow.keys()
+        assert fast["user"] == slow["user"]
+        assert fast["token_type"] == slow["token_type"] == "bearer"
+        assert fast["expires_in"] == slow["expires_in"]
+
+    def test_signup_status_code(self, client: TestClient):
+        """
+        빠른 경로의 상태 코드 유지 테스트
+        Fast responses keep the route's status code.
+        """
+        response = client.post(
+            "/api/v1/auth/signup",
+            json={"email": "new@test.com", "password": "password123", "role": "parent"},
+        )
+
+        assert response.status_code == 201
+        assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,88 @@
+"""
+Production launcher tests
+프로덕션 서버 실행기 설정 테스트
+"""
+
+import importlib.util
+
+from app.core.config import settings
+from app import server
+from app.utils.hashing import password_hasher
+
+
+def _load_gunicorn_config():
+    spec = importlib.util.spec_from_file_location("gunicorn_conf", server.GUNICORN_CONFIG)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestWorkerSizing:
+    """워커 수 산정 테스트"""
+
+    def test_cgroup_quota_limits_cpus(self, tmp_path):
+        """
+        cgroup CPU quota 반영 테스트
+        A 1.5 CPU quota rounds up to 2 usable CPUs.
+        """
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+
+        assert server._cgroup_cpu_limit(str(cpu_max)) == 2
+
+        cpu_max.write_text("max 100000\n")
+        assert server._cgroup_cpu_limit(str(cpu_max)) is None
+        assert server._cgroup_cpu_limit(str(tmp_path / "missing")) is None
+
+    def test_workers_default_to_cpus(self, monkeypatch):
+        """
+        WEB_WORKERS=0이면 CPU 수만큼 워커 사용 테스트
+        """
+        monkeypatch.setattr(server, "available_cpus", lambda: 8)
+        monkeypatch.setattr(settings, "WEB_WORKERS", 0)
+        assert server.worker_count() == 8
+
+        monkeypatch.setattr(settings, "WEB_WORKERS", 3)
+        assert server.worker_count() == 3
+
+    def test_hashing_pool_split_between_workers(self, monkeypatch):
+        """
+        워커별 bcrypt 풀 분배 테스트
+        """
+        monkeypatch.setattr(server, "available_cpus", lambda: 8)
+        monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 0)
+
+        assert server.hashing_workers_per_server_worker(4) == 2
+        assert server.hashing_workers_per_server_worker(16) == 1
+
+        monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 3)
+        assert server.hashing_workers_per_server_worker(4) == 3
+
+    def test_server_config(self, monkeypatch):
+        """
+        실행 설정 테스트
+        """
+        monkeypatch.setattr(settings, "WEB_WORKERS", 2)
+        monkeypatch.setattr(settings, "API_PORT", 9000)
+
+        config = server.server_config()
+
+        assert config["bind"] == "0.0.0.0:9000"
+        assert config["workers"] == 2
+        assert config["max_requests"] == settings.WEB_MAX_REQUESTS
+
+    def test_post_fork_sizes_hashing_pool(self, monkeypatch):
+        """
+        gunicorn post_fork에서 워커별 bcrypt 풀 크기 적용 테스트
+        The preloaded hasher was already built with PASSWORD_HASH_WORKERS=0.
+        """
+        monkeypatch.setattr(server, "available_cpus", lambda: 8)
+        monkeypatch.setattr(settings, "WEB_WORKERS", 4)
+        monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 0)
+        monkeypatch.setattr(password_hasher, "max_workers", 8)
+
+        config = _load_gunicorn_config()
+        config.post_fork(server=None, worker=None)
+
+        assert config.workers == 4
+        assert password_hasher.max_workers == 2
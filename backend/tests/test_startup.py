@@ -0,0 +1,80 @@
+"""
+Startup import cost tests
+시작 시 무거운 의존성 로딩 여부 테스트
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.lazy import MissingModule, is_loaded, lazy_import
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def run_python(code: str) -> str:
+    """Run code in a fresh interpreter from the backend directory"""
+    env = {**os.environ, "DATABASE_URL": "sqlite://"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+class TestStartupImports:
+    """시작 시 import 테스트"""
+
+    def test_app_does_not_import_heavy_sdks(self):
+        """
+        무거운 AI SDK 미로딩 테스트
+        Importing app.main must not import langchain, openai, pinecone, etc.
+        """
+        loaded = json.loads(
+            run_python(
+                "import json, sys, app.main\n"
+                "from app.core.lazy import HEAVY_MODULES\n"
+                "print(json.dumps(sorted(m for m in sys.modules "
+                "if m.split('.')[0] in HEAVY_MODULES)))"
+            )
+        )
+
+        assert loaded == []
+
+    def test_lazy_import_defers_execution(self):
+        """
+        지연 로딩 테스트
+        A lazily imported module runs only when an attribute is used.
+        """
+        output = json.loads(
+            run_python(
+                "import json\n"
+                "from app.core.lazy import is_loaded, lazy_import\n"
+                "mod = lazy_import('wave')\n"
+                "before = is_loaded('wave')\n"
+                "mod.open\n"
+                "print(json.dumps([before, is_loaded('wave')]))"
+            )
+        )
+
+        assert output == [False, True]
+
+    def test_missing_dependency_fails_on_use(self):
+        """
+        미설치 의존성 처리 테스트
+        Missing optional packages only fail when actually used.
+        """
+        module = lazy_import("eduguard_missing_sdk")
+
+        assert isinstance(module, MissingModule)
+        assert not is_loaded("eduguard_missing_sdk")
+        with pytest.raises(ModuleNotFoundError, match="eduguard_missing_sdk"):
+            module.Client
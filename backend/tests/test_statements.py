@@ -0,0 +1,68 @@
+"""
+Prebuilt statement tests
+미리 생성한 조회 쿼리 및 asyncpg 문장 캐시 설정 테스트
+"""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import build_engine_kwargs
+from app.models.statements import LINK_BY_PAIR, USER_BY_EMAIL, USER_BY_ID, USER_ID_BY_EMAIL
+from app.models.user import ParentChildLink, User
+
+
+class TestPrebuiltStatements:
+    """바인드 파라미터 쿼리 테스트"""
+
+    def test_lookups_bind_values_per_execution(
+        self, db_session: Session, parent_user: User, child_user: User
+    ):
+        """
+        같은 문장 객체를 값만 바꿔 재사용하는지 테스트
+        """
+        for user in (parent_user, child_user):
+            found = db_session.execute(USER_BY_ID, {"user_id": user.id}).scalar_one()
+            assert found.id == user.id
+        assert db_session.scalar(USER_ID_BY_EMAIL, {"email": child_user.email}) == child_user.id
+        assert db_session.scalar(USER_ID_BY_EMAIL, {"email": "nobody@example.com"}) is None
+
+    def test_email_unique_regardless_of_case(self, db_session: Session, parent_user: User):
+        """
+        대소문자만 다른 이메일은 유니크 인덱스(lower(email))로 거절
+        """
+        db_session.add(User(email="Parent@Test.com", password_hash="x", role="parent"))
+
+        with pytest.raises(IntegrityError):
+            db_session.commit()
+        db_session.rollback()
+
+        params = {"email": "parent@test.com"}
+        assert db_session.execute(USER_BY_EMAIL, params).scalars().all() == [parent_user]
+
+    def test_link_by_pair(self, db_session: Session, parent_user: User, child_user: User):
+        """
+        부모-자녀 쌍으로 연동 조회
+        """
+        db_session.add(ParentChildLink(parent_id=parent_user.id, child_id=child_user.id))
+        db_session.commit()
+
+        params = {"parent_id": parent_user.id, "child_id": child_user.id}
+        assert db_session.scalar(LINK_BY_PAIR, params) is not None
+        params = {"parent_id": child_user.id, "child_id": parent_user.id}
+        assert db_session.scalar(LINK_BY_PAIR, params) is None
+
+
+class TestStatementCacheConfig:
+    """asyncpg 준비된 문장 캐시 설정 테스트"""
+
+    def test_asyncpg_statement_cache_size(self):
+        """
+        asyncpg 엔진에만 prepared_statement_cache_size 전달
+        """
+        kwargs = build_engine_kwargs("postgresql+asyncpg://user@localhost/db", is_async=True)
+        assert kwargs["connect_args"] == {
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE
+        }
+        assert "connect_args" not in build_engine_kwargs("postgresql://user@localhost/db")
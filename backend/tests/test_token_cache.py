@@ -0,0 +1,83 @@
+"""
+Verified token cache tests
+JWT 검증 캐시 단위 테스트
+"""
+
+from datetime import timedelta
+
+from app.utils.security import create_access_token
+from app.utils.token_cache import TokenCache
+
+
+class FakeClock:
+    """Manually advanced epoch clock"""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_repeated_decode_hits_cache():
+    """
+    동일 토큰 반복 디코딩 시 캐시 적중 테스트
+    Second decode of the same token should be a cache hit.
+    """
+    cache = TokenCache(max_size=10, ttl_seconds=60)
+    token = create_access_token({"sub": "1"})
+
+    first = cache.decode(token)
+    second = cache.decode(token)
+
+    assert first == second
+    assert second["sub"] == "1"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_invalid_token_not_cached():
+    """
+    유효하지 않은 토큰은 캐싱하지 않음 테스트
+    Invalid tokens should return None and never be stored.
+    """
+    cache = TokenCache(max_size=10, ttl_seconds=60)
+
+    assert cache.decode("invalid_token_12345") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_entry_expires_at_token_exp():
+    """
+    토큰 만료 시각 이후 캐시 만료 테스트
+    Entries must not outlive the token's exp claim, even with a long TTL.
+    """
+    token = create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=30))
+    cache = TokenCache(max_size=10, ttl_seconds=3600)
+    payload = cache.decode(token)
+
+    clock = FakeClock(payload["exp"] - 1)
+    cache._clock = clock
+    assert cache.get(token) is not None
+
+    clock.now = payload["exp"]
+    assert cache.get(token) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction():
+    """
+    최대 크기 초과 시 LRU 제거 테스트
+    The least recently used entry is evicted when the cache is full.
+    """
+    cache = TokenCache(max_size=2, ttl_seconds=60)
+    tokens = [create_access_token({"sub": str(i)}) for i in range(3)]
+
+    cache.decode(tokens[0])
+    cache.decode(tokens[1])
+    cache.get(tokens[0])  # tokens[0] becomes most recently used
+    cache.decode(tokens[2])
+
+    assert cache.get(tokens[0]) is not None
+    assert cache.get(tokens[1]) is None
+    assert cache.stats()["size"] == 2
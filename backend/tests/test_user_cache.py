@@ -0,0 +1,128 @@
+"""
+User identity cache tests
+사용자 캐시 및 쓰기 시 무효화 테스트
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.cache import InMemoryCacheBackend
+from app.core.config import settings
+from app.models.statements import USER_BY_ID
+from app.models.user import User, ParentChildLink
+from app.services.user_cache import UserCache, UserSnapshot, user_cache
+
+from .conftest import TestAsyncSessionLocal
+
+
+class SlowBackend(InMemoryCacheBackend):
+    """Shared backend whose deletes take a network round trip"""
+
+    async def delete_many(self, keys):
+        await asyncio.sleep(0.05)
+        await super().delete_many(keys)
+
+
+def test_me_served_from_cache(
+    client: TestClient, parent_user: User, auth_headers: dict
+):
+    """
+    반복 /me 호출 시 DB 조회 1회 테스트
+    Repeated /me calls should load the user from the database only once.
+    """
+    for _ in range(3):
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 200
+
+    assert user_cache.stats()["db_loads"] == 1
+
+
+def test_user_update_invalidates_cache(
+    client: TestClient, db_session: Session, parent_user: User, auth_headers: dict
+):
+    """
+    사용자 정보 변경 시 캐시 무효화 테스트
+    Committing a change to the User row should drop its cached snapshot.
+    """
+    client.get("/api/v1/auth/me", headers=auth_headers)
+
+    parent_user.email = "renamed@test.com"
+    db_session.commit()
+
+    response = client.get("/api/v1/auth/me", headers=auth_headers)
+    assert response.json()["email"] == "renamed@test.com"
+    assert user_cache.stats()["db_loads"] == 2
+
+
+def test_link_change_invalidates_cache(
+    client: TestClient,
+    db_session: Session,
+    parent_user: User,
+    child_user: User,
+    auth_headers: dict,
+):
+    """
+    자녀 연동 변경 시 부모/자녀 캐시 무효화 테스트
+    Creating a ParentChildLink should invalidate both linked users.
+    """
+    client.get("/api/v1/auth/me", headers=auth_headers)
+    assert user_cache.local.get(parent_user.id) is not None
+
+    db_session.add(ParentChildLink(parent_id=parent_user.id, child_id=child_user.id))
+    db_session.commit()
+
+    assert user_cache.local.get(parent_user.id) is None
+
+
+def test_cache_disabled_always_hits_db(
+    client: TestClient, parent_user: User, auth_headers: dict, monkeypatch
+):
+    """
+    캐시 비활성화 시 항상 DB 조회 테스트
+    With USER_CACHE_ENABLED=False the cache must not be used at all.
+    """
+    monkeypatch.setattr(settings, "USER_CACHE_ENABLED", False)
+
+    for _ in range(2):
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 200
+
+    assert user_cache.stats()["db_loads"] == 0
+    assert user_cache.stats()["size"] == 0
+
+
+def test_shared_backend_fills_local_tier(parent_user: User):
+    """
+    공유 백엔드 적중 시 로컬 캐시 채움 테스트
+    A snapshot found only in the shared backend is copied into the local LRU.
+    """
+    cache = UserCache()
+    snapshot = UserSnapshot.from_user(parent_user)
+
+    async def scenario():
+        await cache.set(snapshot)
+        cache.local.clear()
+        return await cache.get(parent_user.id)
+
+    assert asyncio.run(scenario()) == snapshot
+    assert cache.local.get(parent_user.id) == snapshot
+
+
+def test_async_commit_waits_for_shared_invalidation(parent_user: User, monkeypatch):
+    """
+    비동기 커밋 완료 시 공유 캐시까지 무효화되었는지 테스트
+    The shared-tier delete is awaited by commit, not left running in the background.
+    """
+    monkeypatch.setattr(user_cache, "backend", SlowBackend())
+
+    async def scenario():
+        await user_cache.set(UserSnapshot.from_user(parent_user))
+        async with TestAsyncSessionLocal() as db:
+            user = (await db.execute(USER_BY_ID, {"user_id": parent_user.id})).scalar_one()
+            user.email = "renamed@test.com"
+            await db.commit()
+        return await user_cache.backend.get(f"user:{parent_user.id}")
+
+    assert asyncio.run(scenario()) is None